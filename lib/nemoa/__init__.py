@@ -20,13 +20,11 @@ __maintainer__  = 'Patrick Michl'
 __credits__     = ['Willi Jäger', 'Rainer Koenig', 'Marcus Oswald',
                    'Alexandra Poos', 'Anna Dieckmann', 'Tobias Bauer']
 
-import nemoa.common
-import nemoa.dataset
-import nemoa.model
-import nemoa.network
-import nemoa.session
-import nemoa.system
-import nemoa.workspace
+import nemoa.common.module
+
+__getattr__, __dir__ = nemoa.common.module.lazy(__name__, [
+    'benchmarks', 'common', 'dataset', 'model', 'network', 'session',
+    'system', 'workspace' ])
 
 def about(*args, **kwargs):
     """Get meta information about current instance."""
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import nemoa.common.module
+
+__getattr__, __dir__ = nemoa.common.module.lazy(__name__, [ 'base' ])
+
+def run(*args, **kwargs):
+    """Run benchmark suite."""
+    return nemoa.benchmarks.base.run(*args, **kwargs)
+
+def save(*args, **kwargs):
+    """Export benchmark results to JSON file."""
+    return nemoa.benchmarks.base.save(*args, **kwargs)
+
+def load(*args, **kwargs):
+    """Import benchmark results from JSON file."""
+    return nemoa.benchmarks.base.load(*args, **kwargs)
+
+def compare(*args, **kwargs):
+    """Compare benchmark results."""
+    return nemoa.benchmarks.base.compare(*args, **kwargs)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import nemoa
+
+class TestSuite(nemoa.common.unittest.TestSuite):
+
+    def test_benchmarks_run(self):
+        import os
+        import tempfile
+        with self.subTest(cmd = "nemoa.benchmarks.run()"):
+            results = nemoa.benchmarks.run(samples = 100, updates = 10,
+                repeat = 1, systems = ('grbm', 'ann'),
+                relations = ('correlation', ))
+            test = results['import']['package']['time'] > 0. \
+                and results['training']['ann']['epochs'] == 10 \
+                and results['evaluation']['correlation']['time'] > 0. \
+                and results['io']['model_load_npz']['time'] > 0.
+            self.assertTrue(test)
+        with self.subTest(cmd = "nemoa.benchmarks.compare()"):
+            path = os.path.join(tempfile.mkdtemp(), 'benchmark.json')
+            nemoa.benchmarks.save(results, path)
+            speedup = nemoa.benchmarks.compare(
+                nemoa.benchmarks.load(path), results)
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+            test = speedup['training']['grbm'] == 1.
+            self.assertTrue(test)
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of import, training, evaluation and file input and output.
+
+The benchmarks use synthetic datasets, which are generated with
+dataset.builder.plain.Rules and a fixed random seed, and the system
+configurations and optimization schedules of the current workspace.
+The results are stored in JSON files, such that they can be compared
+across versions.
+
+Example:
+    results = nemoa.benchmarks.run(samples = 10000)
+    nemoa.benchmarks.save(results, 'benchmark.json')
+    nemoa.benchmarks.compare(nemoa.benchmarks.load('previous.json'),
+        results)
+
+"""
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import nemoa
+import time
+
+def run(samples = 1000, inputs = 6, hidden = 4, updates = 1000,
+    repeat = 3, seed = 0, systems = ('rbm', 'grbm', 'ann', 'dbn'),
+    relations = ('correlation', 'weightsumproduct', 'induction',
+    'coinduction')):
+    """Run benchmark suite.
+
+    Args:
+        samples (int, optional): number of samples of the synthetic
+            datasets
+        inputs (int, optional): number of input columns of the
+            synthetic datasets. The number of output columns is half
+            the number of input columns.
+        hidden (int, optional): number of hidden units per layer
+        updates (int, optional): number of updates for the training
+            of single systems. Deep belief networks are trained with
+            the updates given by their schedules.
+        repeat (int, optional): number of repetitions of each
+            measurement, of which the fastest is reported
+        seed (int, optional): seed of the random number generator
+        systems (tuple, optional): names of systems, which are trained
+        relations (tuple, optional): names of relation evaluations
+
+    Returns:
+        Dictionary with the keys 'about', 'config', 'import',
+        'training', 'evaluation' and 'io'.
+
+    """
+
+    import numpy
+    import platform
+
+    config = { 'samples': samples, 'inputs': inputs, 'hidden': hidden,
+        'updates': updates, 'repeat': repeat, 'seed': seed,
+        'systems': list(systems), 'relations': list(relations) }
+
+    results = {
+        'about': {
+            'nemoa': nemoa.__version__,
+            'numpy': numpy.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S') },
+        'config': config,
+        'import': {},
+        'training': {},
+        'evaluation': {},
+        'io': {} }
+
+    # import package in new interpreters
+    results['import'] = _get_import(repeat)
+
+    # train systems
+    for name in systems:
+        results['training'][name] = _get_training(name, config)
+
+    # evaluate relations of trained artificial neuronal network
+    numpy.random.seed(seed)
+    model = _get_model('ann', config)
+    model.optimize(updates = updates, tracker_eval_enable = False,
+        control = None)
+    for name in relations:
+        results['evaluation'][name] = _get_timing(
+            lambda: model.evaluate('system', 'relations', name), repeat)
+
+    # export and import of datasets and models
+    results['io'] = _get_io(model, repeat)
+
+    return results
+
+def save(results, path):
+    """Export benchmark results to JSON file.
+
+    Args:
+        results (dict): benchmark results
+        path (str): path of JSON file
+
+    """
+
+    import json
+
+    with open(path, 'w') as fh:
+        json.dump(results, fh, indent = 2, sort_keys = True)
+
+    return True
+
+def load(path):
+    """Import benchmark results from JSON file.
+
+    Args:
+        path (str): path of JSON file
+
+    """
+
+    import json
+
+    with open(path, 'r') as fh: return json.load(fh)
+
+def compare(reference, results):
+    """Compare benchmark results.
+
+    Args:
+        reference (dict): benchmark results, which are compared to
+        results (dict): benchmark results
+
+    Returns:
+        Dictionary with the sections and names of the measurements as
+        keys and the speedup of results over reference as values.
+        Speedups greater than 1 denote faster results.
+
+    """
+
+    speedup = {}
+    for section in ['import', 'training', 'evaluation', 'io']:
+        speedup[section] = {}
+        for name, value in results.get(section, {}).items():
+            ref = reference.get(section, {}).get(name, None)
+            if not ref or not ref.get('time') or not value.get('time'):
+                continue
+            speedup[section][name] = ref['time'] / value['time']
+
+    return speedup
+
+def _get_import(repeat):
+    """Measure import of package in new interpreters.
+
+    Returns:
+        Dictionary with the names of the measurements as keys and
+        timings as values. The timings do not include the startup of
+        the interpreter.
+
+    """
+
+    import os
+    import subprocess
+    import sys
+
+    script = ("import time\n"
+        "start = time.perf_counter()\n"
+        "import nemoa\n"
+        "%s\n"
+        "print(time.perf_counter() - start)\n")
+    env = dict(os.environ, PYTHONPATH = os.path.dirname(
+        os.path.dirname(nemoa.__file__)))
+
+    results = {}
+    for name, cmd in [('package', 'pass'),
+        ('session', "nemoa.get('workspace')")]:
+        times = [float(subprocess.check_output([sys.executable, '-c',
+            script % cmd], env = env)) for i in range(repeat)]
+        results[name] = { 'time': min(times),
+            'mean': sum(times) / len(times) }
+
+    return results
+
+def _get_dataset(config, binary = False):
+    """Create synthetic dataset.
+
+    Args:
+        config (dict): benchmark configuration
+        binary (bool, optional): create binary instead of gaussian
+            distributed data
+
+    """
+
+    # column names have fixed width, such that no column name is
+    # contained in another column name of the manipulation rules
+    width = len(str(config['inputs']))
+    inputs = ['i%0*i' % (width, i + 1) for i in range(config['inputs'])]
+    outputs = ['o%0*i' % (width, i + 1)
+        for i in range(config['inputs'] // 2)]
+    pairs = [(col, inputs[2 * i], inputs[2 * i + 1])
+        for i, col in enumerate(outputs)]
+
+    if binary: return nemoa.dataset.create('rules', name = 'binary',
+        columns = inputs + outputs, initialize = 'bernoulli', abin = .5,
+        rules = [(col, '%s * %s' % (a, b)) for col, a, b in pairs],
+        samples = config['samples'])
+
+    return nemoa.dataset.create('rules', name = 'gauss',
+        columns = inputs + outputs, initialize = 'gauss + bernoulli',
+        sdev = .1, abin = .5, normalize = 'gauss',
+        rules = [(col, '%s + %s' % (a, b)) for col, a, b in pairs],
+        samples = config['samples'])
+
+def _get_model(system, config):
+    """Create model for benchmark of system.
+
+    Args:
+        system (str): name of system
+        config (dict): benchmark configuration
+
+    """
+
+    dataset = _get_dataset(config, binary = system == 'rbm')
+    columns = dataset.get('columns')
+    hidden = ['h%i' % (i + 1) for i in range(config['hidden'])]
+
+    if system in ['rbm', 'grbm']:
+        network = nemoa.network.create('factor', name = 'factor',
+            visible_nodes = columns, hidden_nodes = hidden,
+            visible_type = 'sigmoid' if system == 'rbm' else 'gauss',
+            hidden_type = 'sigmoid')
+    else:
+        inputs = [col for col in columns if col.startswith('i')]
+        outputs = [col for col in columns if col.startswith('o')]
+        shape = [config['hidden']] if system == 'ann' \
+            else [config['hidden']] * 3
+        network = nemoa.network.create('multilayer', name = 'multilayer',
+            inputs = inputs, outputs = outputs, shape = shape)
+
+    return nemoa.model.create(dataset = dataset, network = network,
+        system = system)
+
+def _get_training(system, config):
+    """Measure training throughput of system.
+
+    Returns:
+        Dictionary with the fastest wall time of the training in
+        seconds ('time'), the number of epochs ('epochs') and the
+        throughput in epochs per second ('epochs_per_sec'). For
+        meta algorithms, like deep belief network optimization, which
+        train multiple systems, the number of epochs is not given.
+
+    """
+
+    import nemoa.model.morphisms
+    import numpy
+
+    best = None
+    for i in range(config['repeat']):
+        numpy.random.seed(config['seed'])
+        model = _get_model(system, config)
+        optimizer = nemoa.model.morphisms.new(model)
+        kwargs = { 'tracker_eval_enable': False, 'control': None }
+        if system != 'dbn': kwargs['updates'] = config['updates']
+        start = time.perf_counter()
+        optimizer.optimize(**kwargs)
+        runtime = time.perf_counter() - start
+        if best is None or runtime < best: best = runtime
+
+    epochs = optimizer.get('epoch') if system != 'dbn' else None
+
+    return { 'time': best, 'epochs': epochs,
+        'epochs_per_sec': epochs / best if epochs else None }
+
+def _get_io(model, repeat):
+    """Measure export and import of datasets and models.
+
+    Returns:
+        Dictionary with the names of the measurements as keys and
+        timings as values.
+
+    """
+
+    import os
+    import shutil
+    import tempfile
+
+    tmpdir = tempfile.mkdtemp()
+    csvfile = os.path.join(tmpdir, 'dataset.csv')
+    npzfile = os.path.join(tmpdir, 'model.npz')
+
+    try:
+        results = {
+            'dataset_save_csv': _get_timing(lambda: nemoa.dataset.save(
+                model.dataset, path = csvfile), repeat),
+            'dataset_load_csv': _get_timing(lambda: nemoa.dataset.load(
+                csvfile, cache = False), repeat),
+            'model_save_npz': _get_timing(lambda: nemoa.model.save(
+                model, path = npzfile), repeat),
+            'model_load_npz': _get_timing(lambda: nemoa.model.load(
+                npzfile), repeat) }
+    finally: shutil.rmtree(tmpdir)
+
+    return results
+
+def _get_timing(function, repeat):
+    """Measure wall time of function.
+
+    Returns:
+        Dictionary with the fastest ('time') and the mean ('mean') wall
+        time in seconds.
+
+    """
+
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return { 'time': min(times), 'mean': sum(times) / len(times) }
@@ -4,20 +4,10 @@ __author__  = 'Patrick Michl'
 __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
-import nemoa.common.classes
-import nemoa.common.compress
-import nemoa.common.decorators
-import nemoa.common.csvfile
-import nemoa.common.dict
-import nemoa.common.graph
-import nemoa.common.inifile
-import nemoa.common.math
-import nemoa.common.module
-import nemoa.common.ndarray
-import nemoa.common.ospath
-import nemoa.common.ostype
-import nemoa.common.plot
-import nemoa.common.recarray
-import nemoa.common.text
-import nemoa.common.type
-import nemoa.common.unittest
+from nemoa.common import module
+
+__getattr__, __dir__ = module.lazy(__name__, [
+    'classes', 'compress', 'csvfile', 'decorators', 'dict', 'graph', 'inifile',
+    'math', 'module', 'ndarray', 'npydir', 'npzfile', 'ospath', 'ostype',
+    'plot', 'recarray', 'sparse', 'stream', 'text', 'threads', 'trace',
+    'type', 'unittest' ])
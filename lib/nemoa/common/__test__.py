@@ -14,3 +14,164 @@ class TestSuite(nemoa.common.unittest.TestSuite):
             test = nemoa.common.dict.merge(d1, d2, d3)['a'] == 1
             test &= len(d3) == 1
             self.assertTrue(test)
+
+    def test_common_decorators(self):
+        class Base(metaclass = nemoa.common.classes.Registry):
+            @nemoa.common.decorators.algorithm(name = 'a', category = 'c')
+            def _get_a(self):
+                """Algorithm a."""
+                return 'a'
+        class Derived(Base):
+            @nemoa.common.decorators.algorithm(name = 'b', category = 'c')
+            def _get_b(self): return 'b'
+        with self.subTest(function = "getalgorithms"):
+            algorithms = nemoa.common.decorators.getalgorithms(Derived(),
+                category = 'c', attribute = 'about')
+            test = algorithms == {'a': 'Algorithm a', 'b': ''}
+            self.assertTrue(test)
+        with self.subTest(function = "getalgorithm"):
+            method = nemoa.common.decorators.getalgorithm(Derived(), 'b',
+                attribute = 'reference')
+            test = method() == 'b' and not 'b' in \
+                nemoa.common.decorators.getalgorithms(Base())
+            self.assertTrue(test)
+
+    def test_common_inifile(self):
+        import os
+        import shutil
+        import tempfile
+        import time
+        tmpdir = tempfile.mkdtemp()
+        path = os.path.join(tmpdir, 'test.ini')
+        structure = {'section': {'a': 'int', 'b': 'str'}}
+
+        # files, which have been modified within the last second are not
+        # cached, such that the modification time is set to the past
+        def write(text, mtime = None):
+            with open(path, 'w') as fh: fh.write(text)
+            if mtime is None: mtime = time.time() - 10.
+            os.utime(path, (mtime, mtime))
+
+        write('[section]\na = 1\nb = x\n')
+        with self.subTest(cache = 'memory'):
+            config = nemoa.common.inifile.load(path, structure)
+            config['section']['a'] = 2
+            test = nemoa.common.inifile.load(path, structure) \
+                == {'section': {'a': 1, 'b': 'x'}}
+            self.assertTrue(test)
+        with self.subTest(cache = 'modified file'):
+            write('[section]\na = 10\nb = x\n')
+            config = nemoa.common.inifile.load(path, structure)
+            test = config['section']['a'] == 10
+            self.assertTrue(test)
+        with self.subTest(cache = 'modified within timestamp resolution'):
+            mtime = float(int(time.time()))
+            write('[section]\na = 11\nb = x\n', mtime)
+            nemoa.common.inifile.load(path, structure)
+            write('[section]\na = 12\nb = x\n', mtime)
+            config = nemoa.common.inifile.load(path, structure)
+            write('[section]\na = 10\nb = x\n')
+            test = config['section']['a'] == 12
+            self.assertTrue(test)
+        with self.subTest(cache = 'disk'):
+            cachepath = os.path.join(tmpdir, 'cache')
+            nemoa.common.inifile.setcache(size = 0, path = cachepath)
+            nemoa.common.inifile.load(path, structure)
+            config = nemoa.common.inifile.load(path, structure)
+            nemoa.common.inifile.setcache()
+            test = len(os.listdir(cachepath)) == 1 \
+                and config['section']['a'] == 10
+            self.assertTrue(test)
+        shutil.rmtree(tmpdir)
+
+    def test_common_trace(self):
+        import json
+        import numpy
+        import os
+        import tempfile
+
+        @nemoa.common.trace.traced('outer')
+        def outer(array):
+            with nemoa.common.trace.span('inner', key = 'value'):
+                return array * 2
+
+        path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+        with self.subTest(state = 'disabled'):
+            test = not nemoa.common.trace.enabled() \
+                and outer(numpy.ones(3)).sum() == 6.
+            self.assertTrue(test)
+        with self.subTest(state = 'enabled'):
+            nemoa.set('mode', trace = path)
+            outer(numpy.ones((2, 3)))
+            nemoa.set('mode', trace = False)
+            with open(path, 'r') as fh: events = json.load(fh)
+            events = {e['name']: e for e in events['traceEvents']}
+            test = events['inner']['args'] == {'key': 'value'} \
+                and '(2, 3)' in events['outer']['args']['0'] \
+                and events['outer']['dur'] >= events['inner']['dur']
+            self.assertTrue(test)
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+    def test_common_ndarray(self):
+        import numpy
+        with self.subTest(cmd = "nemoa.common.ndarray.nbytes()"):
+            array = numpy.zeros(1000)
+            views = { 'a': array, 'b': array[:10],
+                'c': array.reshape(10, 100) }
+            nbytes = nemoa.common.ndarray.nbytes
+            test = nbytes(array) == 8000 \
+                and nbytes(views) < 8000 + nbytes(dict.fromkeys(views))
+            self.assertTrue(test)
+
+    def test_common_npzfile(self):
+        import numpy
+        import os
+        import tempfile
+        d = {'a': numpy.random.rand(100, 10), 'b': {(0, 1): 'c'}}
+        for codec, threads in [('zlib', 1), ('zlib', 4), ('bz2', None),
+            ('lzma', None), (None, None)]:
+            with self.subTest(codec = codec, threads = threads):
+                fd, path = tempfile.mkstemp(suffix = '.npz')
+                os.close(fd)
+                nemoa.common.npzfile.dump(d, path, codec = codec,
+                    threads = threads, blocksize = 1000)
+                load = nemoa.common.npzfile.load(path)
+                with numpy.load(path) as npz:
+                    files = sorted(npz.files)
+                    array = npz['a0']
+                os.remove(path)
+                test = numpy.array_equal(load['a'], d['a']) \
+                    and load['b'] == d['b'] \
+                    and files == ['a0', 'manifest'] \
+                    and numpy.array_equal(array, d['a'])
+                self.assertTrue(test)
+
+    def test_common_csvfile(self):
+        import numpy
+        import os
+        import tempfile
+        # r-table: the header omits the label of the row label column
+        lines = ['# name = test', 'x;y;z']
+        lines += ['r%i;%i;%s;%i' % (i, i, 'NA' if i % 7 == 0 else i, -i)
+            for i in range(100)]
+        fd, path = tempfile.mkstemp(suffix = '.csv')
+        with os.fdopen(fd, 'w') as fh: fh.write('\n'.join(lines) + '\n')
+        try:
+            for threads in [1, 4]:
+                with self.subTest(threads = threads):
+                    header, labels, rowlabels, data = \
+                        nemoa.common.csvfile.read(path, chunksize = 16,
+                        threads = threads)
+                    missing = numpy.isnan(data[:, 1])
+                    test = header.strip() == 'name = test' \
+                        and labels == ['x', 'y', 'z'] \
+                        and rowlabels == ['r%i' % i for i in range(100)] \
+                        and data.shape == (100, 3) \
+                        and numpy.array_equal(data[:, 0], numpy.arange(100)) \
+                        and numpy.array_equal(numpy.where(missing)[0],
+                        numpy.arange(0, 100, 7)) \
+                        and numpy.array_equal(data[~missing, 1],
+                        data[~missing, 0])
+                    self.assertTrue(test)
+        finally: os.remove(path)
@@ -6,6 +6,20 @@ __license__ = 'GPLv3'
 
 import nemoa
 
+class Registry(type):
+    """Metaclass for classes, which provide algorithms.
+
+    The methods, which are decorated by the algorithm decorator
+    nemoa.common.decorators.algorithm, are registered within the class
+    attribute '_registry' at class creation. Thereby algorithms can be
+    looked up by name and category without inspection of instances.
+
+    """
+
+    def __init__(cls, name, bases, attr):
+        super().__init__(name, bases, attr)
+        cls._registry = nemoa.common.decorators.register(cls)
+
 class Metadata:
     """Base class for classes with metadata.
 
@@ -8,6 +8,7 @@ import csv
 import nemoa
 import numpy
 import os
+import warnings
 
 def getheader(path):
     """Get header from CSV file.
@@ -215,96 +216,402 @@ def getlabelcolumn(path, delimiter = None):
 
     return False
 
-def load(path, delimiter = None, labels = None, usecols = None,
-    rowlabelcol = None):
-    """Import data from CSV file.
+def read(path, delimiter = None, usecols = None, rowlabelcol = None,
+    missing = ('', 'na', 'nan', 'null', '?'), chunksize = 10000,
+    threads = 1):
+    """Read header, labels and data from CSV file in a single pass.
+
+    The file is read once: the comment header, the column labels and
+    the delimiter are taken from the first lines, afterwards the data
+    is parsed in chunks of lines straight into a preallocated float64
+    matrix, which is grown if the estimated number of rows is
+    exceeded. Chunks may be parsed by multiple threads.
 
     Args:
         path (string): file path to CSV file.
         delimiter (string, optional): string containing CSV delimiter.
             If not given, the CSV delimiter is detected from CSV file.
-        labels (list, optional): list of strings containing CSV labels.
-            If not given, the CSV labels are detected from CSV file.
-        usecols (tuple of integers, optional): indices if columns
+        usecols (tuple of integers, optional): indices of columns
             which are imported from CSV file. If not given, all columns
             are used.
         rowlabelcol (int, optional): index of column that contains
             rowlabels. If not given, first column of strings is used.
+        missing (tuple of strings, optional): lower case strings, which
+            denote missing values. Missing values are imported as NaN.
+        chunksize (int, optional): number of lines per chunk.
+        threads (int, optional): number of threads used to parse
+            chunks. Default value 1 parses chunks in the reading thread.
 
     Returns:
-        Numpy record array containing data from CSV file or False if
-        data could not be imported.
+        Tuple (header, labels, rowlabels, data), where header is a
+        string containing the comment header, labels is a list of
+        strings containing the labels of the data columns, rowlabels
+        is a list of strings containing row labels and data is a
+        numpy ndarray of type float64, or False if data could not be
+        imported.
 
     """
 
+    import itertools
+
     # check file
     if not os.path.isfile(path):
         return nemoa.log('error', """could not get csv data:
             file '%s' does not exist.""" % path)
 
-    # get delimiter
-    if not delimiter:
-        delimiter = getdelim(path)
-    if not delimiter:
-        return nemoa.log('error', """could not get data from csv file:
-            unknown delimiter.""")
+    with open(path, 'r') as csvfile:
 
-    # get labels
-    if labels:
-        if not usecols: return nemoa.log('error',
-            "could not get data from csv file: usecols are not given.")
-    else:
-        labels = getlabels(path, delimiter = delimiter)
-        usecols = tuple(range(len(labels)))
-    if not labels: return nemoa.log('error',
-        "could not get data from csv file: unknown labels.")
+        # get header from comment lines and first non empty line
+        header = ''
+        first = None
+        for line in csvfile:
+            sline = line.lstrip(' ')
+            if sline in ['\n', '\r\n', '']: continue
+            if sline.startswith('#'):
+                header += sline[1:]
+                continue
+            first = line
+            break
+        if first == None:
+            return nemoa.log('error', """could not get csv data:
+                file '%s' is not valid.""" % path)
+
+        # read first chunk and get delimiter
+        chunk = _readchunk(csvfile, chunksize)
+        if not chunk:
+            return nemoa.log('error', """could not get csv data:
+                file '%s' contains no data.""" % path)
+        if not delimiter: delimiter = _sniffdelim([first] + chunk[:100])
+        if not delimiter:
+            return nemoa.log('error', """could not get data from csv file:
+                unknown delimiter.""")
+
+        # get column labels (r-tables omit the label of the first column)
+        labels = [col.strip('\"\'\n\r\t ')
+            for col in first.split(delimiter)]
+        fields = chunk[0].split(delimiter)
+        if len(fields) == len(labels) + 1: labels = ['label'] + labels
+        elif not len(fields) == len(labels):
+            return nemoa.log('error', """could not get column labels:
+                file '%s' is not valid.""" % path)
+
+        # get row label column id from first data line
+        if rowlabelcol == None:
+            for colid, val in enumerate(fields):
+                try: float(val.strip('\"\' \n'))
+                except ValueError:
+                    if val.strip('\"\' \n').lower() in missing: continue
+                    rowlabelcol = colid
+                    break
+        if usecols == None: usecols = tuple(range(len(labels)))
+        datacols = [col for col in usecols if not col == rowlabelcol]
+
+        # preallocate data matrix, using an estimated number of rows
+        size = os.path.getsize(path)
+        linesize = max(1., float(sum(map(len, chunk))) / len(chunk))
+        rows = int(1.1 * size / linesize) + 1
+        data = numpy.empty((rows, len(datacols)), dtype = '<f8')
+        rowlabels = []
+
+        # parse chunks into data matrix
+        args = (delimiter, datacols, rowlabelcol, missing)
+        chunks = itertools.chain([chunk],
+            iter(lambda: _readchunk(csvfile, chunksize), []))
+        if threads and threads > 1:
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+                blocks = _parallel(pool, _parsechunk, chunks, args,
+                    window = 2 * threads)
+                count = _writeblocks(blocks, data, rowlabels)
+        else:
+            blocks = (_parsechunk(c, *args) for c in chunks)
+            count = _writeblocks(blocks, data, rowlabels)
+
+    if count == None:
+        return nemoa.log('error', """could not import data from CSV
+            file: inconsistent number of columns.""")
 
-    # get row label coumn id
+    # shrink data matrix to number of rows
+    if count < data.shape[0]: data = data[:count].copy()
     if rowlabelcol == None:
-        rowlabelcol = getlabelcolumn(path, delimiter = delimiter)
+        rowlabels = [str(rowid + 1) for rowid in range(count)]
 
-    # get datatype
-    if rowlabelcol == None:
-        formats = ('<f8',) * len(usecols)
-    elif rowlabelcol not in usecols:
-        float_count = len(usecols)
-        usecols = (rowlabelcol, ) + usecols
-        labels = ('label',) + labels
-        formats = ('<U12',) + ('<f8',) * float_count
-    else:
-        float_count = len(usecols) - 1
-        rowlabelcollabel = labels[usecols.index(rowlabelcol)]
-        usecols = (rowlabelcol, ) + tuple(col for col in usecols
-            if not col == rowlabelcol)
-        labels = ('label',) + tuple(col for col in labels
-            if not col == rowlabelcollabel)
-        formats = ('<U12',) + ('<f8',) * float_count
-    dtype = {'names': labels, 'formats': formats}
-
-    # count rows to skip
-    skiprows = 1
-    with open(path, 'r') as csvfile:
-        for line in csvfile:
+    return header, [labels[col] for col in datacols], rowlabels, data
 
-            # check exclusion criteria
-            stripped_line = line.lstrip(' ')
-            if stripped_line.startswith('#'):
-                skiprows += 1
-                continue
-            if stripped_line in ['\n', '\r\n']:
-                skiprows += 1
+def follow(path, size = 100, delimiter = None, usecols = None,
+    rowlabelcol = None, missing = ('', 'na', 'nan', 'null', '?'),
+    poll = 1., timeout = None):
+    """Iterate minibatches of rows, which are appended to CSV file.
+
+    The file is followed like 'tail -f': lines which are appended to
+    the file are collected until a minibatch of the given size is
+    complete. Incomplete last lines are kept until they are completed
+    by their newline. Thereby only the current minibatch is held in
+    memory, such that append only CSV files of arbitrary size can be
+    used as data stream.
+
+    Args:
+        path (string): file path to CSV file.
+        size (int, optional): number of rows per minibatch.
+        delimiter (string, optional): string containing CSV delimiter.
+            If not given, the CSV delimiter is detected from CSV file.
+        usecols (tuple of integers, optional): indices of columns
+            which are imported from CSV file. If not given, all columns
+            are used.
+        rowlabelcol (int, optional): index of column that contains
+            rowlabels. If not given, first column of strings is used.
+        missing (tuple of strings, optional): lower case strings, which
+            denote missing values. Missing values are imported as NaN.
+        poll (float, optional): time in seconds to wait for new lines.
+        timeout (float or None, optional): time in seconds without new
+            lines, after which the iteration stops. Default value None
+            waits infinitely.
+
+    Yields:
+        Numpy record arrays with column 'label' and the data columns.
+
+    """
+
+    import time
+
+    if not os.path.isfile(path):
+        return nemoa.log('error', """could not follow csv file:
+            file '%s' does not exist.""" % path)
+
+    def lines(csvfile):
+        """Iterate complete lines and wait for appended lines."""
+        partial = ''
+        waited = 0.
+        while True:
+            line = csvfile.readline()
+            if line:
+                partial += line
+                if not partial.endswith('\n'): continue
+                line, partial, waited = partial, '', 0.
+                if line.strip(): yield line
                 continue
-            break
+            if timeout is not None and waited >= timeout: return
+            time.sleep(poll)
+            waited += poll
+
+    with open(path, 'r') as csvfile:
+        stream = lines(csvfile)
+
+        # get column labels from first non comment line
+        first = next((line for line in stream
+            if not line.lstrip(' ').startswith('#')), None)
+        if first is None: return
+
+        labels = None
+        args = None
+        chunk = []
+        for line in stream:
+            if line.lstrip(' ').startswith('#'): continue
+            chunk.append(line)
+
+            # get delimiter, labels and columns from first data line
+            if args is None:
+                if not delimiter: delimiter = _sniffdelim([first, line])
+                if not delimiter:
+                    return nemoa.log('error', """could not follow csv
+                        file: unknown delimiter.""")
+                labels = [col.strip('\"\'\n\r\t ')
+                    for col in first.split(delimiter)]
+                fields = line.split(delimiter)
+                if len(fields) == len(labels) + 1:
+                    labels = ['label'] + labels
+                if rowlabelcol == None:
+                    for colid, val in enumerate(fields):
+                        try: float(val.strip('\"\' \n'))
+                        except ValueError:
+                            if val.strip('\"\' \n').lower() in missing:
+                                continue
+                            rowlabelcol = colid
+                            break
+                if usecols == None: usecols = tuple(range(len(labels)))
+                datacols = [col for col in usecols
+                    if not col == rowlabelcol]
+                args = (delimiter, datacols, rowlabelcol, missing)
+
+            if len(chunk) < size: continue
+            block = _parsechunk(chunk, *args)
+            chunk = []
+            if block == None:
+                return nemoa.log('error', """could not follow csv
+                    file: inconsistent number of columns.""")
+            rowlabels, data = block
+            if rowlabelcol == None:
+                rowlabels = [str(rowid + 1) for rowid in range(size)]
+            yield torecarray([labels[col] for col in datacols],
+                rowlabels, data)
+
+def _readchunk(csvfile, chunksize):
+    """Read chunk of non empty, non comment lines from file."""
+
+    import itertools
+
+    chunk = []
+    while len(chunk) < chunksize:
+        lines = list(itertools.islice(csvfile, chunksize - len(chunk)))
+        if not lines: break
+        chunk += [line for line in lines if line.strip()
+            and not line.lstrip(' ').startswith('#')]
+
+    return chunk
+
+def _sniffdelim(lines, delimiters = [',', ';', '\t', ' ']):
+    """Detect delimiter from lines of CSV file."""
 
     try:
-        # 2do: use genfromtxt to allow missing values
-        data = numpy.loadtxt(path, skiprows = skiprows,
-            delimiter = delimiter, usecols = usecols, dtype = dtype)
-    except:
-        return nemoa.log('error', """could not import data from CSV
-            file.""")
+        return csv.Sniffer().sniff(''.join(lines), delimiters).delimiter
+    except csv.Error:
+        pass
+
+    # fallback: delimiter with constant number of occurrences
+    for delimiter in delimiters:
+        counts = set(line.count(delimiter) for line in lines[1:])
+        if len(counts) == 1 and counts.pop() > 0: return delimiter
+
+    return None
+
+def _parsechunk(chunk, delimiter, datacols, rowlabelcol, missing):
+    """Parse chunk of lines to row labels and float64 block."""
+
+    # fast conversion of complete rows with optional leading row labels
+    start = 0 if rowlabelcol == None else 1
+    if rowlabelcol in [None, 0] and datacols == list(range(start,
+        start + len(datacols))):
+        if start:
+            parts = [line.rstrip('\r\n').split(delimiter, 1)
+                for line in chunk]
+            rowlabels = [part[0].strip('\"\' ') for part in parts]
+            text = delimiter.join([part[-1] for part in parts])
+        else:
+            rowlabels = []
+            text = delimiter.join([line.rstrip('\r\n') for line in chunk])
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            block = numpy.fromstring(text, dtype = '<f8', sep = delimiter)
+        if block.size == len(chunk) * len(datacols):
+            return rowlabels, block.reshape(len(chunk), len(datacols))
+
+    rows = [line.rstrip('\r\n').split(delimiter) for line in chunk]
+    if rowlabelcol == None: rowlabels = []
+    else: rowlabels = [row[rowlabelcol].strip('\"\' ') for row in rows]
+
+    try:
+        fields = [[row[col] for col in datacols] for row in rows]
+    except IndexError:
+        return None
+
+    # fast conversion, which fails for missing values
+    try:
+        block = numpy.array(fields, dtype = '<f8')
+    except ValueError:
+        def tofloat(val):
+            val = val.strip('\"\' ')
+            if val.lower() in missing: return numpy.nan
+            return float(val)
+        try:
+            block = numpy.array([[tofloat(val) for val in row]
+                for row in fields], dtype = '<f8')
+        except ValueError:
+            return None
+
+    if not block.shape == (len(rows), len(datacols)): return None
+
+    return rowlabels, block
+
+def _parallel(pool, func, chunks, args, window = 2):
+    """Map function to chunks using a pool with bounded lookahead."""
+
+    import collections
+
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(pool.submit(func, chunk, *args))
+        if len(pending) >= window: yield pending.popleft().result()
+    while pending: yield pending.popleft().result()
+
+def _writeblocks(blocks, data, rowlabels):
+    """Write parsed blocks to data matrix and grow matrix if needed."""
+
+    count = 0
+    for block in blocks:
+        if block == None: return None
+        labels, values = block
+        if count + values.shape[0] > data.shape[0]:
+            rows = max(int(1.5 * data.shape[0]), count + values.shape[0])
+            data.resize((rows, data.shape[1]), refcheck = False)
+        data[count:count + values.shape[0]] = values
+        rowlabels += labels
+        count += values.shape[0]
+
+    return count
+
+def load(path, delimiter = None, labels = None, usecols = None,
+    rowlabelcol = None, **kwargs):
+    """Import data from CSV file.
+
+    Args:
+        path (string): file path to CSV file.
+        delimiter (string, optional): string containing CSV delimiter.
+            If not given, the CSV delimiter is detected from CSV file.
+        labels (list, optional): list of strings containing CSV labels.
+            If not given, the CSV labels are detected from CSV file.
+        usecols (tuple of integers, optional): indices if columns
+            which are imported from CSV file. If not given, all columns
+            are used.
+        rowlabelcol (int, optional): index of column that contains
+            rowlabels. If not given, first column of strings is used.
+        **kwargs: further arguments passed to read()
+
+    Returns:
+        Numpy record array containing data from CSV file or False if
+        data could not be imported.
+
+    """
+
+    # get labels
+    if labels and not usecols: return nemoa.log('error',
+        "could not get data from csv file: usecols are not given.")
+
+    retval = read(path, delimiter = delimiter, usecols = usecols,
+        rowlabelcol = rowlabelcol, **kwargs)
+    if not retval: return retval
+    header, collabels, rowlabels, data = retval
+    if labels:
+        collabels = [label for col, label in zip(usecols, labels)
+            if not col == rowlabelcol]
+
+    return torecarray(collabels, rowlabels, data)
+
+def torecarray(labels, rowlabels, data, dtype = '<f8'):
+    """Create numpy record array with column 'label' from data matrix.
+
+    Args:
+        labels (list of strings): column labels of data matrix
+        rowlabels (list of strings): row labels
+        data (ndarray): two dimensional numpy ndarray
+        dtype (str, optional): data type of data columns
+
+    Returns:
+        Numpy record array containing row labels in column 'label'
+        and a column of given data type for each column of the data
+        matrix.
+
+    """
+
+    width = max([len(label) for label in rowlabels] + [1])
+    fmt = numpy.dtype(dtype).str
+    dtype = [('label', '<U%i' % width)] \
+        + [(label, fmt) for label in labels]
+    rec = numpy.empty(data.shape[0], dtype = dtype).view(numpy.recarray)
+    rec['label'] = rowlabels
+    for colid, label in enumerate(labels):
+        rec[label] = data[:, colid]
 
-    return data
+    return rec
 
 def dump(path, data, header = None, labels = None, delimiter = ','):
     """ """
@@ -34,3 +34,120 @@ def algorithm(**attr):
         return wrapped
 
     return wrapper
+
+def register(cls):
+    """Create registry of algorithms provided by a class.
+
+    The algorithm methods of the class and its base classes are
+    identified by the attribute 'name', which is set by the algorithm
+    decorator. Methods of base classes are overridden by methods of
+    derived classes with the same method name, analog to the method
+    resolution.
+
+    Args:
+        cls: arbitrary class
+
+    Returns:
+        Dictionary with keys 'methods', which maps method names to the
+        attributes of the algorithms, and 'categories', which maps
+        categories to dictionaries with algorithm names as keys and
+        method names as values.
+
+    """
+
+    members = {}
+    for base in reversed(cls.__mro__): members.update(vars(base))
+
+    registry = { 'methods': {}, 'categories': {} }
+    for key in sorted(members.keys()):
+        attr = getattr(members[key], '__dict__', None)
+        if not isinstance(attr, dict) or not 'name' in attr: continue
+        attr = attr.copy()
+        attr['method'] = key
+        doc = members[key].__doc__
+        attr['about'] = doc.split('\n', 1)[0].strip(' .') \
+            if isinstance(doc, str) else ''
+        registry['methods'][key] = attr
+        names = registry['categories'].setdefault(
+            attr.get('category', None), {})
+        if not attr['name'] in names: names[attr['name']] = key
+
+    return registry
+
+def getalgorithms(instance, category = None, attribute = None,
+    prefix = '', grouping = False):
+    """Get algorithms of an instance from the registry of its class.
+
+    Args:
+        instance: instance of class with metaclass
+            nemoa.common.classes.Registry
+        category (optional): only return algorithms of given category
+        attribute (str, optional): reduce dictionary values to given
+            attribute of the algorithms. The attribute 'reference'
+            refers to the bound method of the instance.
+        prefix (str, optional): only return algorithms, which method
+            names start with given prefix
+        grouping (bool, optional): group algorithms by categories, if
+            no category is given.
+
+    Returns:
+        Dictionary with algorithm names as keys, or if grouping is True
+        dictionary with categories as keys and dictionaries with
+        algorithm names as keys as values.
+
+    """
+
+    registry = type(instance)._registry
+
+    if category is None: categories = registry['categories']
+    elif category in registry['categories']:
+        categories = { category: registry['categories'][category] }
+    else: categories = {}
+
+    grouped = {}
+    for ckey, names in categories.items():
+        group = grouped.setdefault(ckey, {})
+        for name, method in names.items():
+            if not method.startswith(prefix): continue
+            attr = registry['methods'][method]
+            if attribute == 'reference':
+                group[name] = getattr(instance, method)
+            elif attribute:
+                if attribute in attr: group[name] = attr[attribute]
+            else:
+                group[name] = attr.copy()
+                group[name]['reference'] = getattr(instance, method)
+
+    if grouping and category is None: return grouped
+    algorithms = {}
+    for group in grouped.values(): algorithms.update(group)
+    return algorithms
+
+def getalgorithm(instance, name, category = None, attribute = None,
+    prefix = ''):
+    """Get algorithm of an instance by name.
+
+    Returns:
+        Dictionary with attributes of the algorithm, the given
+        attribute of the algorithm or None if the algorithm is not
+        found.
+
+    """
+
+    registry = type(instance)._registry
+
+    if category is None:
+        categories = list(registry['categories'].values())
+    else: categories = [registry['categories'].get(category, {})]
+    for names in categories:
+        if not name in names: continue
+        method = names[name]
+        if not method.startswith(prefix): continue
+        if attribute == 'reference': return getattr(instance, method)
+        attr = registry['methods'][method]
+        if attribute: return attr.get(attribute, None)
+        attr = attr.copy()
+        attr['reference'] = getattr(instance, method)
+        return attr
+
+    return None
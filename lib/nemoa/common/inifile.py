@@ -4,12 +4,39 @@ __author__  = 'Patrick Michl'
 __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
+import collections
 import configparser
 import io
 import nemoa
 import os
 import re
 
+# cache of parsed configuration files
+_cache = collections.OrderedDict()
+_cachesize = 256
+_cachepath = None
+
+def setcache(size = 256, path = None):
+    """Configure cache of parsed configuration files.
+
+    Args:
+        size (int, optional): maximum number of parsed files, which are
+            kept in memory. The least recently used files are removed
+            first. A size of 0 disables the in-process cache.
+        path (str or None, optional): directory of the on-disk cache,
+            which persists parsed files between processes. Default
+            value None disables the on-disk cache.
+
+    """
+
+    global _cachesize, _cachepath
+
+    _cachesize = max(int(size), 0)
+    _cachepath = path
+    while len(_cache) > _cachesize: _cache.popitem(last = False)
+
+    return True
+
 def dumps(dictionary, nosection = True):
 
     if nosection:
@@ -23,7 +50,7 @@ def dumps(dictionary, nosection = True):
         for key, val in list(dictionary[section].items()):
             parser.set(section, key, val)
 
-    with io.BytesIO() as strbuffer:
+    with io.StringIO() as strbuffer:
         parser.write(strbuffer)
         string = strbuffer.getvalue()
 
@@ -32,7 +59,46 @@ def dumps(dictionary, nosection = True):
 
     return string
 
-def load(path, structure = None):
+def load(path, structure = None, cache = True):
+    """Load configuration dictionary from ini file.
+
+    Parsed files are cached by their path, modification time, size and
+    the given structure, such that unchanged files are not parsed again
+    when they are loaded repeatedly. Files, which have been modified
+    within the last second, are not cached. See setcache() for the
+    configuration of the cache.
+
+    Args:
+        path (str): path of ini file
+        structure (dict, optional): structure of sections and keys with
+            regular expressions as keys and types as values
+        cache (bool, optional): use cache of parsed files
+
+    Returns:
+        Dictionary with configuration, which may be modified by the
+        caller without affecting the cache.
+
+    """
+
+    import copy
+
+    key = _cachekey(path, structure) if cache else None
+    if key is None: return _load(path, structure)
+
+    config = _cache.get(key, None)
+    if config is not None: _cache.move_to_end(key)
+    else:
+        config = _cacheread(key)
+        if config is None:
+            config = _load(path, structure)
+            _cachewrite(key, config)
+        if _cachesize:
+            _cache[key] = config
+            if len(_cache) > _cachesize: _cache.popitem(last = False)
+
+    return copy.deepcopy(config)
+
+def _load(path, structure = None):
 
     # get config file parser
     parser = configparser.ConfigParser()
@@ -42,6 +108,66 @@ def load(path, structure = None):
     # parse sections and create config dictionary
     return parse(parser, structure)
 
+def _cachekey(path, structure = None):
+    """Get cache key of ini file or None if file is not cached.
+
+    Files, which do not exist or which have been modified within the
+    last second are not cached, since changes within the resolution of
+    the timestamps, which keep the size of the file, are not detected.
+
+    """
+
+    import time
+
+    def freeze(obj):
+        if isinstance(obj, dict): return tuple(sorted(
+            (repr(key), freeze(val)) for key, val in obj.items()))
+        return repr(obj)
+
+    try: stat = os.stat(path)
+    except (OSError, TypeError): return None
+    if time.time() - stat.st_mtime < 1.: return None
+
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+        freeze(structure))
+
+def _cacheread(key):
+    """Read parsed file from on-disk cache."""
+
+    import pickle
+
+    if not _cachepath: return None
+    try:
+        with open(_cachefile(key), 'rb') as fh: cached = pickle.load(fh)
+    except Exception: return None
+    if not isinstance(cached, tuple) or not cached[0] == key: return None
+
+    return cached[1]
+
+def _cachewrite(key, config):
+    """Write parsed file to on-disk cache."""
+
+    import pickle
+
+    if not _cachepath: return False
+    path = _cachefile(key)
+    tmpfile = '%s.%i.tmp' % (path, os.getpid())
+    try:
+        if not os.path.exists(_cachepath): os.makedirs(_cachepath)
+        with open(tmpfile, 'wb') as fh: pickle.dump((key, config), fh)
+        os.replace(tmpfile, path)
+    except OSError: return False
+
+    return True
+
+def _cachefile(key):
+    """Get path of file in on-disk cache."""
+
+    import hashlib
+
+    digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+    return os.path.join(_cachepath, digest + '.pickle')
+
 def loads(string, structure = None, nosection = False):
 
     # format string
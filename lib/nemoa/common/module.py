@@ -126,3 +126,44 @@ def get_func_kwargs(func, d: dict = None):
 
     kwargs = {key: d.get(key) for key in l if key in d}
     return kwargs
+
+def lazy(name, submodules):
+    """Get module level functions for lazy import of submodules.
+
+    The returned functions implement the module level attribute access
+    of PEP 562, such that the submodules of a package are imported at
+    their first access instead of the import of the package. Python
+    versions before 3.7 do not support module level __getattr__, in
+    which case the submodules are imported immediately.
+
+    Args:
+        name (str): name of package, usually given by __name__
+        submodules (list of str): names of submodules, which are
+            imported on demand
+
+    Returns:
+        Tuple with the module level functions __getattr__ and __dir__.
+
+    Example:
+        __getattr__, __dir__ = nemoa.common.module.lazy(__name__,
+            ['classes', 'exports'])
+
+    """
+
+    import importlib
+    import sys
+
+    if sys.version_info < (3, 7):
+        for submodule in submodules:
+            importlib.import_module(name + '.' + submodule)
+
+    def __getattr__(key):
+        if key in submodules:
+            return importlib.import_module(name + '.' + key)
+        raise AttributeError("module '%s' has no attribute '%s'"
+            % (name, key))
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[name])) | set(submodules))
+
+    return __getattr__, __dir__
@@ -109,3 +109,78 @@ def devnorm(data, norm = 'SD', axis = 0):
 
     return nemoa.log('error', """could not calculate normed deviation:
         unsupported deviation norm '%s'""" % norm)
+
+def shared(shape, dtype = '<f8'):
+    """Create numpy array in shared memory.
+
+    The array is backed by an anonymous shared memory mapping, which
+    is inherited by processes forked from the current process, such
+    that all processes read and write the same values without copying
+    or pickling.
+
+    Args:
+        shape (int or tuple of ints): shape of array
+        dtype (str or numpy dtype, optional): data type of array
+
+    Returns:
+        Numpy ndarray, which is initialized with zeros.
+
+    """
+
+    import mmap
+
+    dtype = numpy.dtype(dtype)
+    size = int(numpy.prod(shape)) * dtype.itemsize
+    buf = mmap.mmap(-1, max(size, 1))
+
+    return numpy.frombuffer(buf, dtype = dtype,
+        count = int(numpy.prod(shape))).reshape(shape)
+
+def nbytes(obj, memo = None):
+    """Get number of bytes of memory, which is held by an object.
+
+    Numpy arrays are counted by the size of their data buffers, where
+    buffers, which are shared by multiple views, are counted once and
+    file backed memory maps are not counted. Dictionaries, lists,
+    tuples, sets and sparse tables are traversed. Other objects are
+    counted by sys.getsizeof().
+
+    Args:
+        obj: arbitrary object
+        memo (set, optional): ids of objects, which have already been
+            counted. The set is updated, such that shared memory is
+            only counted once over multiple calls with the same set.
+
+    Returns:
+        Integer containing the number of bytes.
+
+    """
+
+    import sys
+
+    if memo is None: memo = set()
+
+    if isinstance(obj, numpy.ndarray):
+        root = obj
+        while isinstance(root, numpy.ndarray) and root.base is not None:
+            if isinstance(root, numpy.memmap): return 0
+            root = root.base
+        if isinstance(root, numpy.memmap) or id(root) in memo: return 0
+        memo.add(id(root))
+        if isinstance(root, numpy.ndarray): return root.nbytes
+        try: return memoryview(root).nbytes
+        except TypeError: return obj.nbytes
+
+    if id(obj) in memo: return 0
+    memo.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, val in obj.items():
+            size += nbytes(key, memo) + nbytes(val, memo)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for val in obj: size += nbytes(val, memo)
+    elif nemoa.common.sparse.issparse(obj):
+        size += nbytes(vars(obj), memo)
+
+    return size
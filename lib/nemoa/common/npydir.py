@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import nemoa
+import numpy
+import os
+
+def dump(d, path):
+    """Dump dictionary to numpy directory archive.
+
+    Numpy directory archives are directories, which contain an
+    uncompressed numpy file for each numpy array within the dictionary
+    and a JSON manifest 'manifest.json' for all other content. Nested
+    dictionaries, lists and tuples are preserved, objects which can not
+    be represented in JSON are stored as pickled strings within the
+    manifest. An existing archive is replaced after the new archive has
+    completely been written.
+
+    Args:
+        d (dict): dictionary containing numpy arrays
+        path (str): path of archive directory
+
+    Returns:
+        Bool which is True if and only if no error occured.
+
+    """
+
+    import json
+    import shutil
+
+    path = os.path.abspath(path)
+    tmpdir = path + '.tmp'
+    if os.path.exists(tmpdir): shutil.rmtree(tmpdir)
+    os.makedirs(tmpdir)
+
+    arrays = []
+    manifest = { 'format': 'npydir', 'version': 1,
+        'content': encode(d, arrays) }
+    for fid, array in enumerate(arrays):
+        numpy.save(os.path.join(tmpdir, 'a%i.npy' % fid), array)
+    with open(os.path.join(tmpdir, 'manifest.json'), 'w') as fh:
+        json.dump(manifest, fh, indent = 1)
+
+    # replace existing archive (mapped files are kept by the os)
+    if os.path.exists(path):
+        olddir = path + '.old'
+        if os.path.exists(olddir): shutil.rmtree(olddir)
+        os.rename(path, olddir)
+        os.rename(tmpdir, path)
+        shutil.rmtree(olddir, ignore_errors = True)
+    else:
+        os.rename(tmpdir, path)
+
+    return True
+
+def load(path, mmap_mode = 'c'):
+    """Load dictionary from numpy directory archive.
+
+    Args:
+        path (str): path of archive directory
+        mmap_mode (str or None, optional): memory map mode of numpy
+            arrays. The default value 'c' maps arrays copy on write,
+            such that arrays are only read from disk when accessed and
+            can be modified in memory. None reads all arrays.
+
+    Returns:
+        Dictionary with content of archive or None if the archive is
+        not valid.
+
+    """
+
+    import json
+
+    manifest = os.path.join(path, 'manifest.json')
+    if not os.path.isfile(manifest):
+        return nemoa.log('error', """could not load archive:
+            directory '%s' is not a valid archive.""" % path) or None
+
+    with open(manifest, 'r') as fh: content = json.load(fh)['content']
+
+    def loader(name):
+        filepath = os.path.join(path, name)
+        if mmap_mode is False: return filepath
+        return numpy.load(filepath, mmap_mode = mmap_mode)
+
+    return decode(content, loader)
+
+def manifest(path):
+    """Get content of archive without loading numpy arrays.
+
+    Returns:
+        Dictionary with content of archive, where numpy arrays are
+        replaced by the paths of the numpy files.
+
+    """
+
+    return load(path, mmap_mode = False)
+
+def encode(obj, arrays):
+    """Encode object to JSON compatible object and list of arrays.
+
+    Args:
+        obj: object, which may contain numpy arrays within nested
+            dictionaries, lists and tuples
+        arrays (list): list, to which the numpy arrays are appended.
+            The arrays are referenced by the names 'a<index>.npy'.
+
+    Returns:
+        JSON compatible object.
+
+    """
+
+    import base64
+    import pickle
+
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, numpy.ndarray) and not obj.dtype.hasobject:
+        arrays.append(obj)
+        return { '__npy__': 'a%i.npy' % (len(arrays) - 1) }
+    if isinstance(obj, numpy.generic) and obj.dtype.kind in 'biuf':
+        return { '__numpy__': [obj.dtype.str, obj.item()] }
+    if isinstance(obj, list):
+        return [encode(val, arrays) for val in obj]
+    if isinstance(obj, tuple):
+        return { '__tuple__': [encode(val, arrays) for val in obj] }
+    if isinstance(obj, dict):
+        if all(isinstance(key, str) and not key.startswith('__')
+            for key in obj.keys()):
+            return { key: encode(val, arrays) for key, val in obj.items() }
+        return { '__dict__': [[encode(key, arrays), encode(val, arrays)]
+            for key, val in obj.items()] }
+
+    string = base64.b64encode(pickle.dumps(obj)).decode('ascii')
+    return { '__pickle__': string }
+
+def decode(obj, loader):
+    """Decode JSON compatible object and load referenced arrays.
+
+    Args:
+        obj: JSON compatible object, as returned by encode()
+        loader (function): function, which returns the numpy array for
+            a given array name
+
+    """
+
+    import base64
+    import pickle
+
+    if isinstance(obj, list):
+        return [decode(val, loader) for val in obj]
+    if not isinstance(obj, dict): return obj
+
+    if '__npy__' in obj: return loader(obj['__npy__'])
+    if '__numpy__' in obj:
+        return numpy.dtype(obj['__numpy__'][0]).type(obj['__numpy__'][1])
+    if '__tuple__' in obj:
+        return tuple(decode(val, loader) for val in obj['__tuple__'])
+    if '__dict__' in obj:
+        return { decode(key, loader): decode(val, loader)
+            for key, val in obj['__dict__'] }
+    if '__pickle__' in obj:
+        return pickle.loads(base64.b64decode(obj['__pickle__']))
+
+    return { key: decode(val, loader) for key, val in obj.items() }
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import nemoa
+import numpy
+import os
+
+# zip compression methods of compression codecs
+methods = { None: 'ZIP_STORED', 'zlib': 'ZIP_DEFLATED',
+    'bz2': 'ZIP_BZIP2', 'lzma': 'ZIP_LZMA' }
+
+def dump(d, path, codec = 'zlib', level = 6, threads = None,
+    blocksize = 2 ** 24):
+    """Dump dictionary to compressed numpy zip archive.
+
+    The archive is a numpy zip archive, which contains a numpy file for
+    each numpy array within the dictionary and a numpy file
+    'manifest.npy' with the JSON manifest of all other content, analog
+    to numpy directory archives. The archive can therefore be read by
+    numpy.load(), without unpickling any content. The arrays are
+    written directly from memory in blocks, without copying or
+    pickling the dictionary. With the codec 'zlib' the blocks are
+    compressed by a pool of threads to raw deflate streams, which are
+    concatenated in order to the deflate stream of the zip file, such
+    that memory usage is bounded by the number of blocks in progress.
+
+    Args:
+        d (dict): dictionary containing numpy arrays
+        path (str): path of archive file
+        codec (str or None, optional): compression codec of zip files:
+            'zlib', 'bz2' or 'lzma'. None stores uncompressed numpy
+            files.
+        level (int, optional): compression level from 1 (fastest) to 9
+            (best compression). The level is ignored by 'lzma'.
+        threads (int or None, optional): number of compression threads
+            of the codec 'zlib'. Default value None uses the number of
+            cpu's. The codecs 'bz2' and 'lzma' are compressed by the
+            writing thread.
+        blocksize (int, optional): size of written blocks in bytes.
+
+    Returns:
+        Bool which is True if and only if no error occured.
+
+    """
+
+    import concurrent.futures
+    import json
+    import zipfile
+
+    if not codec in methods:
+        return nemoa.log('error', """could not dump archive:
+            unknown compression codec '%s'.""" % codec)
+
+    arrays = []
+    manifest = { 'format': 'npzfile', 'version': 2,
+        'content': nemoa.common.npydir.encode(d, arrays) }
+    arrays.append(numpy.array(json.dumps(manifest, indent = 1)))
+    names = ['a%i.npy' % fid for fid in range(len(arrays) - 1)] \
+        + ['manifest.npy']
+    threads = threads or os.cpu_count() or 1
+    parallel = codec == 'zlib' and threads > 1
+
+    tmpfile = path + '.tmp'
+    with zipfile.ZipFile(tmpfile, 'w', getattr(zipfile, methods[codec]),
+        allowZip64 = True, compresslevel = level) as zf:
+        with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+            for name, array in zip(names, arrays):
+
+                # the manifest is written by the zipfile module, which
+                # finally writes the central directory of all files
+                if parallel and not name == 'manifest.npy':
+                    _write_deflated(zf, name, _blocks(array, blocksize),
+                        pool, level, window = 2 * threads)
+                    continue
+
+                with zf.open(name, 'w', force_zip64 = True) as fh:
+                    for block in _blocks(array, blocksize):
+                        fh.write(block)
+
+    os.replace(tmpfile, path)
+
+    return True
+
+def load(path, key = None):
+    """Load dictionary from compressed numpy zip archive.
+
+    Args:
+        path (str): path of archive file
+        key (str or None, optional): key of the dictionary, which is
+            loaded. Default value None loads the whole dictionary.
+
+    Returns:
+        Dictionary with content of archive, content of given key or
+        None if the archive is not valid.
+
+    """
+
+    import json
+
+    if not isnpzfile(path):
+        return nemoa.log('error', """could not load archive:
+            file '%s' is not a valid archive.""" % path) or None
+
+    with numpy.load(path) as npz:
+        manifest = json.loads(npz['manifest'].item())
+        content = manifest['content']
+        if key is not None: content = content[key]
+
+        return nemoa.common.npydir.decode(content,
+            lambda name: npz[name[:-4]])
+
+def manifest(path):
+    """Get content of archive without loading numpy arrays.
+
+    Returns:
+        Dictionary with content of archive, where numpy arrays are
+        replaced by the names of the numpy files.
+
+    """
+
+    import json
+
+    if not isnpzfile(path):
+        return nemoa.log('error', """could not load archive:
+            file '%s' is not a valid archive.""" % path) or None
+
+    with numpy.load(path) as npz:
+        content = json.loads(npz['manifest'].item())['content']
+
+    return nemoa.common.npydir.decode(content, lambda name: name)
+
+def isnpzfile(path):
+    """Check if file is a compressed numpy zip archive."""
+
+    import zipfile
+
+    if not os.path.isfile(path) or not zipfile.is_zipfile(path):
+        return False
+    with zipfile.ZipFile(path, 'r') as zf:
+        return 'manifest.npy' in zf.namelist()
+
+def _blocks(array, blocksize):
+    """Iterate numpy file header and data of array in blocks."""
+
+    import io
+
+    array = numpy.require(array, requirements = 'C')
+    header = io.BytesIO()
+    info = numpy.lib.format.header_data_from_array_1_0(array)
+    try: numpy.lib.format.write_array_header_1_0(header, info)
+    except ValueError:
+        numpy.lib.format.write_array_header_2_0(header, info)
+
+    data = array.reshape(-1).view(numpy.uint8)
+    yield header.getvalue() + data[:blocksize].tobytes()
+    for start in range(blocksize, data.size, blocksize):
+        yield data[start:start + blocksize]
+
+def _write_deflated(zf, name, blocks, pool, level, window = 2):
+    """Write blocks to deflated zip file, which are compressed in pool.
+
+    Every block is compressed to a raw deflate stream, which is
+    terminated by a sync flush, such that the concatenated streams and
+    a final empty block are a single deflate stream. The local file
+    header is written with zip64 extra fields and updated with the CRC
+    and the sizes of the file, analog to the zipfile module.
+
+    """
+
+    import collections
+    import time
+    import zipfile
+    import zlib
+
+    zinfo = zipfile.ZipInfo(name, time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = zinfo.compress_size = zinfo.CRC = 0
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader(zip64 = True))
+
+    def deflate(block):
+        obj = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return obj.compress(block) + obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def write(data):
+        zf.fp.write(data)
+        zinfo.compress_size += len(data)
+
+    pending = collections.deque()
+    for block in blocks:
+        pending.append(pool.submit(deflate, block))
+        zinfo.CRC = zlib.crc32(block, zinfo.CRC)
+        zinfo.file_size += len(block)
+        if len(pending) >= window: write(pending.popleft().result())
+    while pending: write(pending.popleft().result())
+    write(zlib.compressobj(level, zlib.DEFLATED, -15).flush())
+
+    # update local file header and register file in central directory
+    zf.start_dir = zf.fp.tell()
+    zf.fp.seek(zinfo.header_offset)
+    zf.fp.write(zinfo.FileHeader(zip64 = True))
+    zf.fp.seek(zf.start_dir)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[name] = zinfo
+
+    return True
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import numpy
+
+class CSR:
+    """Compressed sparse row table.
+
+    Sparse counterpart of the dense record arrays, which are used as
+    dataset tables. The nonzero values are stored row by row within
+    the arrays 'data' and 'indices', where 'indptr' points to the
+    beginning of each row. Additionally the table holds the row labels
+    and the column names, such that row selection, column selection
+    and the matrix product with dense weight matrices only depend on
+    the number of nonzero entries.
+
+    Attributes:
+        data (ndarray): nonzero values of the table
+        indices (ndarray): column indices of the nonzero values
+        indptr (ndarray): row pointers to 'data' and 'indices'
+        labels (ndarray): row labels
+        names (tuple of str): column names
+
+    """
+
+    data    = None
+    indices = None
+    indptr  = None
+    labels  = None
+    names   = None
+
+    def __init__(self, data, indices, indptr, labels = None,
+        names = None):
+
+        self.data = numpy.asarray(data)
+        if not self.data.dtype.kind == 'f':
+            self.data = self.data.astype('<f8')
+        self.indices = numpy.asarray(indices, dtype = numpy.intp)
+        self.indptr = numpy.asarray(indptr, dtype = numpy.intp)
+
+        rows = self.indptr.size - 1
+        if labels is None: labels = [str(i) for i in range(rows)]
+        self.labels = numpy.asarray(labels, dtype = str)
+        if names is None:
+            cols = int(self.indices.max()) + 1 if self.indices.size else 0
+            names = tuple(str(i) for i in range(cols))
+        self.names = tuple(names)
+
+    @property
+    def shape(self):
+        return (self.indptr.size - 1, len(self.names))
+
+    @property
+    def size(self):
+        """Number of rows (analog to the size of record arrays)."""
+        return self.indptr.size - 1
+
+    @property
+    def nnz(self):
+        """Number of stored nonzero values."""
+        return self.data.size
+
+    def _rowids(self):
+        """Row index of each stored value."""
+        return numpy.repeat(numpy.arange(self.size),
+            numpy.diff(self.indptr))
+
+    def take(self, rows):
+        """Select rows by row indices.
+
+        Args:
+            rows (array of int): indices of rows, which may contain
+                repetitions, as used for stratified sampling
+
+        Returns:
+            New CSR table, which contains the selected rows.
+
+        """
+
+        rows = numpy.asarray(rows, dtype = numpy.intp).ravel()
+        start = self.indptr[rows]
+        count = self.indptr[rows + 1] - start
+        indptr = numpy.zeros(rows.size + 1, dtype = numpy.intp)
+        numpy.cumsum(count, out = indptr[1:])
+
+        # gather positions of stored values of selected rows
+        offset = numpy.repeat(start - indptr[:-1], count)
+        pos = numpy.arange(indptr[-1], dtype = numpy.intp) + offset
+
+        return CSR(self.data[pos], self.indices[pos], indptr,
+            labels = self.labels[rows], names = self.names)
+
+    def select(self, names):
+        """Select columns by column names.
+
+        Args:
+            names (list of str): column names, which may contain
+                duplicates. Duplicate columns are named by a counting
+                suffix, analog to the dataset tables.
+
+        Returns:
+            New CSR table, which contains the selected columns.
+
+        """
+
+        colid = {name: i for i, name in enumerate(self.names)}
+        select = [colid[name] for name in names]
+
+        # map old column indices to lists of new column indices
+        targets = {}
+        for new, old in enumerate(select):
+            targets.setdefault(old, []).append(new)
+        width = max([len(val) for val in targets.values()] + [0])
+        lookup = -numpy.ones((len(self.names), max(width, 1)),
+            dtype = numpy.intp)
+        for old, new in targets.items(): lookup[old, :len(new)] = new
+
+        # expand stored values to (possibly duplicated) new columns
+        mapped = lookup[self.indices]
+        keep = mapped >= 0
+        pos = numpy.nonzero(keep)[0]
+        rowids = self._rowids()[pos]
+        indices = mapped[keep]
+        order = numpy.lexsort((indices, rowids))
+        indptr = numpy.zeros(self.size + 1, dtype = numpy.intp)
+        numpy.cumsum(numpy.bincount(rowids, minlength = self.size),
+            out = indptr[1:])
+
+        counter = {}
+        unames = []
+        for name in names:
+            counter[name] = counter.get(name, 0) + 1
+            if counter[name] == 1: unames.append(name)
+            else: unames.append('%s.%i' % (name, counter[name]))
+
+        return CSR(self.data[pos][order], indices[order], indptr,
+            labels = self.labels, names = unames)
+
+    def mask(self, keep):
+        """Return copy which only contains given stored values.
+
+        Args:
+            keep (array of bool): mask over the stored values
+
+        """
+
+        keep = numpy.asarray(keep, dtype = bool)
+        indptr = numpy.zeros(self.size + 1, dtype = numpy.intp)
+        numpy.cumsum(numpy.bincount(self._rowids()[keep],
+            minlength = self.size), out = indptr[1:])
+
+        return CSR(self.data[keep], self.indices[keep], indptr,
+            labels = self.labels, names = self.names)
+
+    def dot(self, weights):
+        """Matrix product with dense matrix.
+
+        Args:
+            weights (ndarray): dense matrix of shape (columns, n)
+
+        Returns:
+            Dense ndarray of shape (rows, n). The computational cost is
+            proportional to the number of nonzero values times n.
+
+        """
+
+        weights = numpy.asarray(weights)
+        result = numpy.zeros((self.size, weights.shape[1]),
+            dtype = numpy.result_type(self.data, weights))
+        if not self.nnz: return result
+
+        product = self.data[:, numpy.newaxis] * weights[self.indices]
+        nonempty = numpy.diff(self.indptr) > 0
+        result[nonempty] = numpy.add.reduceat(product,
+            self.indptr[:-1][nonempty], axis = 0)
+
+        return result
+
+    def tdot(self, matrix):
+        """Matrix product of transposed table with dense matrix.
+
+        Args:
+            matrix (ndarray): dense matrix of shape (rows, n)
+
+        Returns:
+            Dense ndarray of shape (columns, n). The computational cost
+            is proportional to the number of nonzero values times n.
+
+        """
+
+        matrix = numpy.asarray(matrix)
+        result = numpy.zeros((self.shape[1], matrix.shape[1]),
+            dtype = numpy.result_type(self.data, matrix))
+        if not self.nnz: return result
+
+        numpy.add.at(result, self.indices,
+            self.data[:, numpy.newaxis] * matrix[self._rowids()])
+
+        return result
+
+    def toarray(self):
+        """Return dense ndarray."""
+
+        array = numpy.zeros(self.shape, dtype = self.data.dtype)
+        array[self._rowids(), self.indices] = self.data
+        return array
+
+    def torecarray(self):
+        """Return dense record array with column 'label'."""
+
+        dtype = [('label', self.labels.dtype)] \
+            + [(name, self.data.dtype.str) for name in self.names]
+        rec = numpy.recarray((self.size,), dtype = dtype)
+        rec['label'] = self.labels
+        array = self.toarray()
+        for colid, name in enumerate(self.names):
+            rec[name] = array[:, colid]
+        return rec
+
+def issparse(data):
+    """Check if given object is a sparse table."""
+    return isinstance(data, CSR)
+
+def fromarray(array, labels = None, names = None):
+    """Create sparse table from dense two dimensional ndarray."""
+
+    array = numpy.asarray(array)
+    if not array.dtype.kind == 'f': array = array.astype('<f8')
+    rowids, indices = numpy.nonzero(array)
+    indptr = numpy.zeros(array.shape[0] + 1, dtype = numpy.intp)
+    numpy.cumsum(numpy.bincount(rowids, minlength = array.shape[0]),
+        out = indptr[1:])
+    if names is None: names = tuple(str(i) for i in range(array.shape[1]))
+
+    return CSR(array[rowids, indices], indices, indptr,
+        labels = labels, names = names)
+
+def fromrecarray(rec):
+    """Create sparse table from record array with column 'label'."""
+
+    names = [name for name in rec.dtype.names if name != 'label']
+    dtype = numpy.result_type(*[rec.dtype[name] for name in names]) \
+        if names else '<f8'
+    array = numpy.zeros((rec.size, len(names)), dtype = dtype)
+    for colid, name in enumerate(names): array[:, colid] = rec[name]
+    labels = rec['label'] if 'label' in rec.dtype.names else None
+
+    return fromarray(array, labels = labels, names = names)
+
+def vstack(tables):
+    """Concatenate sparse tables with identical columns."""
+
+    tables = list(tables)
+    offsets = numpy.cumsum([0] + [t.nnz for t in tables[:-1]])
+    indptr = numpy.concatenate([numpy.zeros(1, dtype = numpy.intp)] +
+        [t.indptr[1:] + offset for t, offset in zip(tables, offsets)])
+
+    return CSR(numpy.concatenate([t.data for t in tables]),
+        numpy.concatenate([t.indices for t in tables]), indptr,
+        labels = numpy.concatenate([t.labels for t in tables]),
+        names = tables[0].names)
+
+def dot(data, weights):
+    """Matrix product of dense or sparse data with dense weights."""
+
+    if issparse(data): return data.dot(weights)
+    return numpy.dot(data, weights)
+
+def tdot(data, matrix):
+    """Matrix product of transposed dense or sparse data with matrix."""
+
+    if issparse(data): return data.tdot(matrix)
+    return numpy.dot(data.T, matrix)
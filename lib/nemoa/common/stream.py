@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import numpy
+
+class Moments:
+    """Streamed mean value and standard deviation of columns.
+
+    The statistics are updated by chunks of rows, such that arbitrary
+    large data can be processed within bounded memory. Chunks are
+    combined by the parallel algorithm of Chan et al., which is
+    numerically stable for large numbers of rows.
+
+    Attributes:
+        count (int): number of processed rows
+        mean (ndarray): mean values of columns
+        m2 (ndarray): sums of squared deviations from mean values
+
+    """
+
+    count = 0
+    mean  = None
+    m2    = None
+
+    def __init__(self, cols = None):
+        self.count = 0
+        if cols is None: return
+        self.mean = numpy.zeros(cols)
+        self.m2 = numpy.zeros(cols)
+
+    def update(self, data):
+        """Update statistics by chunk of rows.
+
+        Args:
+            data (ndarray): two dimensional array of shape
+                (rows, columns)
+
+        """
+
+        data = numpy.asarray(data, dtype = '<f8')
+        if data.ndim == 1: data = data.reshape(-1, 1)
+        rows = data.shape[0]
+        if not rows: return self
+
+        mean = data.mean(axis = 0)
+        m2 = ((data - mean) ** 2).sum(axis = 0)
+
+        if not self.count or self.mean is None:
+            self.count, self.mean, self.m2 = rows, mean, m2
+            return self
+
+        total = self.count + rows
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (float(rows) / total)
+        self.m2 = self.m2 + m2 \
+            + delta ** 2 * (float(self.count) * rows / total)
+        self.count = total
+
+        return self
+
+    @property
+    def var(self):
+        """Population variance of columns."""
+        if not self.count: return None
+        return self.m2 / self.count
+
+    @property
+    def sdev(self):
+        """Population standard deviation of columns."""
+        if not self.count: return None
+        return numpy.sqrt(self.m2 / self.count)
+
+class Quantiles:
+    """Streamed quantiles of columns within known bounds.
+
+    The quantiles are approximated by histograms with equally spaced
+    bins between the lower and upper bounds of the columns, as given
+    by a preceding pass over the data. The approximation error is
+    bounded by the bin width.
+
+    Attributes:
+        lower (ndarray): lower bounds of columns
+        upper (ndarray): upper bounds of columns
+        counts (ndarray): histogram of shape (columns, bins)
+
+    """
+
+    lower  = None
+    upper  = None
+    counts = None
+
+    def __init__(self, lower, upper, bins = 4096):
+        self.lower = numpy.asarray(lower, dtype = '<f8')
+        self.upper = numpy.asarray(upper, dtype = '<f8')
+        self.counts = numpy.zeros((self.lower.size, bins), dtype = int)
+
+    def update(self, data):
+        """Update histograms by chunk of rows."""
+
+        data = numpy.asarray(data, dtype = '<f8')
+        if data.ndim == 1: data = data.reshape(-1, 1)
+        bins = self.counts.shape[1]
+        width = numpy.where(self.upper > self.lower,
+            self.upper - self.lower, 1.)
+        binids = ((data - self.lower) / width * bins).astype(int)
+        numpy.clip(binids, 0, bins - 1, out = binids)
+        for colid in range(self.counts.shape[0]):
+            self.counts[colid] += numpy.bincount(binids[:, colid],
+                minlength = bins)
+
+        return self
+
+    def get(self, q):
+        """Get q-quantiles of columns.
+
+        Args:
+            q (float): quantile in interval [0, 1]
+
+        Returns:
+            ndarray with approximated q-quantiles of columns, which
+            are linear interpolated within the bins.
+
+        """
+
+        bins = self.counts.shape[1]
+        width = (self.upper - self.lower) / bins
+        cumsum = numpy.cumsum(self.counts, axis = 1)
+        quantiles = numpy.empty(self.counts.shape[0])
+        for colid in range(self.counts.shape[0]):
+            rank = q * cumsum[colid, -1]
+            binid = min(int(numpy.searchsorted(cumsum[colid], rank)),
+                bins - 1)
+            below = cumsum[colid, binid - 1] if binid else 0
+            inbin = self.counts[colid, binid]
+            frac = (rank - below) / inbin if inbin else 0.5
+            quantiles[colid] = self.lower[colid] \
+                + (binid + frac) * width[colid]
+
+        return quantiles
+
+class RunningQuantiles:
+    """Running estimation of quantiles of columns.
+
+    The quantiles are initialized by the empirical quantiles of the
+    first chunk of rows and afterwards adapted to subsequent chunks by
+    stochastic approximation, where the step size is scaled by the
+    running standard deviation of the columns. Thereby the estimation
+    follows slowly drifting distributions within constant memory.
+
+    Attributes:
+        q (float): quantile in interval [0, 1]
+        rate (float): adaption rate
+        value (ndarray): current estimations of the q-quantiles
+
+    """
+
+    q       = None
+    rate    = None
+    value   = None
+    moments = None
+
+    def __init__(self, q, rate = 0.1):
+        self.q = float(q)
+        self.rate = float(rate)
+        self.moments = Moments()
+
+    def update(self, data):
+        """Update estimations by chunk of rows."""
+
+        data = numpy.asarray(data, dtype = '<f8')
+        if data.ndim == 1: data = data.reshape(-1, 1)
+        if not data.shape[0]: return self
+        self.moments.update(data)
+
+        if self.value is None:
+            self.value = numpy.percentile(data, 100. * self.q, axis = 0)
+            return self
+
+        below = (data <= self.value).mean(axis = 0)
+        self.value = self.value \
+            + self.rate * self.moments.sdev * (self.q - below)
+
+        return self
+
+def chunks(size, chunksize = None):
+    """Iterate slices of rows with bounded size.
+
+    Args:
+        size (int): total number of rows
+        chunksize (int or None, optional): maximum number of rows per
+            chunk. Default value None yields a single slice.
+
+    """
+
+    if not chunksize or chunksize >= size:
+        yield slice(0, size)
+        return
+    for start in range(0, size, chunksize):
+        yield slice(start, min(start + chunksize, size))
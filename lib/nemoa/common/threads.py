@@ -4,6 +4,8 @@ __author__  = 'Patrick Michl'
 __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
+import nemoa
+
 def thread(function, *args, **kwargs):
     """ """
 
@@ -16,3 +18,62 @@ def thread(function, *args, **kwargs):
     thread.start()
 
     return thread
+
+class Latest:
+    """Background worker, which only processes the latest task.
+
+    Tasks are submitted without blocking the calling thread. If a task
+    is submitted while the worker is still busy, it replaces any other
+    pending task, such that slow tasks, like writing files, never
+    stall the submitting thread and never queue up. Exceptions, which
+    are raised by tasks, are logged as errors and do not stop the
+    worker.
+
+    Args:
+        function: function, which is called by the worker with the
+            arguments of the submitted tasks
+
+    """
+
+    def __init__(self, function):
+        import threading
+        self._function = function
+        self._pending = None
+        self._busy = False
+        self._thread = None
+        self._cond = threading.Condition()
+
+    def submit(self, *args, **kwargs):
+        """Submit task and replace pending task."""
+
+        with self._cond:
+            self._pending = (args, kwargs)
+            if self._thread is None:
+                self._thread = thread(self._run)
+            self._cond.notify_all()
+
+        return True
+
+    def join(self):
+        """Wait until pending and running tasks are finished."""
+
+        with self._cond:
+            while self._pending is not None or self._busy:
+                self._cond.wait()
+
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None: self._cond.wait()
+                args, kwargs = self._pending
+                self._pending = None
+                self._busy = True
+            try: self._function(*args, **kwargs)
+            except Exception as err:
+                nemoa.log('error', 'background task failed: %s' % err)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Recording of nested spans in Chrome trace event format.
+
+Spans are recorded by the context manager span() and the decorator
+traced() and written to a JSON file, which can be opened by the Chrome
+trace viewer (chrome://tracing) or by Perfetto. If tracing is not
+started, spans are not recorded and traced functions are called with
+the overhead of a single test.
+
+"""
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+_events = None
+_path = None
+_origin = 0.
+
+def start(path):
+    """Start recording of spans.
+
+    Args:
+        path (str): path of trace file, which is written by stop()
+
+    """
+
+    global _events, _path, _origin
+
+    import atexit
+    import time
+
+    if _events is None: atexit.register(stop)
+    _events = []
+    _path = path
+    _origin = time.perf_counter()
+
+    return True
+
+def stop():
+    """Stop recording of spans and write trace file.
+
+    Returns:
+        Path of trace file or None if tracing has not been started.
+
+    """
+
+    global _events, _path
+
+    import json
+    import os
+
+    if _events is None: return None
+    events, path = _events, _path
+    _events = _path = None
+
+    dirname = os.path.dirname(path)
+    if dirname and not os.path.exists(dirname): os.makedirs(dirname)
+    with open(path, 'w') as fh:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fh)
+
+    return path
+
+def enabled():
+    """Return True if spans are recorded."""
+    return _events is not None
+
+def sizes(*args, **kwargs):
+    """Get shapes and sizes of arrays and names of given objects.
+
+    Returns:
+        Dictionary with argument positions or keywords as keys and
+        short descriptions of arrays, strings and numbers as values.
+
+    """
+
+    info = {}
+    for key, obj in list(enumerate(args)) + list(kwargs.items()):
+        if hasattr(obj, 'shape') and hasattr(obj, 'nbytes'):
+            info[str(key)] = '%s %s (%i bytes)' % (
+                getattr(obj, 'dtype', ''), obj.shape, obj.nbytes)
+        elif isinstance(obj, (int, float, bool)) or obj is None:
+            info[str(key)] = obj
+        elif isinstance(obj, str) and len(obj) < 80:
+            info[str(key)] = obj
+
+    return info
+
+class span:
+    """Context manager, which records a span.
+
+    Args:
+        name (str): name of span
+        category (str, optional): category of span
+        **kwargs: arguments of span, which are shown in the trace
+
+    """
+
+    def __init__(self, name, category = 'nemoa', **kwargs):
+        self.name = name
+        self.category = category
+        self.args = kwargs
+
+    def __enter__(self):
+        import time
+        if _events is not None: self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if _events is None or not hasattr(self, 'start'): return False
+
+        import os
+        import threading
+        import time
+
+        now = time.perf_counter()
+        _events.append({
+            'name': self.name, 'cat': self.category, 'ph': 'X',
+            'ts': (self.start - _origin) * 1e6,
+            'dur': (now - self.start) * 1e6,
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+            'args': self.args })
+
+        return False
+
+def traced(name = None, category = 'nemoa'):
+    """Decorator, which records calls of a function as spans.
+
+    The shapes and sizes of array arguments and of the returned array
+    are added to the arguments of the span.
+
+    Args:
+        name (str, optional): name of span. By default the qualified
+            name of the function is used.
+        category (str, optional): category of span
+
+    """
+
+    def wrapper(func):
+        import functools
+
+        label = name or '%s.%s' % (func.__module__, func.__qualname__)
+
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            if _events is None: return func(*args, **kwargs)
+            with span(label, category, **sizes(*args, **kwargs)) as s:
+                retval = func(*args, **kwargs)
+                if hasattr(retval, 'shape'):
+                    s.args.update(sizes(retval = retval))
+            return retval
+
+        return wrapped
+
+    return wrapper
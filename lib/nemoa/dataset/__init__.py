@@ -4,11 +4,10 @@ __author__  = 'Patrick Michl'
 __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
-import nemoa.dataset.builder
-import nemoa.dataset.classes
-import nemoa.dataset.commons
-import nemoa.dataset.exports
-import nemoa.dataset.imports
+import nemoa.common.module
+
+__getattr__, __dir__ = nemoa.common.module.lazy(__name__, [
+    'builder', 'classes', 'commons', 'exports', 'imports' ])
 
 def build(*args, **kwargs):
     """Create dataset dictionary from building script."""
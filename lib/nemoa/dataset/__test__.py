@@ -54,3 +54,193 @@ class TestSuite(nemoa.common.unittest.TestSuite):
                 samples = 10000)
             test = nemoa.common.type.isdataset(dataset)
             self.assertTrue(test)
+
+    def test_dataset_sidecar(self):
+        import os
+        import shutil
+        text = nemoa.dataset.imports.text
+        path = nemoa.path('dataset', 'sinus', workspace = 'testsuite')
+        sidecar = text.Sidecar(path)
+        if os.path.isdir(sidecar.cachedir): shutil.rmtree(sidecar.cachedir)
+        nemoa.dataset.load(path)
+        with self.subTest(state = "location"):
+            test = os.path.isdir(sidecar.cachedir) \
+                and sidecar.cachedir.startswith(nemoa.path('cache')) \
+                and not any(name.endswith('.cache')
+                for name in os.listdir(os.path.dirname(path)))
+            self.assertTrue(test)
+        with self.subTest(state = "unchanged settings"):
+            test = bool(sidecar.load())
+            self.assertTrue(test)
+        with self.subTest(state = "changed number of threads"):
+            test = bool(text.Sidecar(path, threads = 4).load())
+            self.assertTrue(test)
+        with self.subTest(state = "changed settings"):
+            test = text.Sidecar(path, missing = 0.).load() is None
+            self.assertTrue(test)
+
+    def test_dataset_csv(self):
+        import os
+        import tempfile
+        fd, path = tempfile.mkstemp(suffix = '.csv')
+        with os.fdopen(fd, 'w') as fh:
+            fh.write('x|y\n' + ''.join('r%i|%i|%i\n' % (i, i, -i)
+                for i in range(10)))
+        try:
+            with self.subTest(delimiter = '|'):
+                # the delimiter is not detected, such that the import
+                # requires the delimiter of the import settings
+                dataset = nemoa.dataset.imports.text.Csv(
+                    delimiter = '|').load(path)
+                table = dataset['tables'][dataset['config']['name']]
+                test = dataset['config']['columns'] \
+                    == (('', 'x'), ('', 'y')) \
+                    and list(table['label']) == ['r%i' % i for i in range(10)]
+                self.assertTrue(test)
+        finally: os.remove(path)
+        fd, path = tempfile.mkstemp(suffix = '.csv')
+        with os.fdopen(fd, 'w') as fh:
+            fh.write('x;y\n' + ''.join('r%i;%i;%i\n' % (i, i, -i)
+                for i in range(10)))
+        try:
+            with self.subTest(delimiter = ';'):
+                dataset = nemoa.dataset.imports.text.Csv().load(path)
+                test = dataset['config']['columns'] \
+                    == (('', 'x'), ('', 'y'))
+                self.assertTrue(test)
+        finally: os.remove(path)
+
+    def test_dataset_labels(self):
+        import nemoa.dataset.commons.labels.gene
+        import os
+        import tempfile
+        cache = nemoa.dataset.commons.labels.cache
+        base = cache.getpath('test', 'a', 'b')
+        files = [base + '.keys.npy', base + '.values.npy']
+        for path in files:
+            if os.path.isfile(path): os.remove(path)
+        try:
+            with self.subTest(function = "lookup"):
+                test = cache.lookup(['x'], 'test', 'a', 'b') == [None]
+                self.assertTrue(test)
+            with self.subTest(function = "update"):
+                cache.update({'x': 'X', 'y': cache.unknown},
+                    'test', 'a', 'b')
+                test = cache.lookup(['x', 'y', 'z'], 'test', 'a', 'b') \
+                    == ['X', cache.unknown, None]
+                self.assertTrue(test)
+            with self.subTest(function = "seed"):
+                fd, path = tempfile.mkstemp(suffix = '.txt')
+                with os.fdopen(fd, 'w') as fh:
+                    fh.write('# mapping\ny\tY\nz\tZ\n')
+                cache.seed(path, 'test', 'a', 'b', delim = '\t')
+                os.remove(path)
+                test = cache.lookup(['x', 'y', 'z'], 'test', 'a', 'b') \
+                    == ['X', 'Y', 'Z']
+                self.assertTrue(test)
+        finally:
+            for path in files:
+                if os.path.isfile(path): os.remove(path)
+        with self.subTest(function = "convert"):
+            # labels, which could not be converted, are cached, such that
+            # they are not passed to R again
+            converter = nemoa.dataset.commons.labels.gene.gene()
+            base = cache.getpath('gene', 'alias', 'entrezid')
+            files = [base + '.keys.npy', base + '.values.npy']
+            labels = ['A1', 'AFFX_ctrl']
+            try:
+                # failures of R are not cached
+                converter._convert_list_rcmd = \
+                    lambda slist, infmt, outfmt: None
+                failed = converter.convert_list(labels, 'alias',
+                    'entrezid')
+                cached = cache.lookup(labels, 'gene', 'alias', 'entrezid')
+                converter._convert_list_rcmd = \
+                    lambda slist, infmt, outfmt: {'A1': '1'}
+                first = converter.convert_list(labels, 'alias', 'entrezid')
+                converter._convert_list_rcmd = None
+                second = converter.convert_list(labels, 'alias',
+                    'entrezid')
+            finally:
+                for path in files:
+                    if os.path.isfile(path): os.remove(path)
+            test = failed == (labels, []) and cached == [None, None] \
+                and first == second == (['1', 'AFFX_ctrl'], [1])
+            self.assertTrue(test)
+
+    def test_dataset_sparse(self):
+        dataset = nemoa.dataset.open('linear', workspace = 'testsuite')
+        dense = dataset.get('data')
+        dataset.set('sparse')
+        with self.subTest(output = "array"):
+            test = numpy.allclose(dataset.get('data'), dense)
+            self.assertTrue(test)
+        with self.subTest(output = "csr"):
+            data = dataset.get('data', size = 10, output = 'csr')
+            test = nemoa.common.sparse.issparse(data) \
+                and data.shape == (10, dense.shape[1])
+            self.assertTrue(test)
+        with self.subTest(function = "dot"):
+            weights = numpy.random.rand(dense.shape[1], 2)
+            data = dataset.get('data', output = 'csr')
+            test = numpy.allclose(data.dot(weights),
+                numpy.dot(dense, weights))
+            self.assertTrue(test)
+        with self.subTest(function = "tdot"):
+            delta = numpy.random.rand(dense.shape[0], 2)
+            data = dataset.get('data', output = 'csr')
+            test = numpy.allclose(data.tdot(delta),
+                numpy.dot(dense.T, delta))
+            self.assertTrue(test)
+
+    def test_dataset_mapped_import(self):
+        # tables, which are memory mapped by imports, are normalized
+        # like tables in memory
+        nemoa.dataset.open('logistic', workspace = 'testsuite')
+        cached = nemoa.dataset.open('logistic', workspace = 'testsuite')
+        reference = nemoa.dataset.open('logistic', workspace = 'testsuite',
+            cache = False)
+        cached._initialize_normalize('bernoulli')
+        reference._initialize_normalize('bernoulli')
+        test = cached.get('memmap') == [] \
+            and numpy.array_equal(cached.get('data'),
+            reference.get('data'))
+        self.assertTrue(test)
+
+    def test_dataset_memmap(self):
+        dataset = nemoa.dataset.open('linear', workspace = 'testsuite')
+        reference = nemoa.dataset.open('linear', workspace = 'testsuite')
+        dataset._config['chunksize'] = 16
+        dataset.set('memmap')
+        with self.subTest(output = "array"):
+            test = dataset.get('memmap') == ['linear'] and numpy.allclose(
+                dataset.get('data'), reference.get('data'))
+            self.assertTrue(test)
+        with self.subTest(normalize = "gauss"):
+            dataset._initialize_normalize('gauss')
+            reference._initialize_normalize('gauss')
+            test = numpy.allclose(dataset.get('data'),
+                reference.get('data'))
+            self.assertTrue(test)
+        with self.subTest(size = 10):
+            data = dataset.get('data', size = 10)
+            self.assertEqual(data.shape[0], 10)
+
+    def test_dataset_dtype(self):
+        dataset = nemoa.dataset.open('linear', workspace = 'testsuite')
+        reference = dataset.get('data')
+        dataset.set('dtype', 'float32')
+        with self.subTest(output = "array"):
+            data = dataset.get('data')
+            test = data.dtype == numpy.float32 \
+                and numpy.allclose(data, reference, atol = 1e-6)
+            self.assertTrue(test)
+        with self.subTest(function = "transform"):
+            model = nemoa.model.create(dataset = dataset,
+                network = 'shallow', system = 'ann')
+            model.system.set('dtype', 'float32')
+            mapping = model.system.mapping
+            data = model.system._get_unitexpect(
+                model.dataset.get('data', cols = mapping[0]), mapping)
+            test = data.dtype == numpy.float32
+            self.assertTrue(test)
@@ -7,7 +7,8 @@ __license__ = 'GPLv3'
 import nemoa
 import numpy
 
-class Dataset(nemoa.common.classes.Metadata):
+class Dataset(nemoa.common.classes.Metadata,
+    metaclass = nemoa.common.classes.Registry):
     """Dataset base class.
 
     Attributes:
@@ -55,9 +56,11 @@ class Dataset(nemoa.common.classes.Metadata):
 
     _config  = None
     _tables  = None
-    _default = { 'name': None }
+    _memmap  = None
+    _default = { 'name': None, 'chunksize': 100000, 'dtype': 'float64' }
     _attr    = { 'columns': 'r', 'rows': 'r' }
 
+    @nemoa.common.trace.traced('dataset.configure')
     def configure(self, network):
         """Configure dataset columns to a given network.
 
@@ -74,6 +77,9 @@ class Dataset(nemoa.common.classes.Metadata):
         labelformat = network.get('config', 'labelformat')
 
         # normalize network node labels
+        # nodes and node labels of layers are fetched once and reused
+        # for the matching of nodes to columns
+        layer_labels = {}
         nodes_conv = {}
         nodes_lost = []
         nodes_count = 0
@@ -83,17 +89,15 @@ class Dataset(nemoa.common.classes.Metadata):
             nodes = network.get('nodes', layer = layer)
 
             # get node labels from layer
-            # 2do: network.get('nodelabel', node = node)
             # 2do: network.get('nodelabels', layer = layer)
-            node_labels = []
-            for node in nodes:
-                node_labels.append(
-                    network.get('node', node)['params']['label'])
+            node_labels = [network.get('node', node)['params']['label']
+                for node in nodes]
 
             # convert node labels to standard label format
             conv, lost = nemoa.dataset.commons.labels.convert(
                 node_labels, input = labelformat)
 
+            layer_labels[layer] = node_labels
             nodes_conv[layer] = conv
             nodes_lost += [conv[i] for i in lost]
             nodes_count += len(nodes_conv[layer])
@@ -117,8 +121,12 @@ class Dataset(nemoa.common.classes.Metadata):
                 columns_conv = table_config['columns_conv']
                 columns_lost = table_config['columns_lost']
             else:
-                source_columns = \
-                    self._tables[table].dtype.names
+                if nemoa.common.sparse.issparse(self._tables[table]):
+                    source_columns = \
+                        ('label', ) + self._tables[table].names
+                else:
+                    source_columns = \
+                        self._tables[table].dtype.names
 
                 if 'labelformat' in table_config:
                     source_labelformat = table_config['labelformat']
@@ -136,8 +144,12 @@ class Dataset(nemoa.common.classes.Metadata):
             self._test = table_config
 
             # convert table columns
-            self._tables[table].dtype.names = \
-                tuple(table_config['columns_conv'])
+            if nemoa.common.sparse.issparse(self._tables[table]):
+                self._tables[table].names = \
+                    tuple(table_config['columns_conv'][1:])
+            else:
+                self._tables[table].dtype.names = \
+                    tuple(table_config['columns_conv'])
 
             # notify if any table columns could not be converted
             if columns_lost:
@@ -148,27 +160,22 @@ class Dataset(nemoa.common.classes.Metadata):
                     for i in columns_lost]))
 
             # search network nodes in table columns
+            columns_set = set(columns_conv)
             num_lost = 0
             num_all = 0
             nodes_lost = {}
             for layer in layers:
-                nodes_conv_lost = \
-                    [val for val in nodes_conv[layer] \
-                    if val not in columns_conv]
+                lost_ids = [nid for nid, val in \
+                    enumerate(nodes_conv[layer]) \
+                    if val not in columns_set]
                 num_all += len(nodes_conv[layer])
 
-                if not nodes_conv_lost: continue
-                num_lost += len(nodes_conv_lost)
+                if not lost_ids: continue
+                num_lost += len(lost_ids)
 
-                # get lost nodes
-                nodes_lost[layer] = []
-                for val in nodes_conv_lost:
-                    node_lost_id = nodes_conv[layer].index(val)
-                    node_lost = network.get('nodes',
-                        layer = layer)[node_lost_id]
-                    node_label = network.get('node',
-                        node_lost)['params']['label']
-                    nodes_lost[layer].append(node_label)
+                # get labels of lost nodes
+                nodes_lost[layer] = \
+                    [layer_labels[layer][nid] for nid in lost_ids]
 
             # notify if any network nodes could not be found
             if num_lost:
@@ -187,13 +194,14 @@ class Dataset(nemoa.common.classes.Metadata):
                 'notusecols': columns_lost }
 
         # intersect converted table column names
-        inter_col_labels = col_labels[list(col_labels.keys())[0]]['conv']
+        inter_col_labels = set(
+            col_labels[list(col_labels.keys())[0]]['conv'])
         for table in col_labels:
             conv_list = col_labels[table]['conv']
-            black_list = [conv_list[i] for i in \
-                col_labels[table]['notusecols']]
-            inter_col_labels = [val for val in inter_col_labels \
-                if val in conv_list and not val in black_list]
+            black_list = set([conv_list[i] for i in \
+                col_labels[table]['notusecols']])
+            inter_col_labels &= set(conv_list)
+            inter_col_labels -= black_list
 
         # search network nodes in dataset columns and create
         # dictionary for column mapping from columns to table column
@@ -208,9 +216,7 @@ class Dataset(nemoa.common.classes.Metadata):
                 found = True
 
                 # add column (use network label and layer)
-                # 2do: network.get('nodelabel', node = node)
-                node = network.get('nodes', layer = layer)[id]
-                label = network.get('node', node)['params']['label']
+                label = layer_labels[layer][id]
                 colid = layer + ':' + label
                 columns.append(colid)
                 mapping[colid] = column
@@ -232,6 +238,7 @@ class Dataset(nemoa.common.classes.Metadata):
 
         return True
 
+    @nemoa.common.trace.traced('dataset.initialize')
     def initialize(self, system = None):
         """Initialize tables and data preprocessing.
 
@@ -265,6 +272,12 @@ class Dataset(nemoa.common.classes.Metadata):
             if distribution == 'gauss': normalize = 'gauss'
             if distribution == 'sigmoid': normalize = 'bernoulli'
 
+        # normalization and transformation would destroy sparsity
+        if (normalize or transform) and self._get_sparse():
+            nemoa.log('warning', """skipping normalization and
+                transformation of sparse tables.""")
+            normalize, transform = None, None
+
         retval = True
 
         if stratify: retval &= self._initialize_stratify(stratify)
@@ -379,19 +392,28 @@ class Dataset(nemoa.common.classes.Metadata):
         # get data for calculation of mean value and standard deviation
         # for single table datasets take all data from
         # for multi table datasets take a big bunch of stratified data
-        if len(tables) == 1: data = self._get_table(table = tables[0])
-        else: data = self._get_data(size = size, output = 'recarray')
+        # for memory mapped single tables stream over chunks of rows
+        if len(tables) == 1 and self._get_memmap(tables[0]):
+            moments = nemoa.common.stream.Moments()
+            for rows in self._get_chunks(tables[0]):
+                moments.update(self._get_chunk(tables[0], columns, rows))
+            mean = dict(zip(columns, moments.mean))
+            sdev = dict(zip(columns, moments.sdev))
+        else:
+            if len(tables) == 1: data = self._get_table(table = tables[0])
+            else: data = self._get_data(size = size, output = 'recarray')
 
-        # calculate mean value and standard deviation for each column
-        mean = {col: data[col].mean() for col in columns}
-        sdev = {col: data[col].std() for col in columns}
+            # calculate mean value and standard deviation for each column
+            mean = {col: data[col].mean() for col in columns}
+            sdev = {col: data[col].std() for col in columns}
 
         # iterative normalize tables and columns
         for table in tables:
-            for column in columns:
-                self._tables[table][column] = \
-                    (self._tables[table][column] - mean[column] + mu) \
-                    / sdev[column] * sigma
+            for rows in self._get_chunks(table):
+                chunk = self._tables[table][rows]
+                for column in columns:
+                    chunk[column] = (chunk[column] - mean[column] + mu) \
+                        / sdev[column] * sigma
 
         return True
 
@@ -411,28 +433,42 @@ class Dataset(nemoa.common.classes.Metadata):
         tables = list(self._tables.keys())
         columns = self._get_colnames()
 
-        # get data for calculation of mean value and standard deviation
+        # calculate q-quantile for each column
+        # for memory mapped single tables stream over chunks of rows
+        # using histograms between the column minima and maxima
+        if len(tables) == 1 and self._get_memmap(tables[0]):
+            table = tables[0]
+            lower = numpy.full(len(columns), numpy.inf)
+            upper = numpy.full(len(columns), -numpy.inf)
+            for rows in self._get_chunks(table):
+                chunk = self._get_chunk(table, columns, rows)
+                lower = numpy.minimum(lower, chunk.min(axis = 0))
+                upper = numpy.maximum(upper, chunk.max(axis = 0))
+            quantiles = nemoa.common.stream.Quantiles(lower, upper)
+            for rows in self._get_chunks(table):
+                quantiles.update(self._get_chunk(table, columns, rows))
+            quantile = dict(zip(columns, quantiles.get(1. - p)))
+
         # for single table datasets take all data from
         # for multi table datasets take a big bunch of stratified data
-        if len(tables) == 1: data = self._get_table(table = tables[0])
-        else: data = self._get_data(size = size, output = 'recarray')
-
-        # calculate q-quantile for each column
-        quantile = {}
-        for col in columns:
-            scol = numpy.sort(data[col].copy())
-            rid = int((1. - p) * data.size)
-            lrid = rid - int(0.1 * p * data.size)
-            urid = rid + int(0.1 * p * data.size)
-            quantile[col] = scol[lrid:urid].mean()
+        else:
+            if len(tables) == 1: data = self._get_table(table = tables[0])
+            else: data = self._get_data(size = size, output = 'recarray')
+            quantile = {}
+            for col in columns:
+                scol = numpy.sort(data[col].copy())
+                rid = int((1. - p) * data.size)
+                lrid = rid - int(0.1 * p * data.size)
+                urid = rid + int(0.1 * p * data.size)
+                quantile[col] = scol[lrid:urid].mean()
 
         # iterative normalize tables and columns
         for table in list(self._tables.keys()):
-            for column in self._tables[table].dtype.names[1:]:
-                mean = data[column].mean()
-                self._tables[table][column] = \
-                    (self._tables[table][column] > quantile[column]
-                    ).astype(float)
+            for rows in self._get_chunks(table):
+                chunk = self._tables[table][rows]
+                for column in self._tables[table].dtype.names[1:]:
+                    chunk[column] = \
+                        (chunk[column] > quantile[column]).astype(float)
 
         return True
 
@@ -471,30 +507,26 @@ class Dataset(nemoa.common.classes.Metadata):
 
         # gauss to binary data transformation
         if transformation.lower() in ['gausstobinary', 'binary']:
-            for table in self._tables:
-                for column in self._tables[table].dtype.names[1:]:
-                    self._tables[table][column] = \
-                        (self._tables[table][column] > 0.).astype(float)
-            return True
+            func = lambda x: (x > 0.).astype(float)
 
         # gauss to weight in [0, 1] data transformation
-        if transformation.lower() in ['gausstoweight', 'weight']:
-            for table in self._tables:
-                for column in self._tables[table].dtype.names[1:]:
-                    self._tables[table][column] = \
-                        (2. / (1. + numpy.exp(-1. * \
-                        self._tables[table][column] ** 2))
-                        ).astype(float)
-            return True
+        elif transformation.lower() in ['gausstoweight', 'weight']:
+            func = lambda x: (2. / (1. + numpy.exp(-1. * x ** 2))
+                ).astype(float)
 
         # gauss to distance data transformation
-        if transformation.lower() in ['gausstodistance', 'distance']:
+        elif transformation.lower() in ['gausstodistance', 'distance']:
+            func = lambda x: (1. - (2. / (1. + numpy.exp(-1. * x ** 2)))
+                ).astype(float)
+
+        else: func = None
+
+        if func:
             for table in self._tables:
-                for column in self._tables[table].dtype.names[1:]:
-                    self._tables[table][column] = \
-                        (1. - (2. / (1. + numpy.exp(-1. * \
-                        self._tables[table][column] ** 2)))
-                        ).astype(float)
+                for rows in self._get_chunks(table):
+                    chunk = self._tables[table][rows]
+                    for column in self._tables[table].dtype.names[1:]:
+                        chunk[column] = func(chunk[column])
             return True
 
         return nemoa.log('error',
@@ -518,42 +550,37 @@ class Dataset(nemoa.common.classes.Metadata):
 
         colnames = self._get_colnames(source_columns)
 
+        # get transformation function
+        if func == 'expect': trans_func = system._get_unitexpect
+        elif func == 'value': trans_func = system._get_unitvalues
+        elif func == 'sample': trans_func = system._get_unitsamples
+        else: return nemoa.log('error', """could not transform data
+            using system: unknown function '%s'.""" % func)
+
         for table in self._tables:
 
-            # get data, mapping and transformation function
-            data = self._tables[table]
-            data = self._get_table(table, cols = source_columns)
-            # 2Do: do not create copy of data but view!
-            data_array = data.copy().view('<f8').reshape(data.size,
-                len(source_columns))
-
-            # transform data
-            if func == 'expect':
-                trans_array = system._get_unitexpect(
-                    data_array, mapping)
-            elif func == 'value':
-                trans_array = system._get_unitvalues(
-                    data_array, mapping)
-            elif func == 'sample':
-                trans_array = system._get_unitsamples(
-                    data_array, mapping)
-
-            # create empty record array
-            num_rows = self._tables[table]['label'].size
+            # create empty record array, which is memory mapped if
+            # the source table is memory mapped
+            src = self._tables[table]
             col_names = ('label',) + tuple(target_columns)
-            col_formats = ('<U12',) + tuple(['<f8' \
-                for x in target_columns])
-            new_rec_array = numpy.recarray((num_rows,),
-                dtype = list(zip(col_names, col_formats)))
-
-            # set values in record array
-            new_rec_array['label'] = self._tables[table]['label']
-            for colid, colname in \
-                enumerate(new_rec_array.dtype.names[1:]):
-
-                # update source data columns
-                new_rec_array[colname] = \
-                    (trans_array[:, colid]).astype(float)
+            col_formats = (src['label'].dtype.str,) \
+                + tuple([self._get_dtype().str for x in target_columns])
+            dtype = list(zip(col_names, col_formats))
+            if self._get_memmap(table):
+                new_rec_array = self._get_memmap_array(table,
+                    src.shape[0], dtype)
+            else:
+                new_rec_array = numpy.recarray((src.shape[0],),
+                    dtype = dtype)
+
+            # transform data by chunks of rows and set values
+            for rows in self._get_chunks(table):
+                trans_array = trans_func(
+                    self._get_chunk(table, colnames, rows), mapping)
+                chunk = new_rec_array[rows]
+                chunk['label'] = src['label'][rows]
+                for colid, colname in enumerate(col_names[1:]):
+                    chunk[colname] = trans_array[:, colid]
 
             # set record array
             self._tables[table] = new_rec_array
@@ -581,12 +608,16 @@ class Dataset(nemoa.common.classes.Metadata):
         if key == 'colfilter': return self._get_colfilter(*args, **kwargs)
         if key == 'colfilters': return self._get_colfilters()
         if key == 'data': return self._get_data(*args, **kwargs)
+        if key == 'dtype': return self._get_dtype(*args, **kwargs)
+        if key == 'memmap': return self._get_memmap(*args, **kwargs)
         if key == 'rows': return self._get_rows(*args, **kwargs)
         if key == 'rowgroups': return self._get_rowgroups(*args, **kwargs)
         if key == 'rowfilter': return self._get_rowfilter(*args, **kwargs)
         if key == 'rowfilters': return self._get_rowfilters()
+        if key == 'sparse': return self._get_sparse(*args, **kwargs)
         if key == 'table': return self._get_table(*args, **kwargs)
         if key == 'value': return self._get_value(*args, **kwargs)
+        if key == 'memory': return self._get_memory(*args, **kwargs)
 
         # direct access
         if key == 'copy': return self._get_copy(*args, **kwargs)
@@ -598,25 +629,15 @@ class Dataset(nemoa.common.classes.Metadata):
     def _get_algorithms(self, category = None, attribute = None, tree = False):
         """Get algorithms provided by dataset."""
 
-        # get dictionary with all methods
-        # with prefix '_get_' and attribute 'name'
-        methods = nemoa.common.module.getmethods(self,
-            prefix = '_get_', attribute = 'name')
-
-        # filter algorithms by given category
-        if not category == None:
-            for key, val in list(methods.items()):
-                if val.get('category', None) != category:
-                    del methods[key]
-
         # create flat structure if category is given or tree is False
-        structured = {}
         if category or not tree:
-            for ukey, udata in methods.items():
-                if attribute: structured[udata['name']] = \
-                    udata[attribute]
-                else: structured[udata['name']] = udata
-            return structured
+            return nemoa.common.decorators.getalgorithms(self,
+                category = category, attribute = attribute,
+                prefix = '_get_')
+
+        # get algorithms with prefix '_get_' grouped by categories
+        grouped = nemoa.common.decorators.getalgorithms(self,
+            attribute = attribute, prefix = '_get_', grouping = True)
 
         # create tree structure if category is not given
         categories = {
@@ -624,26 +645,20 @@ class Dataset(nemoa.common.classes.Metadata):
             ('dataset', 'transformation'): None,
             ('dataset', 'columns', 'evaluation'): 'columns',
             ('dataset', 'rows', 'evaluation'): 'rows' }
-        for ukey, udata in methods.items():
-            if not udata['category'] in list(categories.keys()): continue
-            ckey = categories[udata['category']]
-            if ckey == None:
-                if attribute: structured[udata['name']] = \
-                    udata[attribute]
-                else: structured[udata['name']] = udata
-            else:
-                if not ckey in list(structured.keys()): structured[ckey] = {}
-                if attribute: structured[ckey][udata['name']] = \
-                    udata[attribute]
-                else: structured[ckey][udata['name']] = udata
+        structured = {}
+        for category, algorithms in grouped.items():
+            if not category in categories: continue
+            ckey = categories[category]
+            if ckey == None: structured.update(algorithms)
+            else: structured.setdefault(ckey, {}).update(algorithms)
 
         return structured
 
-    def _get_algorithm(self, algorithm = None, *args, **kwargs):
+    def _get_algorithm(self, algorithm = None, category = None,
+        attribute = None, **kwargs):
         """Get algorithm."""
-        algorithms = self._get_algorithms(*args, **kwargs)
-        if not algorithm in algorithms: return None
-        return algorithms[algorithm]
+        return nemoa.common.decorators.getalgorithm(self, algorithm,
+            category = category, attribute = attribute, prefix = '_get_')
 
     def _get_columns(self, filter = '*'):
         """Get external columns.
@@ -744,7 +759,9 @@ class Dataset(nemoa.common.classes.Metadata):
         """Get list of row names."""
         row_names = []
         for table in list(self._tables.keys()):
-            labels = self._tables[table]['label'].tolist()
+            if nemoa.common.sparse.issparse(self._tables[table]):
+                labels = self._tables[table].labels.tolist()
+            else: labels = self._tables[table]['label'].tolist()
             row_names += ['%s:%s' % (table, name) for name in labels]
         return row_names
 
@@ -762,6 +779,114 @@ class Dataset(nemoa.common.classes.Metadata):
         """Get list of row filters."""
         return list(self._config['rowfilter'].keys())
 
+    def _get_sparse(self, table = None):
+        """Get list of tables, which are stored as sparse tables.
+
+        Args:
+            table (str or None, optional): name of table. If given, a
+                boolean value is returned, which is True if the table
+                is stored as sparse table.
+
+        """
+
+        issparse = nemoa.common.sparse.issparse
+        if table is not None: return issparse(self._tables.get(table))
+        return [key for key, val in self._tables.items() if issparse(val)]
+
+    def _get_memmap(self, table = None):
+        """Get list of tables, which are memory mapped.
+
+        Memory mapped tables are tables, which have been converted by
+        set('memmap'). They are only read from disk, when accessed.
+        Preprocessing of memory mapped tables is performed by chunks of
+        rows and minibatches only gather the sampled rows, such that
+        the tables may exceed the physical memory. Tables, which are
+        mapped by imports, like numpy directory archives, are processed
+        like tables in memory, such that the results do not depend on
+        the import.
+
+        Args:
+            table (str or None, optional): name of table. If given, a
+                boolean value is returned, which is True if the table
+                is memory mapped.
+
+        """
+
+        memmap = self._memmap or set()
+        if table is not None: return table in memmap
+        return [key for key in self._tables.keys() if key in memmap]
+
+    def _get_memmap_array(self, table, size, dtype, path = None):
+        """Create memory mapped record array for table.
+
+        The array is stored in a numpy file within the given directory
+        or the cache directory of the current workspace. The file is
+        unlinked from the directory after mapping, such that the disk
+        space is released with the array.
+
+        Returns:
+            Writeable memory mapped numpy array.
+
+        """
+
+        import os
+        import tempfile
+
+        if not path:
+            if nemoa.get('workspace'): cachedir = nemoa.path('cache')
+            else: cachedir = nemoa.path('expand', ('%user_cache_dir%', ))
+            path = nemoa.path('expand', (cachedir, 'datasets'),
+                create = True)
+        if not os.path.isdir(path): os.makedirs(path)
+
+        prefix = '%s.%s.' % (self._get_meta('name') or 'dataset', table)
+        fd, filepath = tempfile.mkstemp(suffix = '.npy', prefix = prefix,
+            dir = path)
+        os.close(fd)
+        array = numpy.lib.format.open_memmap(filepath, mode = 'w+',
+            dtype = dtype, shape = (size, ))
+        try: os.remove(filepath)
+        except OSError: pass
+
+        return array
+
+    def _get_chunks(self, table):
+        """Get slices of rows for chunked processing of table.
+
+        Memory mapped tables are processed by chunks of rows, with
+        the size given by the configuration key 'chunksize'. All other
+        tables are processed at once.
+
+        """
+
+        size = self._tables[table].shape[0]
+        if not self._get_memmap(table):
+            return nemoa.common.stream.chunks(size)
+        return nemoa.common.stream.chunks(size,
+            self._config.get('chunksize', None))
+
+    def _get_chunk(self, table, colnames, rows):
+        """Get chunk of rows from table as two dimensional array.
+
+        Args:
+            table (str): name of table
+            colnames (list of str): table columns, which may contain
+                duplicates
+            rows (slice): slice of rows
+
+        Returns:
+            Numpy ndarray of shape (rows, columns).
+
+        """
+
+        chunk = self._tables[table][rows]
+        array = numpy.empty((chunk.shape[0], len(colnames)),
+            dtype = self._get_dtype())
+        for colid, colname in enumerate(colnames):
+            array[:, colid] = chunk[colname]
+
+        return array
+
     def _get_data(self, size = 0, rows = '*', cols = '*',
         noise = (None, 0.), output = 'array'):
         """Return a given number of stratified samples.
@@ -793,6 +918,7 @@ class Dataset(nemoa.common.classes.Metadata):
                 'recarray': numpy record array containing data, column
                     names and row names in column 'label'
                 'array': numpy ndarray containing data
+                'csr': sparse table (nemoa.common.sparse.CSR)
                 'cols': list of column names
                 'rows': list of row names
                 default: 'array'
@@ -820,12 +946,22 @@ class Dataset(nemoa.common.classes.Metadata):
             return nemoa.log('error',
                 "could not get data: "
                 "no valid data sources found!")
-        data = numpy.concatenate(src_stack)
 
-        # (optional) shuffle data and correct size
-        if size:
-            numpy.random.shuffle(data)
-            data = data[:size]
+        # sparse tables are stacked and shuffled by row indices
+        sparse = nemoa.common.sparse
+        if any([sparse.issparse(src) for src in src_stack]):
+            data = sparse.vstack([src if sparse.issparse(src)
+                else sparse.fromrecarray(src) for src in src_stack])
+            if size:
+                data = data.take(
+                    numpy.random.permutation(data.size)[:size])
+        else:
+            data = numpy.concatenate(src_stack)
+
+            # (optional) shuffle data and correct size
+            if size:
+                numpy.random.shuffle(data)
+                data = data[:size]
 
         # format data
         if isinstance(cols, str):
@@ -860,6 +996,7 @@ class Dataset(nemoa.common.classes.Metadata):
                 'recarray': numpy record array containing data, column
                     names and row names in column 'label'
                 'array': numpy ndarray containing data
+                'csr': sparse table (nemoa.common.sparse.CSR)
                 'cols': list of column names
                 'rows': list of row names
                 default value is 'array'
@@ -879,7 +1016,7 @@ class Dataset(nemoa.common.classes.Metadata):
         if not len(columns) == len(set(columns)):
             return nemoa.log('error', """could not retrieve data:
                 columns are not unique!""")
-        if [col for col in columns if col not in self._get_columns()]:
+        if not set(columns) <= set(self._get_columns()):
             return nemoa.log('error', """could not retrieve data:
                 unknown columns!""")
         colnames = self._get_colnames(columns)
@@ -904,6 +1041,11 @@ class Dataset(nemoa.common.classes.Metadata):
                 if counter[col] == 1: ucolnames.append(col)
                 else: ucolnames.append('%s.%i' % (col, counter[col]))
 
+        # format sparse data
+        if nemoa.common.sparse.issparse(data):
+            return self._get_data_format_sparse(data, colnames,
+                ucolnames, output)
+
         # format data
         rettuple = ()
         for fmt_str in fmt_tuple:
@@ -911,8 +1053,12 @@ class Dataset(nemoa.common.classes.Metadata):
                 rettuple += (data[['label'] + ucolnames], )
             elif fmt_str == 'array':
                 # 2Do: do not create copy of data but view!
-                rettuple += (data[ucolnames].copy().view('<f8').reshape(
-                    data.size, len(ucolnames)), )
+                rettuple += (data[ucolnames].copy().view(
+                    self._get_dtype()).reshape(data.size,
+                    len(ucolnames)), )
+            elif fmt_str == 'csr':
+                rettuple += (nemoa.common.sparse.fromrecarray(
+                    data[['label'] + ucolnames]), )
             elif fmt_str == 'cols':
                 rettuple += (ucolnames, )
             elif fmt_str == 'rows':
@@ -924,6 +1070,37 @@ class Dataset(nemoa.common.classes.Metadata):
             return rettuple[0]
         return rettuple
 
+    def _get_data_format_sparse(self, data, colnames, ucolnames,
+        output = 'array'):
+        """Return sparse data in given format.
+
+        Args:
+            data (CSR): sparse table
+            colnames (list of str): table column names
+            ucolnames (list of str): unique column names
+            output (string or tuple of strings, optional):
+                data return format. See _get_data_format
+
+        """
+
+        if isinstance(output, str): fmt_tuple = (output, )
+        else: fmt_tuple = output
+
+        table = data.select(colnames)
+        rettuple = ()
+        for fmt_str in fmt_tuple:
+            if fmt_str == 'recarray': rettuple += (table.torecarray(), )
+            elif fmt_str == 'array': rettuple += (table.toarray(), )
+            elif fmt_str == 'csr': rettuple += (table, )
+            elif fmt_str == 'cols': rettuple += (ucolnames, )
+            elif fmt_str == 'rows': rettuple += (table.labels.tolist(), )
+            else:
+                return nemoa.log('error', """could not retrieve data:
+                    invalid argument 'cols'.""")
+        if isinstance(output, str):
+            return rettuple[0]
+        return rettuple
+
     def _get_data_corrupt(self, data, type = None, factor = 0.5):
         """Corrupt given data.
 
@@ -945,22 +1122,31 @@ class Dataset(nemoa.common.classes.Metadata):
 
         Returns:
             Numpy array with (partly) corrupted data. The shape is
-            identical to the shape of the given data.
+            identical to the shape of the given data. For sparse data
+            the masking noise model preserves sparsity, whereas all
+            other noise models return dense numpy arrays.
 
         """
 
         if isinstance(data, tuple):
-            return tuple([self._get_data_corrupt(table)
-                for table in list(data)])
+            return tuple([self._get_data_corrupt(table,
+                type = type, factor = factor) for table in list(data)])
 
         if not isinstance(type, str): return data
         if type.lower() == 'none': return data
 
+        # sparse data
+        if nemoa.common.sparse.issparse(data):
+            if type.lower() == 'mask':
+                return data.mask(numpy.random.binomial(
+                    size = data.nnz, n = 1, p = 1. - factor))
+            data = data.toarray()
+
         # gaussian noise model
-        elif type.lower() == 'gauss':
+        if type.lower() == 'gauss':
             noise = numpy.random.normal(
                 size = data.shape, loc = 0., scale = factor)
-            return data + noise
+            return data + noise.astype(data.dtype)
 
         # bernoulli noise model
         elif type.lower() == 'bernoulli':
@@ -1052,7 +1238,8 @@ class Dataset(nemoa.common.classes.Metadata):
         # check table name
         if not isinstance(table, str) \
             or not table in list(self._tables.keys()) \
-            or not isinstance(self._tables[table], numpy.ndarray):
+            or not (isinstance(self._tables[table], numpy.ndarray)
+            or nemoa.common.sparse.issparse(self._tables[table])):
             return nemoa.log('error',
                 "could not retrieve data: "
                 "invalid table name: '%s'." % table)
@@ -1073,6 +1260,22 @@ class Dataset(nemoa.common.classes.Metadata):
             # 2do: filter list to valid row names
             rowfilter = rows
 
+        # sparse tables
+        if nemoa.common.sparse.issparse(self._tables[table]):
+            return self._get_table_sparse(table, colnames, rowfilter,
+                size)
+
+        # memory mapped tables only gather the rows of stratified
+        # samples, which are read in ascending order
+        src = self._tables[table]
+        if size and self._get_memmap(table) \
+            and ('*:*' in rowfilter or table + ':*' in rowfilter):
+            fraction = self._config['table'][table]['fraction']
+            rowsel = numpy.sort(numpy.random.randint(src.size,
+                size = int(round(fraction * size))))
+            src = numpy.asarray(src[rowsel]).view(numpy.recarray)
+            size = 0
+
         # test for not unique column names and create dublicates
         if len(set(colnames)) == len(colnames):
 
@@ -1082,14 +1285,14 @@ class Dataset(nemoa.common.classes.Metadata):
 
             with numpy.warnings.catch_warnings():
                 numpy.warnings.filterwarnings('ignore')
-                table_colsel = self._tables[table][colnames]
+                table_colsel = src[colnames]
 
         else:
 
             if labels: datacols = colnames[1:]
             else: datacols = colnames
             redcols = sorted(set(datacols), key = datacols.index)
-            redrec = self._tables[table][redcols]
+            redrec = src[redcols]
             redfmt = [col[1] for col in redrec.dtype.descr]
             select = [redcols.index(col) for col in datacols]
             names = []
@@ -1100,13 +1303,13 @@ class Dataset(nemoa.common.classes.Metadata):
                 else: names.append('%s.%i' % (col, counter[col]))
             formats = [redfmt[cid] for cid in select]
             dtype = numpy.dtype({'names': names, 'formats': formats})
-            array = redrec[redcols].view('<f8').reshape(
+            array = redrec[redcols].view(self._get_dtype()).reshape(
                 redrec.size, len(redcols))[:,select].copy().view(
                 type = numpy.recarray, dtype = dtype)
 
             if labels:
                 table_colsel = nemoa.common.recarray.insert(array,
-                    self._tables[table], ['label'])
+                    src, ['label'])
             else:
                 table_colsel = array
 
@@ -1118,8 +1321,7 @@ class Dataset(nemoa.common.classes.Metadata):
                 row.split(':')[1] for row in rowfilter
                 if row.split(':')[0] in [source, '*']]
             rowsel = numpy.asarray([
-                rowid for rowid, row in enumerate(
-                self._tables[table]['label'])
+                rowid for rowid, row in enumerate(src['label'])
                 if row in rowfilter_filtered])
             data = numpy.take(table_colsel, rowsel)
 
@@ -1131,13 +1333,93 @@ class Dataset(nemoa.common.classes.Metadata):
 
         return numpy.take(data, rowsel)
 
+    def _get_table_sparse(self, table, colnames, rowfilter, size = 0):
+        """Get data from sparse tables.
+
+        Row selection and stratified sampling only gather the stored
+        values of the selected rows. The row labels are kept within
+        the returned sparse table.
+
+        Returns:
+            Sparse table (nemoa.common.sparse.CSR).
+
+        """
+
+        colnames = [col for col in colnames if col != 'label']
+        colnames = sorted(set(colnames), key = colnames.index)
+        data = self._tables[table].select(colnames)
+
+        # row selection
+        if not '*:*' in rowfilter and not table + ':*' in rowfilter:
+            rowfilter_filtered = set([
+                row.split(':')[1] for row in rowfilter
+                if row.split(':')[0] in [table, '*']])
+            data = data.take([rowid for rowid, row in
+                enumerate(data.labels) if row in rowfilter_filtered])
+
+        # stratify
+        if size == 0 or size == None: return data
+        fraction = self._config['table'][table]['fraction']
+
+        return data.take(numpy.random.randint(data.size,
+            size = int(round(fraction * size))))
+
     def _get_value(self, row = None, col = None):
         """Get single value from dataset."""
         return float(self._get_data(cols = [col], rows = [row]))
 
-    def _get_copy(self, key = None, *args, **kwargs):
-        """Get dataset copy as dictionary."""
+    def _get_dtype(self):
+        """Get data type of data columns.
+
+        Returns:
+            Numpy dtype of the data columns of the tables, as given by
+            the configuration key 'dtype'. Default value is 'float64'.
+
+        """
+
+        dtype = self._config.get('dtype') if self._config else None
+        return numpy.dtype(dtype or 'float64')
+
+    def _get_memory(self, memo = None):
+        """Get memory, which is held by the dataset.
+
+        Args:
+            memo (set, optional): ids of objects, which have already
+                been counted, e.g. by other components of a model
+
+        Returns:
+            Dictionary with the number of bytes held by the tables
+            ('tables') and the configuration ('config'), the total
+            number of bytes ('total') and the number of bytes of memory
+            mapped tables ('mapped'), which are only read from disk
+            when accessed and are not included in the total.
+
+        """
 
+        if memo is None: memo = set()
+
+        memory = {
+            'tables': nemoa.common.ndarray.nbytes(self._tables, memo),
+            'config': nemoa.common.ndarray.nbytes(self._config, memo) }
+        memory['total'] = sum(memory.values())
+        memory['mapped'] = sum(table.nbytes
+            for table in self._tables.values()
+            if isinstance(table, numpy.memmap)) if self._tables else 0
+
+        return memory
+
+    def _get_copy(self, key = None, *args, deep = True, **kwargs):
+        """Get dataset copy as dictionary.
+
+        Args:
+            deep (bool, optional): if False, the dictionary references
+                the configuration and tables of the dataset instead of
+                copies, for example to write them to files.
+
+        """
+
+        if key == None and not deep: return {
+            'config': self._config, 'tables': self._tables }
         if key == None: return {
             'config': self._get_config(),
             'tables': self._get_tables() }
@@ -1186,6 +1468,9 @@ class Dataset(nemoa.common.classes.Metadata):
         # modify dataset parameters
         if key == 'columns': return self._set_columns(*args, **kwargs)
         if key == 'colfilter': return self._set_colfilter(**kwargs)
+        if key == 'sparse': return self._set_sparse(*args, **kwargs)
+        if key == 'memmap': return self._set_memmap(*args, **kwargs)
+        if key == 'dtype': return self._set_dtype(*args, **kwargs)
 
         # import dataset configuration and dataset tables
         if key == 'copy': return self._set_copy(*args, **kwargs)
@@ -1225,16 +1510,20 @@ class Dataset(nemoa.common.classes.Metadata):
 
         # assert validity of external columns in 'mapping'
         for column in columns:
-            if not column in list(mapping.keys()):
+            if not column in mapping:
                 return nemoa.log('error', """could not set columns:
                     column '%s' can not be mapped to table column."""
                     % (column))
 
         # assert validity of internal columns in 'mapping'
+        table_names = {}
+        for table in self._tables.keys():
+            if nemoa.common.sparse.issparse(self._tables[table]):
+                table_names[table] = set(self._tables[table].names)
+            else: table_names[table] = set(self._tables[table].dtype.names)
         for column in list(set(mapping.values())):
             for table in self._tables.keys():
-                if column in self._tables[table].dtype.names:
-                    continue
+                if column in table_names[table]: continue
                 return nemoa.log('error', """could not set columns:
                     table '%s' has no column '%s'."""
                     % (table, column))
@@ -1269,6 +1558,130 @@ class Dataset(nemoa.common.classes.Metadata):
 
         return True
 
+    def _set_sparse(self, tables = None):
+        """Convert dense tables to sparse tables.
+
+        Sparse tables store the nonzero values in compressed sparse row
+        format, such that memory usage, sampling and the computation
+        of the first layer of systems scales with the number of nonzero
+        values instead of rows times columns.
+
+        Args:
+            tables (list of str or None, optional): names of tables to
+                convert. Default value None converts all tables.
+
+        Returns:
+            Bool which is True if and only if no error occured.
+
+        """
+
+        if tables is None: tables = list(self._tables.keys())
+        for table in tables:
+            if not table in self._tables:
+                return nemoa.log('error', """could not convert table:
+                    unknown table name '%s'.""" % table)
+            if nemoa.common.sparse.issparse(self._tables[table]):
+                continue
+            self._tables[table] = \
+                nemoa.common.sparse.fromrecarray(self._tables[table])
+
+        return True
+
+    def _set_memmap(self, tables = None, path = None):
+        """Convert tables to memory mapped tables.
+
+        The tables are copied by chunks of rows to numpy files, which
+        are mapped to memory. Thereby tables, which are already memory
+        mapped read only or copy on write, for example by numpy
+        directory archives, are converted to writeable tables, such
+        that normalization and transformation do not allocate memory
+        for the whole table.
+
+        Args:
+            tables (list of str or None, optional): names of tables to
+                convert. Default value None converts all tables.
+            path (str or None, optional): directory of numpy files.
+                Default value None uses the cache directory.
+
+        Returns:
+            Bool which is True if and only if no error occured.
+
+        """
+
+        if tables is None: tables = list(self._tables.keys())
+        for table in tables:
+            if not table in self._tables:
+                return nemoa.log('error', """could not map table:
+                    unknown table name '%s'.""" % table)
+            src = self._tables[table]
+            if nemoa.common.sparse.issparse(src):
+                return nemoa.log('error', """could not map table:
+                    table '%s' is sparse.""" % table)
+            if self._memmap is None: self._memmap = set()
+            if self._get_memmap(table) and src.mode in ['r+', 'w+']:
+                continue
+            array = self._get_memmap_array(table, src.shape[0],
+                src.dtype.descr, path = path)
+            if array is None: return False
+            for rows in nemoa.common.stream.chunks(src.shape[0],
+                self._config.get('chunksize', None)):
+                array[rows] = src[rows]
+            self._tables[table] = array
+            self._memmap.add(table)
+
+        return True
+
+    def _set_dtype(self, dtype = None, tables = None):
+        """Convert data columns of tables to given data type.
+
+        Memory mapped tables are converted by chunks of rows to new
+        memory mapped tables, such that the conversion of single
+        precision tables does not allocate memory for the whole table.
+
+        Args:
+            dtype (str or None, optional): numpy float data type, e.g.
+                'float32'. Default value None uses the data type given
+                by the configuration key 'dtype'.
+            tables (list of str or None, optional): names of tables to
+                convert. Default value None converts all tables.
+
+        Returns:
+            Bool which is True if and only if no error occured.
+
+        """
+
+        if dtype is None: dtype = self._get_dtype()
+        try: dtype = numpy.dtype(dtype)
+        except TypeError: dtype = None
+        if dtype is None or not dtype.kind == 'f':
+            return nemoa.log('error', """could not set data type:
+                float data type is required.""")
+        self._config['dtype'] = dtype.name
+
+        if tables is None: tables = list(self._tables.keys())
+        for table in tables:
+            if not table in self._tables:
+                return nemoa.log('error', """could not convert table:
+                    unknown table name '%s'.""" % table)
+            src = self._tables[table]
+            if nemoa.common.sparse.issparse(src):
+                if src.data.dtype == dtype: continue
+                src.data = src.data.astype(dtype)
+                continue
+            descr = [(name, fmt) if name == 'label' else (name, dtype.str)
+                for name, fmt in src.dtype.descr]
+            if numpy.dtype(descr) == src.dtype: continue
+            if self._get_memmap(table):
+                array = self._get_memmap_array(table, src.shape[0], descr)
+                if array is None: return False
+                for rows in self._get_chunks(table):
+                    array[rows] = src[rows].astype(descr)
+            else:
+                array = src.astype(descr).view(numpy.recarray)
+            self._tables[table] = array
+
+        return True
+
     def _set_copy(self, config = None, tables = None):
         """Set dataset configuration and dataset tables.
 
@@ -1307,6 +1720,7 @@ class Dataset(nemoa.common.classes.Metadata):
 
         # 2do: reconfigure!?
         self._tables = {}
+        self._memmap = set()
 
         return True
 
@@ -1323,18 +1737,20 @@ class Dataset(nemoa.common.classes.Metadata):
 
         if not tables: return True
         self._tables = nemoa.common.dict.merge(tables, self._tables)
+        if self._memmap: self._memmap -= set(tables.keys())
 
-        return True
+        return self._set_dtype()
 
+    @nemoa.common.trace.traced('dataset.evaluate')
     def evaluate(self, name = None, *args, **kwargs):
         """Evaluate dataset."""
 
-        algorithms = self._get_algorithms(attribute = 'reference')
-        if not name in list(algorithms.keys()):
+        algorithm = self._get_algorithm(name, attribute = 'reference')
+        if not algorithm:
             return nemoa.log('error', """could not evaluate dataset:
                 unknown algorithm name '%s'.""" % (name))
 
-        return algorithms[name](*args, **kwargs)
+        return algorithm(*args, **kwargs)
 
     @nemoa.common.decorators.algorithm(
         name     = 'sample',
@@ -5,6 +5,7 @@ __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
 import nemoa
+import nemoa.dataset.commons.labels.cache
 import numpy
 import importlib
 
@@ -60,3 +61,34 @@ def convert(list, input, output = None, filter = False):
     if input_dtype == 'nparray':
         return numpy.asarray(output_list), numpy.asarray(output_lost)
     return output_list, output_lost
+
+def seed(path, input, output, **kwargs):
+    """Seed label conversion cache from local mapping file.
+
+    Args:
+        path (str): path of text file with one label conversion per
+            line, e.g. exported annotation tables.
+        input (str): input label format, e.g. 'gene:hgu133a'
+        output (str): output label format, e.g. 'gene:entrezid'
+        **kwargs: see nemoa.dataset.commons.labels.cache.seed
+
+    Returns:
+        Bool which is True if and only if no error occured.
+
+    """
+
+    if not ':' in input or not ':' in output:
+        return nemoa.log('error', """could not seed label conversion
+            cache: label formats are required to be given by
+            'class:format'.""")
+
+    input_class, input_format = \
+        [s.strip() for s in input.lower().split(':')[:2]]
+    output_class, output_format = \
+        [s.strip() for s in output.lower().split(':')[:2]]
+    if input_class != output_class:
+        return nemoa.log('warning', "'%s' can not be converted to '%s'"
+            % (input_class, output_class))
+
+    return nemoa.dataset.commons.labels.cache.seed(path,
+        input_class, input_format, output_format, **kwargs)
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import nemoa
+import numpy
+import os
+
+# memory mapped cache files, indexed by path and modification time
+_mapped = {}
+
+# cached value of labels, which could not be converted
+unknown = ''
+
+def getpath(category, infmt, outfmt, create = False):
+    """Get base path of label conversion cache files.
+
+    The label conversion cache uses a pair of numpy files per
+    conversion: '<base>.keys.npy' contains the sorted input labels and
+    '<base>.values.npy' contains the corresponding output labels. The
+    files are stored in the cache directory of the current workspace.
+
+    Args:
+        category (str): label category, e.g. 'gene'
+        infmt (str): input label format
+        outfmt (str): output label format
+        create (bool, optional): create cache directory if it does
+            not exist.
+
+    Returns:
+        String containing the base path of the cache files or None if
+        no workspace is opened.
+
+    """
+
+    if not nemoa.get('workspace'): return None
+
+    name = '%s.%s.%s' % (category, infmt, outfmt)
+    return nemoa.path('expand', (nemoa.path('cache'), 'labels', name),
+        create = create)
+
+def load(category, infmt, outfmt):
+    """Get memory mapped keys and values of label conversion cache.
+
+    Returns:
+        Tuple with memory mapped numpy arrays (keys, values) or None,
+        if no cache exists for the given conversion.
+
+    """
+
+    base = getpath(category, infmt, outfmt)
+    if not base: return None
+    keyfile = base + '.keys.npy'
+    valfile = base + '.values.npy'
+    if not os.path.isfile(keyfile) or not os.path.isfile(valfile):
+        return None
+
+    mtime = os.path.getmtime(valfile)
+    if _mapped.get(base, (None, ))[0] != mtime:
+        _mapped[base] = (mtime,
+            numpy.load(keyfile, mmap_mode = 'r'),
+            numpy.load(valfile, mmap_mode = 'r'))
+
+    return _mapped[base][1:]
+
+def lookup(labels, category, infmt, outfmt):
+    """Lookup converted labels in label conversion cache.
+
+    The lookup uses a binary search within the memory mapped sorted
+    keys, such that only the pages of the cache files, which are
+    needed for the given labels are read from disk.
+
+    Args:
+        labels (list of str): input labels
+        category (str): label category, e.g. 'gene'
+        infmt (str): input label format
+        outfmt (str): output label format
+
+    Returns:
+        List with converted labels, which contains None for labels
+        that are not found in the cache and the value of 'unknown' for
+        labels that are known to be not convertible.
+
+    """
+
+    cache = load(category, infmt, outfmt)
+    if not cache or not len(labels): return [None] * len(labels)
+
+    keys, values = cache
+    search = numpy.asarray(labels, dtype = str)
+    pos = numpy.searchsorted(keys, search)
+    pos[pos == keys.size] = 0
+    found = keys[pos] == search
+
+    return [str(values[p]) if f else None
+        for p, f in zip(pos.tolist(), found.tolist())]
+
+def update(mapping, category, infmt, outfmt):
+    """Add label conversions to label conversion cache.
+
+    Labels, which could not be converted, are added with the value of
+    'unknown', such that they are not converted again. Later updates
+    with converted labels, e.g. by seed(), replace these values. If no
+    workspace is opened, the conversions are not cached.
+
+    Args:
+        mapping (dict): dictionary with input labels as keys and
+            converted labels or the value of 'unknown' as values
+        category (str): label category, e.g. 'gene'
+        infmt (str): input label format
+        outfmt (str): output label format
+
+    Returns:
+        Bool which is True if and only if no error occured.
+
+    """
+
+    if not mapping: return True
+    if not getpath(category, infmt, outfmt): return True
+
+    # merge with existing cache
+    cache = load(category, infmt, outfmt)
+    if cache:
+        merged = dict(zip(cache[0].tolist(), cache[1].tolist()))
+        merged.update(mapping)
+    else: merged = dict(mapping)
+
+    keys = numpy.asarray(sorted(merged.keys()), dtype = str)
+    values = numpy.asarray([merged[key] for key in keys.tolist()],
+        dtype = str)
+
+    # write to temporary files and replace cache files
+    base = getpath(category, infmt, outfmt, create = True)
+    try:
+        for suffix, array in [('.keys.npy', keys), ('.values.npy', values)]:
+            with open(base + suffix + '.tmp', 'wb') as fh:
+                numpy.save(fh, array)
+        for suffix in ['.keys.npy', '.values.npy']:
+            os.replace(base + suffix + '.tmp', base + suffix)
+    except OSError:
+        return nemoa.log('error', """could not update label conversion
+            cache '%s'.""" % base)
+
+    if base in _mapped: del _mapped[base]
+
+    return True
+
+def seed(path, category, infmt, outfmt, delim = None, usecols = (0, 1)):
+    """Seed label conversion cache from local mapping file.
+
+    Args:
+        path (str): path of text file with one label conversion per
+            line. Empty lines and lines starting with '#' are ignored.
+        category (str): label category, e.g. 'gene'
+        infmt (str): input label format
+        outfmt (str): output label format
+        delim (str, optional): column delimiter. By default the
+            delimiter is determined from the file.
+        usecols (2-tuple of int, optional): columns which contain the
+            input labels and the output labels.
+
+    Returns:
+        Bool which is True if and only if no error occured.
+
+    """
+
+    if not getpath(category, infmt, outfmt):
+        return nemoa.log('error', """could not seed label conversion
+            cache: no workspace has been opened.""")
+    if not os.path.isfile(path):
+        return nemoa.log('error', """could not seed label conversion
+            cache: file '%s' does not exist.""" % path)
+
+    if delim is None: delim = nemoa.common.csvfile.getdelim(path) or None
+
+    mapping = {}
+    with open(path, 'r') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line.startswith('#'): continue
+            cols = [col.strip(' "\'') for col in line.split(delim)]
+            if len(cols) <= max(usecols): continue
+            key, val = cols[usecols[0]], cols[usecols[1]]
+            if not key or not val or key in mapping: continue
+            mapping[key] = val
+
+    nemoa.log("seed label conversion cache '%s' -> '%s' with %i labels."
+        % (infmt, outfmt, len(mapping)))
+
+    return update(mapping, category, infmt, outfmt)
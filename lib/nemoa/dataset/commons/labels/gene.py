@@ -11,8 +11,14 @@ class gene:
 
     robjects = None
     default = 'entrezid'
+    annotationdbi = [
+        'hgu95a', 'hgu95av2', 'hgu95b', 'hgu95c', 'hgu95d',
+        'hgu95e', 'hgu133a', 'hgu133a2', 'hgu133b', 'hgu133plus2',
+        'hthgu133a', 'hgug4100a', 'hgug4101a', 'hgug4110b',
+        'hgug4111a', 'hgug4112a', 'hguqiagenv3' ]
 
-    def __init__(self):
+    def _import_rpy2(self):
+        """Import rpy2 on demand, since cached conversions need no R."""
 
         stdout = sys.stdout
 
@@ -23,8 +29,9 @@ class gene:
             sys.stdout = stdout
         except:
             sys.stdout = stdout
-            nemoa.log('error',
-                "could not import python package 'rpy2'!")
+            return False
+
+        return True
 
     def _exec_rcmd(self, rcmd = None):
         if not rcmd: return True
@@ -84,103 +91,133 @@ class gene:
 
     def convert_list(self, inlist, infmt, outfmt, filter = False,
         unique = True):
-        """Return list with converted gene labels using R/bioconductor"""
+        """Return list with converted gene labels.
+
+        Converted labels are looked up in the label conversion cache of
+        the workspace. Only labels, which are not found in the cache
+        are converted using R/bioconductor and afterwards added to the
+        cache, such that offline runs can reuse earlier conversions.
+        Labels, which have been passed to R, but could not be converted,
+        are also added to the cache, such that they are not passed to R
+        again. If R is not available, nothing is cached.
+
+        """
 
         if not outfmt or outfmt == 'default': outfmt = self.default
         if infmt == outfmt: return inlist, []
-        if not self.robjects:
-            nemoa.log('error', """could not convert gene labels:
-                python package 'rpy2' is not installed!""")
-            return inlist, list(range(len(inlist)))
 
         # make local copy of list
         inlist = list(inlist)[:]
 
+        # strip leading 'X' for column select of AnnotationDBI packages
+        if infmt in self.annotationdbi:
+            slist = [a.lstrip('X') for a in inlist]
+        else: slist = inlist
+        slist = [label.strip(' ,\n\t\"') for label in slist]
+
+        # lookup labels in cache and convert missing labels using R
+        cache = nemoa.dataset.commons.labels.cache
+        converted = cache.lookup(slist, 'gene', infmt, outfmt)
+        missing = [label for label, conv in zip(slist, converted)
+            if conv is None]
+        if missing:
+            mapping = self._convert_list_rcmd(missing, infmt, outfmt)
+            if mapping == None: return inlist, []
+            mapping = { label: mapping.get(label, cache.unknown)
+                for label in missing }
+            cache.update(mapping, 'gene', infmt, outfmt)
+            converted = [mapping.get(label) if conv is None else conv
+                for label, conv in zip(slist, converted)]
+
+        # apply converted labels
+        blist = []
+        for id, conv in enumerate(converted):
+            if conv is None or conv == cache.unknown:
+                blist.append(id)
+            elif unique and conv in inlist[:id-1]:
+                blist.append(id)
+                n = 2
+                while "%s-%i" % (conv, n) in inlist[:id-1]: n += 1
+                inlist[id] = "%s-%i" % (conv, n)
+            else:
+                inlist[id] = conv
+
+        # filter results
+        if filter:
+            inlist = [item for item in inlist
+                if inlist.index(item) not in blist]
+
+        return inlist, blist
+
+    def _convert_list_rcmd(self, slist, infmt, outfmt):
+        """Convert gene labels using R/bioconductor.
+
+        Returns:
+            Dictionary with converted labels of all labels, which could
+            be converted, or None if the conversion is not supported or
+            if R or the required bioconductor packages are not
+            available.
+
+        """
+
+        if not self.robjects and not self._import_rpy2():
+            nemoa.log('error', """could not convert gene labels:
+                python package 'rpy2' is not installed!""")
+            return None
+
         # convert using various AnnotationDBI packages from Bioconductor
-        if infmt in [
-            'hgu95a', 'hgu95av2', 'hgu95b', 'hgu95c', 'hgu95d',
-            'hgu95e', 'hgu133a', 'hgu133a2', 'hgu133b', 'hgu133plus2',
-            'hthgu133a', 'hgug4100a', 'hgug4101a', 'hgug4110b',
-            'hgug4111a', 'hgug4112a', 'hguqiagenv3' ]:
+        if infmt in self.annotationdbi:
 
             # load package
-            if not self._load_pkg(infmt + '.db'):
-                return inlist, list(range(len(inlist)))
+            if not self._load_pkg(infmt + '.db'): return None
 
             # get listvector
             if not self._exec_cmdlist([
                 "x <- %s%s" % (infmt, outfmt.upper()),
                 "mapped_genes <- mappedkeys(x)",
-                "listmap <- as.list(x[mapped_genes])" ]):
-                return inlist, list(range(len(inlist)))
-
-            # strip leading 'X' for column select
-            slist = [a.lstrip('X') for a in inlist]
+                "listmap <- as.list(x[mapped_genes])" ]): return None
 
         elif infmt == 'entrezid':
 
             # load bioconductor annotation package
-            if not self._load_pkg('org.Hs.eg.db'):
-                return inlist, list(range(len(inlist)))
+            if not self._load_pkg('org.Hs.eg.db'): return None
 
             # get listvector
             if not self._exec_cmdlist([
                 "x <- org.Hs.eg%s" % (outfmt.upper()),
                 "mapped_genes <- mappedkeys(x)",
-                "listmap <- as.list(x[mapped_genes])" ]):
-                return inlist, list(range(len(inlist)))
-
-            # pass list for column select
-            slist = inlist
+                "listmap <- as.list(x[mapped_genes])" ]): return None
 
         elif outfmt == 'entrezid':
 
             # load bioconductor annotation package
-            if not self._load_pkg('org.Hs.eg.db'):
-                return inlist, list(range(len(inlist)))
+            if not self._load_pkg('org.Hs.eg.db'): return None
 
             # get listvector
             if not self._exec_cmdlist([
                 "x <- org.Hs.eg%s2EG" % (infmt.upper()),
                 "mapped_genes <- mappedkeys(x)",
-                "listmap <- as.list(x[mapped_genes])" ]):
-                return inlist, list(range(len(inlist)))
-
-            # pass list for column select
-            slist = inlist
+                "listmap <- as.list(x[mapped_genes])" ]): return None
 
         else:
             nemoa.log('error', """conversion from '%s' to '%s' is not
                 supported""" % (infmt, outfmt))
-            return inlist, []
+            return None
 
         # search listvector
-        blist = []
+        mapping = {}
         nemoa.log('debuginfo', """passing command to R (per column):
             sym <- listmap['COLUMNNAME']; sym <- unlist(sym)""")
         sysstout = sys.stdout
         sys.stdout = NullDevice()
-        for id, label in enumerate(slist):
-            label = label.strip(' ,\n\t\"')
+        for label in slist:
             self.robjects.r("sym <- listmap['%s']" % (label))
             rselect = self.robjects.r("sym <- unlist(sym)")
-            if not hasattr(rselect, '__getitem__'):
-                blist.append(id)
-            elif unique and rselect[0] in inlist[:id-1]:
-                blist.append(id)
-                n = 2
-                while "%s-%i" % (rselect[0], n) in inlist[:id-1]: n += 1
-                inlist[id] = "%s-%i" % (rselect[0], n)
-            else:
-                inlist[id] = rselect[0]
+            if hasattr(rselect, '__getitem__'):
+                mapping[label] = str(rselect[0])
         sys.stdout = sysstout
 
-        # filter results
-        if filter:
-            inlist = [item for item in inlist
-                if inlist.index(item) not in blist]
-
-        return inlist, blist
+        return mapping
 
 class NullDevice():
     def write(self, s): pass
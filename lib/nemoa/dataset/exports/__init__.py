@@ -35,6 +35,7 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('dataset.exports.save')
 def save(dataset, path = None, filetype = None, workspace = None,
     base = 'user', **kwargs):
     """Export dataset to file.
@@ -97,5 +98,6 @@ def save(dataset, path = None, filetype = None, workspace = None,
 
     return False
 
+@nemoa.common.trace.traced('dataset.exports.show')
 def show(dataset, *args, **kwargs):
     return nemoa.dataset.exports.image.show(dataset, *args, **kwargs)
@@ -5,13 +5,13 @@ __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
 import nemoa
-import numpy
 import os
 
 def filetypes():
     """Get supported archive filetypes for dataset export."""
     return {
-        'npz': 'Numpy Zipped Archive' }
+        'npz': 'Numpy Zipped Archive',
+        'npd': 'Numpy Directory Archive' }
 
 def save(dataset, path, filetype, **kwargs):
     """Export dataset to archive file."""
@@ -21,14 +21,47 @@ def save(dataset, path, filetype, **kwargs):
         return nemoa.log('error', """could not export dataset:
             filetype '%s' is not supported.""" % (filetype))
 
-    copy = dataset.get('copy')
+    # the tables are written directly from the dataset
+    copy = dataset.get('copy', deep = False)
+    if filetype == 'npd': return Npd(**kwargs).save(copy, path)
     return Npz(**kwargs).save(copy, path)
 
 class Npz:
-    """Export dataset to numpy zipped archive."""
+    """Export dataset to numpy zipped archive.
+
+    The tables are written to the archive without copies and compressed
+    with the zip compression codec 'codec' ('zlib', 'bz2' or 'lzma')
+    using the compression level 'level'. With the codec 'zlib' blocks
+    of the tables are compressed by 'threads' parallel threads.
+
+    """
+
+    settings = None
+    default = { 'compress': True, 'codec': 'zlib', 'level': 6,
+        'threads': None }
+
+    def __init__(self, **kwargs):
+        self.settings = nemoa.common.dict.merge(kwargs, self.default)
+
+    def save(self, copy, path):
+
+        # create path if not available
+        if not os.path.exists(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        if self.settings['compress']: codec = self.settings['codec']
+        else: codec = None
+        if not nemoa.common.npzfile.dump(copy, path, codec = codec,
+            level = self.settings['level'],
+            threads = self.settings['threads']): return False
+
+        return path
+
+class Npd:
+    """Export dataset to numpy directory archive."""
 
     settings = None
-    default = { 'compress': True }
+    default = {}
 
     def __init__(self, **kwargs):
         self.settings = nemoa.common.dict.merge(kwargs, self.default)
@@ -39,8 +72,6 @@ class Npz:
         if not os.path.exists(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
-        if self.settings['compress']:
-            numpy.savez_compressed(path, **copy)
-        else: numpy.savez(path, **copy)
+        if not nemoa.common.npydir.dump(copy, path): return False
 
         return path
@@ -48,7 +48,7 @@ class Csv:
         # as header as a subset of the dataset configuration
         keys = ['name', 'branch', 'version', 'about', 'author', 'email',
             'license', 'filetype', 'application', 'preprocessing',
-            'type', 'labelformat']
+            'type', 'labelformat', 'dtype']
         config = {}
         for key, val in dataset.get('config').items():
             if key in keys: config[key] = val
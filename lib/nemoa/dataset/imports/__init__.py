@@ -29,13 +29,14 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('dataset.imports.load')
 def load(path, filetype = None, **kwargs):
     """Import dataset dictionary from file or workspace."""
 
     import os
 
     # get path (if necessary)
-    if 'workspace' in kwargs or not os.path.isfile(path):
+    if 'workspace' in kwargs or not os.path.exists(path):
         name = path
         pathkwargs = {}
         if 'workspace' in kwargs:
@@ -46,7 +47,7 @@ def load(path, filetype = None, **kwargs):
         if not path:
             return nemoa.log('warning', """could not import dataset:
                 invalid dataset name.""") or {}
-        if not os.path.isfile(path):
+        if not os.path.exists(path):
             return nemoa.log('warning', """could not import dataset:
                 file '%s' does not exist.""" % path) or {}
 
@@ -11,11 +11,14 @@ def filetypes():
     """Get supported archive filetypes for dataset import."""
 
     return {
-        'npz': 'Numpy Zipped Archive' }
+        'npz': 'Numpy Zipped Archive',
+        'npd': 'Numpy Directory Archive' }
 
 def load(path, **kwargs):
     """Import dataset from archive file."""
 
+    if nemoa.common.ospath.fileext(path).lower() == 'npd':
+        return Npd(**kwargs).load(path)
     return Npz(**kwargs).load(path)
 
 class Npz:
@@ -28,7 +31,29 @@ class Npz:
         self.settings = nemoa.common.dict.merge(kwargs, self.default)
 
     def load(self, path):
+        if nemoa.common.npzfile.isnpzfile(path):
+            return nemoa.common.npzfile.load(path)
+
+        # numpy zipped archives of previous versions
         copy = numpy.load(path)
         return {
             'config': copy['config'].item(),
             'tables': copy['tables'].item() }
+
+class Npd:
+    """Import dataset from numpy directory archive.
+
+    Numpy arrays are loaded as memory maps, such that opening large
+    archives does not read the data until it is accessed.
+
+    """
+
+    settings = None
+    default = { 'mmap_mode': 'c' }
+
+    def __init__(self, **kwargs):
+        self.settings = nemoa.common.dict.merge(kwargs, self.default)
+
+    def load(self, path):
+        return nemoa.common.npydir.load(path,
+            mmap_mode = self.settings['mmap_mode'])
@@ -14,8 +14,18 @@ def filetypes():
         'tsv': 'Tab Separated Values',
         'tab': 'Tab Separated Values'}
 
-def load(path, **kwargs):
-    """Import dataset from text file."""
+def load(path, cache = True, **kwargs):
+    """Import dataset from text file.
+
+    Args:
+        path (str): path of text file
+        cache (bool, optional): if True, the parsed dataset is stored
+            in a binary sidecar within the cache directory of the
+            current workspace and reused as long as path, size and
+            modification time of the text file and the import settings
+            are unchanged.
+
+    """
 
     # get extract filetype from file extension
     filetype = nemoa.common.ospath.fileext(path).lower()
@@ -25,18 +35,111 @@ def load(path, **kwargs):
         return nemoa.log('error', """could not import dataset:
             filetype '%s' is not supported.""" % filetype)
 
+    # try to load dataset from binary sidecar
+    if cache:
+        dataset = Sidecar(path, **kwargs).load()
+        if dataset: return dataset
+
     if filetype == 'csv':
-        return Csv(**kwargs).load(path)
-    if filetype in ['tsv', 'tab']:
-        return Tsv(**kwargs).load(path)
+        dataset = Csv(**kwargs).load(path)
+    elif filetype in ['tsv', 'tab']:
+        dataset = Tsv(**kwargs).load(path)
+    else:
+        return False
+
+    if cache and dataset: Sidecar(path, **kwargs).save(dataset)
+
+    return dataset
+
+class Sidecar:
+    """Binary sidecar cache of dataset text files.
+
+    The sidecar is a numpy directory archive within the cache directory
+    of the current workspace, which contains the dataset configuration,
+    the tables as uncompressed numpy files and the path, size and
+    modification time of the text file together with the import
+    settings, which affect the parsed dataset. Tables are loaded as copy
+    on write memory maps, such that reopening an unchanged dataset does
+    not need to parse or read the whole data. If no workspace is opened,
+    no sidecar is used.
+
+    Args:
+        path (str): path of text file
+        **kwargs: import settings
+
+    """
+
+    path = None
+    settings = None
+    cachedir = None
+
+    # import settings, which do not affect the parsed dataset
+    volatile = ['chunksize', 'threads']
+
+    def __init__(self, path, **kwargs):
+        import hashlib
+        import os
+
+        self.path = os.path.abspath(path)
+        self.settings = { key: repr(val)
+            for key, val in sorted(kwargs.items())
+            if not key in self.volatile }
+        if not nemoa.get('workspace'): return
 
-    return False
+        # sidecars are identified by file name and hash of path
+        digest = hashlib.sha1(self.path.encode('utf-8')).hexdigest()
+        name = '%s.%s' % (os.path.basename(self.path), digest[:16])
+        self.cachedir = nemoa.path('expand',
+            (nemoa.path('cache'), 'imports', name))
+
+    def _get_source(self):
+        import os
+
+        stat = os.stat(self.path)
+        return { 'path': self.path, 'size': stat.st_size,
+            'mtime': stat.st_mtime_ns, 'settings': self.settings }
+
+    def load(self):
+        """Get dataset dictionary from sidecar or None if invalid."""
+
+        import os
+
+        if not self.cachedir or not os.path.isdir(self.cachedir):
+            return None
+
+        try:
+            copy = nemoa.common.npydir.load(self.cachedir)
+            if not copy or not copy['source'] == self._get_source():
+                return None
+        except Exception:
+            return nemoa.log('debuginfo', """could not load sidecar
+                '%s'.""" % self.cachedir) or None
+
+        nemoa.log('debuginfo', "loaded dataset from sidecar '%s'."
+            % self.cachedir)
+
+        return { 'config': copy['config'], 'tables': copy['tables'] }
+
+    def save(self, dataset):
+        """Save dataset dictionary to sidecar."""
+
+        if not self.cachedir: return False
+
+        try:
+            nemoa.common.npydir.dump({ 'source': self._get_source(),
+                'config': dataset['config'],
+                'tables': dataset['tables'] }, self.cachedir)
+        except Exception:
+            return nemoa.log('debuginfo', """could not save sidecar
+                '%s'.""" % self.cachedir) or False
+
+        return True
 
 class Csv:
     """Import dataset from Comma Separated Values."""
 
     settings = None
-    default = { 'delimiter': ',' }
+    default = { 'delimiter': None } # detect delimiter from file
 
     def __init__(self, **kwargs):
         self.settings = nemoa.common.dict.merge(kwargs, self.default)
@@ -50,8 +153,14 @@ class Csv:
 
         """
 
+        # get header, column labels and data in a single pass
+        retval = nemoa.common.csvfile.read(path,
+            **{key: val for key, val in self.settings.items()
+            if key in ['delimiter', 'chunksize', 'threads', 'missing']})
+        if not retval: return retval
+        header, labels, rowlabels, matrix = retval
+
         # get config from csv header
-        header = nemoa.common.csvfile.getheader(path)
 
         structure = {
             'name': 'str',
@@ -65,7 +174,8 @@ class Csv:
             'application': 'str',
             'preprocessing': 'dict',
             'type': 'str',
-            'labelformat': 'str' }
+            'labelformat': 'str',
+            'dtype': 'str' }
 
         config = nemoa.common.inifile.loads(header, nosection = True,
             structure = structure)
@@ -82,7 +192,9 @@ class Csv:
         config['colfilter'] = {'*': ['*:*']}
         config['rowfilter'] = {'*': ['*:*'], name: [name + ':*']}
 
-        data = nemoa.common.csvfile.load(path)
+        data = nemoa.common.csvfile.torecarray(labels, rowlabels, matrix,
+            dtype = config.get('dtype', '<f8'))
+        del matrix
 
         config['table'] = {name: config.copy()}
         config['table'][name]['fraction'] = 1.0
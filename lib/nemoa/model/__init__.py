@@ -4,12 +4,10 @@ __author__  = 'Patrick Michl'
 __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
-import nemoa.model.builder
-import nemoa.model.classes
-import nemoa.model.evaluation
-import nemoa.model.exports
-import nemoa.model.imports
-import nemoa.model.morphisms
+import nemoa.common.module
+
+__getattr__, __dir__ = nemoa.common.module.lazy(__name__, [
+    'builder', 'classes', 'evaluation', 'exports', 'imports', 'morphisms' ])
 
 def build(*args, **kwargs):
     """Create model dictionary from building script."""
@@ -5,6 +5,7 @@ __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
 import nemoa
+import numpy
 
 class TestSuite(nemoa.common.unittest.TestSuite):
 
@@ -13,6 +14,23 @@ class TestSuite(nemoa.common.unittest.TestSuite):
             model = nemoa.model.open('test', workspace = 'testsuite')
             test = nemoa.common.type.ismodel(model)
             self.assertTrue(test)
+        with self.subTest(components = ('system', )):
+            model = nemoa.model.open('test', workspace = 'testsuite',
+                components = ('system', ))
+            test = nemoa.common.type.issystem(model.system) \
+                and model.dataset is None and model.network is None
+            self.assertTrue(test)
+        with self.subTest(state = 'save partially loaded model'):
+            import os
+            import tempfile
+            path = os.path.join(tempfile.mkdtemp(), 'test.npz')
+            model = nemoa.model.open('test', workspace = 'testsuite',
+                components = ('system', ))
+            test = not nemoa.model.save(model, path = path) \
+                and not os.path.exists(path) \
+                and 'system' in model.get('copy')
+            os.rmdir(os.path.dirname(path))
+            self.assertTrue(test)
 
     def test_model_ann(self):
         with self.subTest(state = 'create shallow ann'):
@@ -25,6 +43,231 @@ class TestSuite(nemoa.common.unittest.TestSuite):
             test = model.error < 0.1
             self.assertTrue(test)
 
+    def test_model_ann_bprop(self):
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'deep', system = 'ann')
+        with self.subTest(state = 'forward pass'):
+            optimizer = nemoa.model.morphisms.new(model)
+            mapping = model.system.mapping
+            data = model.dataset.get('data', cols = mapping[0])
+            values, preacts = optimizer._bprop_forward(data)
+            test = numpy.allclose(values[mapping[-1]],
+                model.system._get_unitexpect(data, mapping))
+            self.assertTrue(test)
+
+    def test_model_ann_sparse(self):
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'shallow', system = 'ann')
+        model.dataset.set('sparse')
+        with self.subTest(state = 'optimize with sparse input'):
+            weights = model.system._params['links'][(0, 1)]['W'].copy()
+            optimizer = nemoa.model.morphisms.new(model)
+            test = optimizer.optimize(updates = 100,
+                tracker_eval_enable = False)
+            data = optimizer.get('training_data')
+            test = test and nemoa.common.sparse.issparse(data[0]) \
+                and isinstance(data[1], numpy.ndarray) \
+                and not numpy.allclose(weights,
+                model.system._params['links'][(0, 1)]['W'])
+            self.assertTrue(test)
+
+    def test_model_ann_flat(self):
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'deep', system = 'ann')
+        with self.subTest(state = 'optimize with flat parameters'):
+            model.system.set('flat')
+            vector = model.system.get('flat')
+            initial = vector.copy()
+            model.optimize(algorithm = 'rprop', updates = 100,
+                tracker_eval_enable = False)
+            test = model.system.get('flat') is vector \
+                and not numpy.allclose(vector, initial)
+            self.assertTrue(test)
+        with self.subTest(state = 'optimize after replacing parameters'):
+            model.system.set('copy', **model.system.get('copy'))
+            weights = model.system._params['links'][(0, 1)]['W']
+            initial = weights.copy()
+            model.optimize(algorithm = 'rprop', updates = 20,
+                tracker_eval_enable = False)
+            weights = model.system._params['links'][(0, 1)]['W']
+            vector = model.system.get('flat')
+            test = vector is not None \
+                and numpy.may_share_memory(weights, vector) \
+                and not numpy.allclose(weights, initial)
+            self.assertTrue(test)
+
+    def test_model_ann_source(self):
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'shallow', system = 'ann')
+        with self.subTest(state = 'optimize from source'):
+            source = (model.dataset.get('data', size = 100,
+                output = 'recarray') for i in range(10))
+            optimizer = nemoa.model.morphisms.new(model)
+            update = optimizer._bprop_update
+            updates = []
+            optimizer._bprop_update = lambda *args: \
+                updates.append(True) or update(*args)
+            test = optimizer.optimize(source = source, updates = 1000,
+                tracker_eval_enable = False)
+            # every minibatch is trained once, no more after exhaustion
+            test = test and len(updates) == 10
+            self.assertTrue(test)
+        with self.subTest(state = 'corrupt tuples from source'):
+            mapping = model.system.mapping
+            data = model.dataset.get('data', size = 100,
+                cols = (mapping[0], mapping[-1]))
+            source = iter([(data[0].copy(), data[1].copy())])
+            optimizer = nemoa.model.morphisms.new(model)
+            optimizer.optimize(source = source, noise_enable = True,
+                noise_type = 'mask', noise_factor = .5,
+                tracker_eval_enable = False)
+            batch = optimizer.get('training_data')
+            test = numpy.sum(batch[0] == 0.) > numpy.sum(data[0] == 0.)
+            self.assertTrue(test)
+
+    def test_model_ann_control(self):
+        import os
+        import tempfile
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'shallow', system = 'ann')
+        path = os.path.join(tempfile.mkdtemp(), 'control')
+        with open(path, 'w') as fh: fh.write('q')
+        with self.subTest(state = 'stop by control file'):
+            optimizer = nemoa.model.morphisms.new(model)
+            optimizer.optimize(updates = 1000, control = 'file',
+                control_path = path, control_epochs = 10,
+                control_interval = 0, tracker_eval_enable = False)
+            test = optimizer._get_epoch() == 10 \
+                and not os.path.exists(path)
+            if os.path.exists(path): os.remove(path)
+            os.rmdir(os.path.dirname(path))
+            self.assertTrue(test)
+
+    def test_model_ann_profile(self):
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'shallow', system = 'ann')
+        optimizer = nemoa.model.morphisms.new(model)
+        optimizer.optimize(updates = 100, profile_enable = True,
+            tracker_eval_enable = False)
+        profile = optimizer.get('profile')
+        with self.subTest(state = 'profile phases'):
+            # the last update terminates the training loop, such that
+            # no further data is requested
+            test = profile['data']['calls'] == optimizer.get('epoch') - 1 \
+                and profile['total']['time'] >= profile['update']['time']
+            self.assertTrue(test)
+        with self.subTest(state = 'remove wrappers'):
+            test = not '_bprop_update' in optimizer.__dict__
+            self.assertTrue(test)
+
+    def test_model_ann_memory(self):
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'shallow', system = 'ann')
+        optimizer = nemoa.model.morphisms.new(model)
+        optimizer.optimize(updates = 100, tracker_memory_enable = True,
+            tracker_eval_enable = False)
+        with self.subTest(state = 'memory of model'):
+            memory = model.get('memory')
+            test = memory['total'] == sum(memory[key]['total']
+                for key in ['dataset', 'network', 'system']) \
+                and memory['system']['params'] > 0
+            self.assertTrue(test)
+        with self.subTest(state = 'memory of optimizer'):
+            memory = optimizer.get('memory')
+            test = memory['training'] > 0 and memory['peak']['peak'] > 0
+            self.assertTrue(test)
+
+    def test_model_ann_checkpoint(self):
+        import os
+        import shutil
+        import tempfile
+        model = nemoa.model.create(
+            dataset = 'linear', network = 'shallow', system = 'ann')
+        path = os.path.join(tempfile.mkdtemp(), 'checkpoint')
+        try:
+            with self.subTest(state = 'write checkpoint'):
+                test = model.optimize(updates = 100,
+                    checkpoint_path = path, tracker_eval_enable = False)
+                self.assertTrue(test and os.path.isdir(path))
+            with self.subTest(state = 'restore from checkpoint'):
+                other = nemoa.model.create(
+                    dataset = 'linear', network = 'shallow', system = 'ann')
+                optimizer = nemoa.model.morphisms.new(other)
+                optimizer.set('config')
+                optimizer.set('buffer', 'reset')
+                optimizer.set('checkpoint', path)
+                params = model.system._params['links']
+                test = optimizer.get('epoch') == 100 \
+                    and all(numpy.array_equal(params[link]['W'],
+                    other.system._params['links'][link]['W'])
+                    for link in params)
+                self.assertTrue(test)
+            with self.subTest(state = 'resume from checkpoint'):
+                test = model.optimize(updates = 200, resume = path,
+                    tracker_eval_enable = False)
+                self.assertTrue(test)
+            with self.subTest(state = 'unwritable checkpoint path'):
+                # the checkpoint directory can not be created within a
+                # file, such that every write of the checkpoint fails
+                with open(path + '.file', 'w') as fh: fh.write('')
+                test = model.optimize(updates = 100,
+                    checkpoint_path = os.path.join(path + '.file', 'c'),
+                    checkpoint_epochs = 10, tracker_eval_enable = False)
+                self.assertTrue(test)
+        finally: shutil.rmtree(os.path.dirname(path))
+
+    def test_model_grbm(self):
+        dataset = nemoa.dataset.open('linear', workspace = 'testsuite')
+        columns = dataset.get('columns')
+        for mode in ['sync', 'hogwild']:
+            with self.subTest(state = 'optimize grbm (%s)' % mode):
+                network = nemoa.network.create('factor', name = 'factor',
+                    visible_nodes = columns, visible_type = 'gauss',
+                    hidden_nodes = ['h1', 'h2'], hidden_type = 'sigmoid')
+                model = nemoa.model.create(dataset = 'linear',
+                    network = network, system = 'grbm')
+                initial = model.system._params['links'][(0, 1)]['W'].copy()
+                evaluation = nemoa.model.evaluation.new(model)
+                error = evaluation.evaluate('error')
+                test = model.optimize(updates = 200, parallel_workers = 2,
+                    parallel_mode = mode, tracker_eval_enable = False)
+                weights = model.system._params['links'][(0, 1)]['W']
+                test = test and weights.base is None \
+                    and not numpy.allclose(weights, initial) \
+                    and evaluation.evaluate('error') < error
+                self.assertTrue(test)
+
+    def test_model_grbm_checkpoint(self):
+        import os
+        import shutil
+        import tempfile
+        dataset = nemoa.dataset.open('linear', workspace = 'testsuite')
+        network = nemoa.network.create('factor', name = 'factor',
+            visible_nodes = dataset.get('columns'), visible_type = 'gauss',
+            hidden_nodes = ['h1', 'h2'], hidden_type = 'sigmoid')
+        model = nemoa.model.create(dataset = 'linear',
+            network = network, system = 'grbm')
+        path = os.path.join(tempfile.mkdtemp(), 'checkpoint')
+        try:
+            with self.subTest(state = 'restore adapted update rate'):
+                # the initial update rate is above the maximum rate of
+                # the rate adaption, such that it is always adapted
+                optimizer = nemoa.model.morphisms.new(model)
+                optimizer.optimize(updates = 300, acc_module = 'vmra',
+                    update_rate = .1, checkpoint_path = path,
+                    tracker_eval_enable = False)
+                rate = optimizer._config['update_rate']
+                resumed = nemoa.model.morphisms.new(model)
+                resumed.set('config', acc_module = 'vmra',
+                    update_rate = .1)
+                resumed.set('buffer', 'reset')
+                initial = resumed._config['update_rate']
+                resumed.set('checkpoint', path)
+                test = rate != initial \
+                    and resumed._config['update_rate'] == rate
+                self.assertTrue(test)
+        finally: shutil.rmtree(os.path.dirname(path))
+
     def test_model_dbn(self):
         with self.subTest(state = 'create dbn'):
             model = nemoa.model.create(
@@ -26,7 +26,9 @@ class Model(nemoa.common.classes.Metadata):
         branch (str): Name of a duplicate of the original resource.
             Hint: Read- & writeable wrapping attribute to get('branch')
                 and set('branch', str).
-        dataset (dataset instance):
+        dataset (dataset instance): Dataset of the model. If the model
+            is imported from a file, the dataset is loaded on first
+            access.
         email (str): Email address to a person, an organization, or a
             service that is responsible for the content of the resource.
             Hint: Read- & writeable wrapping attribute to get('email')
@@ -46,7 +48,9 @@ class Model(nemoa.common.classes.Metadata):
         name (str): Name of the resource.
             Hint: Read- & writeable wrapping attribute to get('name')
                 and set('name', str).
-        network (network instance):
+        network (network instance): Network of the model. If the model
+            is imported from a file, the network is loaded on first
+            access.
         path (str):
             Hint: Read- & writeable wrapping attribute to get('path')
                 and set('path', str).
@@ -54,7 +58,9 @@ class Model(nemoa.common.classes.Metadata):
             of output units defined by:
                 precision := 1 - dev(residuals) / dev(data).
             Hint: Readonly wrapping attribute to get('precision')
-        system (system instance):
+        system (system instance): System of the model. If the model
+            is imported from a file, the system is loaded on first
+            access.
         type (str): String concatenation of module name and class name
             of the instance.
             Hint: Readonly wrapping attribute to get('type')
@@ -64,14 +70,20 @@ class Model(nemoa.common.classes.Metadata):
 
     """
 
-    dataset  = None
-    network  = None
-    system   = None
-
     _config  = None
+    _lazy    = None
     _default = {}
     _attr    = { 'error': 'r', 'accuracy': 'r', 'precision': 'r' }
 
+    def __getattr__(self, key):
+        """Attribute wrapper for lazy loaded model components."""
+
+        if key in ['dataset', 'network', 'system']:
+            return self._get_component(key)
+
+        return nemoa.common.classes.Metadata.__getattr__(self, key)
+
+    @nemoa.common.trace.traced('model.configure')
     def configure(self):
         """Configure model."""
 
@@ -96,6 +108,7 @@ class Model(nemoa.common.classes.Metadata):
 
         return retval
 
+    @nemoa.common.trace.traced('model.initialize')
     def initialize(self):
         """Initialize model parameters."""
 
@@ -120,6 +133,7 @@ class Model(nemoa.common.classes.Metadata):
 
         return retval
 
+    @nemoa.common.trace.traced('model.optimize')
     def optimize(self, *args, **kwargs):
         """Optimize model parameters."""
         return nemoa.model.optimize(self, *args, **kwargs)
@@ -140,6 +154,7 @@ class Model(nemoa.common.classes.Metadata):
         if key == 'error': return self.evaluate('system', 'error')
         if key == 'accuracy': return self.evaluate('system', 'accuracy')
         if key == 'precision': return self.evaluate('system', 'precision')
+        if key == 'memory': return self._get_memory(*args, **kwargs)
 
         # direct access
         if key == 'copy': return self._get_copy(*args, **kwargs)
@@ -176,15 +191,57 @@ class Model(nemoa.common.classes.Metadata):
 
         return found[0]
 
-    def _get_copy(self, key = None, *args, **kwargs):
-        """Get model copy as dictionary."""
+    def _get_memory(self, memo = None):
+        """Get memory, which is held by the model.
+
+        Components, which are lazy loaded and have not been accessed,
+        are not loaded and hold no memory.
+
+        Args:
+            memo (set, optional): ids of objects, which have already
+                been counted
+
+        Returns:
+            Dictionary with the memory of the components 'dataset',
+            'network' and 'system', as returned by their key 'memory',
+            and the total number of bytes ('total').
+
+        """
+
+        if memo is None: memo = set()
+
+        memory = {}
+        for key in ['dataset', 'network', 'system']:
+            component = self.__dict__.get(key, None)
+            memory[key] = component._get_memory(memo) if component \
+                else { 'total': 0 }
+        memory['total'] = sum(val['total'] for val in memory.values())
+
+        return memory
 
-        if key == None: return {
-            'config': self._get_config(),
-            'dataset': self._get_dataset(),
-            'network': self._get_network(),
-            'system': self._get_system()
-        }
+    def _get_copy(self, key = None, *args, deep = True, **kwargs):
+        """Get model copy as dictionary.
+
+        Args:
+            deep (bool, optional): if False, the dictionary references
+                the configuration, the dataset tables and the system
+                parameters of the model instead of copies, for example
+                to write them to files.
+
+        """
+
+        # components, which have not been loaded, like components
+        # which are excluded from import, are not included
+        if key == None:
+            copy = { 'config': self._get_config() if deep
+                else self._config }
+            if self.dataset is not None:
+                copy['dataset'] = self.dataset.get('copy', deep = deep)
+            if self.network is not None:
+                copy['network'] = self._get_network()
+            if self.system is not None:
+                copy['system'] = self.system.get('copy', deep = deep)
+            return copy
 
         if key == 'config': return self._get_config(*args, **kwargs)
         if key == 'dataset': return self._get_dataset(*args, **kwargs)
@@ -207,6 +264,31 @@ class Model(nemoa.common.classes.Metadata):
         return nemoa.log('error', """could not get configuration:
             unknown key '%s'.""" % key)
 
+    def _get_component(self, key):
+        """Get model component and load it if necessary.
+
+        Args:
+            key (str): name of component: 'dataset', 'network' or
+                'system'
+
+        Returns:
+            Instance of component or None if the component is not
+            available.
+
+        """
+
+        if key in self.__dict__: return self.__dict__[key]
+        if not self._lazy or not key in self._lazy: return None
+
+        nemoa.log('debuginfo', "loading model component '%s'." % key)
+
+        loader = self._lazy.pop(key)
+        if key == 'dataset': self._set_dataset(loader())
+        elif key == 'network': self._set_network(loader())
+        elif key == 'system': self._set_system(loader())
+
+        return self.__dict__.get(key, None)
+
     def _get_dataset(self, type = 'dict'):
         """ """
 
@@ -282,6 +364,26 @@ class Model(nemoa.common.classes.Metadata):
             self._config = nemoa.common.dict.merge(config, self._config)
         return True
 
+    def _set_lazy(self, key, loader):
+        """Set loader function of lazy loaded model component.
+
+        Args:
+            key (str): name of component: 'dataset', 'network' or
+                'system'
+            loader (function): function, which returns the dictionary
+                of the component
+
+        Returns:
+            bool: True if no error occured
+
+        """
+
+        if self._lazy is None: self._lazy = {}
+        self._lazy[key] = loader
+        self.__dict__.pop(key, None)
+
+        return True
+
     def _set_dataset(self, dataset):
         """Set dataset to model.
 
@@ -291,13 +393,16 @@ class Model(nemoa.common.classes.Metadata):
 
         Args:
             dataset (dict or dataset instance): dataset dictionary
-                or dataset instance
+                or dataset instance. Loader functions, which return a
+                dataset dictionary are called on first access.
 
         Returns:
             bool: True if no error occured
 
         """
 
+        if callable(dataset): return self._set_lazy('dataset', dataset)
+
         if nemoa.common.type.isdataset(dataset):
             self.dataset = dataset
             return True
@@ -320,13 +425,16 @@ class Model(nemoa.common.classes.Metadata):
 
         Args:
             network (dict or network instance): network dictionary
-                or network instance
+                or network instance. Loader functions, which return a
+                network dictionary are called on first access.
 
         Returns:
             bool: True if no error occured
 
         """
 
+        if callable(network): return self._set_lazy('network', network)
+
         if nemoa.common.type.isnetwork(network):
             self.network = network
             return True
@@ -349,13 +457,16 @@ class Model(nemoa.common.classes.Metadata):
 
         Args:
             system (dict or system instance): system dictionary
-                or system instance
+                or system instance. Loader functions, which return a
+                system dictionary are called on first access.
 
         Returns:
             bool: True if no error occured
 
         """
 
+        if callable(system): return self._set_lazy('system', system)
+
         if nemoa.common.type.issystem(system):
             self.system = system
             return True
@@ -369,6 +480,7 @@ class Model(nemoa.common.classes.Metadata):
 
         return True
 
+    @nemoa.common.trace.traced('model.evaluate')
     def evaluate(self, key = None, *args, **kwargs):
         """Evaluate model."""
 
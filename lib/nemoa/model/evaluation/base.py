@@ -7,7 +7,7 @@ __license__ = 'GPLv3'
 import nemoa
 import numpy
 
-class Evaluation:
+class Evaluation(metaclass = nemoa.common.classes.Registry):
 
     _config = None
     _default = {
@@ -37,23 +37,13 @@ class Evaluation:
     def _get_algorithms(self, category = None, attribute = None):
         """Get evaluation algorithms."""
 
-        if not 'algorithms' in self._buffer:
-            self._buffer['algorithms'] = {}
-        algorithms = self._buffer['algorithms'].get(attribute, None)
-        if not algorithms:
-            from nemoa.common.module import getmethods
-            algorithms = getmethods(self, renamekey = 'name',
-                grouping = 'category', attribute = attribute)
-            self._buffer['algorithms'][attribute] = algorithms
-        if category:
-            if not category in algorithms: return {}
-            algorithms = algorithms[category]
-
-        return algorithms
-
-    def _get_algorithm(self, name, *args, **kwargs):
+        return nemoa.common.decorators.getalgorithms(self,
+            category = category, attribute = attribute, grouping = True)
+
+    def _get_algorithm(self, name, category = None, attribute = None):
         """Get evaluation algorithm."""
-        return self._get_algorithms(*args, **kwargs).get(name, None)
+        return nemoa.common.decorators.getalgorithm(self, name,
+            category = category, attribute = attribute)
 
     def _get_data(self):
         """Get data for evaluation.
@@ -252,7 +242,9 @@ class Evaluation:
         # update time and config
         self.model = model
 
-        # initialize data for evaluation
+        # initialize data for evaluation (the buffer is a class
+        # attribute, such that data of other models has to be reset)
+        self._buffer = {}
         self._get_data()
 
         return True
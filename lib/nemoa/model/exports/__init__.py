@@ -29,6 +29,7 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('model.exports.save')
 def save(model, path = None, filetype = None, workspace = None,
     base = 'user', **kwargs):
     """Export model to file.
@@ -48,6 +49,15 @@ def save(model, path = None, filetype = None, workspace = None,
         return nemoa.log('error', """could not export model to file:
             model is not valid.""")
 
+    # models, which have been imported without some of their components
+    # are not exported, since the file would lack these components
+    missing = [key for key in ['dataset', 'network', 'system']
+        if getattr(model, key, None) is None]
+    if missing:
+        return nemoa.log('error', """could not export model to file:
+            model has been imported without components: %s."""
+            % ', '.join(missing))
+
     # get directory, filename and fileextension
     if isinstance(workspace, str) and not workspace == 'None':
         directory = nemoa.path('models',
@@ -88,6 +98,7 @@ def save(model, path = None, filetype = None, workspace = None,
 
     return False
 
+@nemoa.common.trace.traced('model.exports.show')
 def show(model, *args, **kwargs):
     """ """
     return nemoa.model.exports.image.show(model, *args, **kwargs)
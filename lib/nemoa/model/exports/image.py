@@ -6,7 +6,6 @@ __license__ = 'GPLv3'
 
 import importlib
 import nemoa
-import networkx
 import numpy
 import os
 
@@ -109,6 +108,7 @@ class Graph(nemoa.common.plot.Graph):
 
     def create(self, model):
 
+        import networkx
         import nemoa.common.graph as nmgraph
 
         # set plot defaults
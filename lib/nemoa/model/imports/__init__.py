@@ -23,13 +23,14 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('model.imports.load')
 def load(path, filetype = None, **kwargs):
     """Import model dictionary from file or workspace."""
 
     import os
 
     # get path (if necessary)
-    if 'workspace' in kwargs or not os.path.isfile(path):
+    if 'workspace' in kwargs or not os.path.exists(path):
         name = path
         pathkwargs = {}
         if 'workspace' in kwargs:
@@ -40,7 +41,7 @@ def load(path, filetype = None, **kwargs):
         if not path:
             return nemoa.log('warning', """could not import model:
                 invalid model name.""") or {}
-        if not os.path.isfile(path):
+        if not os.path.exists(path):
             return nemoa.log('warning', """could not import model:
                 file '%s' does not exist.""" % path) or {}
 
@@ -10,26 +10,88 @@ import numpy
 def filetypes():
     """Get supported archive filetypes for model import."""
     return {
-        'npz': 'Numpy Zipped Archive' }
+        'npz': 'Numpy Zipped Archive',
+        'npd': 'Numpy Directory Archive' }
 
 def load(path, **kwargs):
     """Import model from archive file."""
+
+    if nemoa.common.ospath.fileext(path).lower() == 'npd':
+        return Npd(**kwargs).load(path)
     return Npz(**kwargs).load(path)
 
+def components(getter, components = None, available = None):
+    """Get model dictionary with lazy loaded components.
+
+    Args:
+        getter (function): function, which returns the dictionary of a
+            given component, i.e. 'dataset', 'network' or 'system'
+        components (tuple of str or None, optional): components to
+            include. Default value None includes all components.
+        available (list of str or None, optional): components, which
+            are contained in the archive. Default value None assumes
+            all components to be contained.
+
+    Returns:
+        Dictionary with model configuration and a loader function for
+        each included component. The components are loaded on first
+        access of the respective model attribute.
+
+    """
+
+    model = { 'config': getter('config') }
+    for key in ['dataset', 'network', 'system']:
+        if components and not key in components: continue
+        if available is not None and not key in available: continue
+        model[key] = (lambda key: lambda: getter(key))(key)
+
+    return model
+
 class Npz:
-    """Import model from numpy zipped archive."""
+    """Import model from numpy zipped archive.
+
+    Numpy zipped archives are read per component, such that components
+    which are not accessed are neither decompressed nor unpickled.
+
+    """
 
     settings = None
-    default = {}
+    default = { 'components': None }
 
     def __init__(self, **kwargs):
         self.settings = nemoa.common.dict.merge(kwargs, self.default)
 
     def load(self, path):
+        if nemoa.common.npzfile.isnpzfile(path):
+            return components(
+                lambda key: nemoa.common.npzfile.load(path, key),
+                self.settings['components'],
+                list(nemoa.common.npzfile.manifest(path).keys()))
+
+        # numpy zipped archives of previous versions
         copy = numpy.load(path, encoding = 'latin1')
 
-        return {
-            'config': copy['config'].item(),
-            'dataset': copy['dataset'].item(),
-            'network': copy['network'].item(),
-            'system': copy['system'].item() }
+        return components(lambda key: copy[key].item(),
+            self.settings['components'], copy.files)
+
+class Npd:
+    """Import model from numpy directory archive.
+
+    Numpy arrays are loaded as memory maps, such that opening large
+    archives does not read the data until it is accessed.
+
+    """
+
+    settings = None
+    default = { 'mmap_mode': 'c', 'components': None }
+
+    def __init__(self, **kwargs):
+        self.settings = nemoa.common.dict.merge(kwargs, self.default)
+
+    def load(self, path):
+        copy = nemoa.common.npydir.load(path,
+            mmap_mode = self.settings['mmap_mode'])
+        if not copy: return copy
+
+        return components(lambda key: copy[key],
+            self.settings['components'], list(copy.keys()))
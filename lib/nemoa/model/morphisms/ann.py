@@ -42,7 +42,8 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
         longname = 'backpropagation of error',
         category = 'optimization',
         type     = 'algorithm',
-        syscheck = None)
+        syscheck = None,
+        sparse   = True)
 
     def _bprop(self):
         """Optimize parameters using backpropagation of error."""
@@ -50,10 +51,11 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
         while self.update():
             # get training data (sample from stratified minibatches)
             data = self._get_data_training()
+            if not data: break
             # forward pass (compute estimations from given input)
-            values = self._bprop_forward(data[0])
+            values, preacts = self._bprop_forward(data[0])
             # backward pass (compute deltas to given output)
-            deltas = self._bprop_backward(data[1], values)
+            deltas = self._bprop_backward(data[1], values, preacts)
             # compute parameter updates
             updates = self._bprop_get_updates(values, deltas)
             # update parameters
@@ -68,26 +70,33 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
         on input layer using current system parameters.
 
         Returns:
-            Dictionary with layers names as keys and expectation values
-            of (the units of) the layers as values, stored in numpy
-            arrays.
+            Tuple of dictionaries (values, preacts) with layers names
+            as keys. The dictionary values contains the expectation
+            values of (the units of) the layers and the dictionary
+            preacts the pre-activations of all but the input layer,
+            which are reused by the backward pass.
 
         """
 
-        mapping = self.model.system._get_mapping()
-        values = {}
-        for lid, layer in enumerate(mapping):
-            if lid == 0:
-                values[layer] = data
-                continue
-            values[layer] = self.model.system._get_unitexpect(
-                values[mapping[lid - 1]], mapping[lid - 1:lid + 1])
-
-        return values
-
-    def _bprop_backward(self, tgtdata, values):
+        system = self.model.system
+        mapping = system._get_mapping()
+        values = { mapping[0]: data }
+        preacts = {}
+        for lid, layer in enumerate(mapping[1:], 1):
+            units = system._units[layer]
+            source = system._units[mapping[lid - 1]].params
+            preacts[layer] = units.preactivation(
+                values[mapping[lid - 1]], source)
+            values[layer] = units.activation(preacts[layer])
+
+        return values, preacts
+
+    def _bprop_backward(self, tgtdata, values, preacts):
         """Backpropagation of error backward pass.
 
+        The deltas are written to buffers, which are allocated once per
+        link layer and reused in subsequent epochs.
+
         Returns:
             Weight delta from backpropagation of error.
 
@@ -101,22 +110,40 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
             src = layers[id]
             tgt = layers[id + 1]
             if id == len(layers) - 2:
-                delta[(src, tgt)] = values[tgt] - tgtdata
+                out = self._bprop_buffer((src, tgt), values[tgt].shape,
+                    numpy.result_type(values[tgt], tgtdata))
+                delta[(src, tgt)] = numpy.subtract(values[tgt], tgtdata,
+                    out = out)
                 continue
-            srcdata = system._units[tgt].params['bias'] \
-                + numpy.dot(values[src],
-                system._params['links'][(id, id + 1)]['W'])
-            grad = system._units[tgt].grad(srcdata)
-            delta[(src, tgt)] = numpy.dot(delta[(tgt, layers[id + 2])],
-                system._params['links'][(id + 1, id + 2)]['W'].T) * grad
+            prev = delta[(tgt, layers[id + 2])]
+            weights = system._params['links'][(id + 1, id + 2)]['W']
+            out = self._bprop_buffer((src, tgt), values[tgt].shape,
+                numpy.result_type(prev, weights))
+            numpy.dot(prev, weights.T, out = out)
+            out *= system._units[tgt].grad(preacts[tgt], values[tgt])
+            delta[(src, tgt)] = out
 
         return delta
 
+    def _bprop_buffer(self, key, shape, dtype):
+        """Get preallocated delta buffer of link layer."""
+
+        buffers = self._buffer['bprop_deltas']
+        out = buffers.get(key, None)
+        if out is None or out.shape != shape or out.dtype != dtype:
+            out = buffers[key] = numpy.empty(shape, dtype = dtype)
+
+        return out
+
     def _bprop_update(self, updates):
-        """Update parameters from dictionary."""
+        """Update parameters from dictionary or flat vector."""
 
         system = self.model.system
 
+        if isinstance(updates, numpy.ndarray):
+            system._get_flat()[...] += updates
+            return True
+
         layers = system._get_mapping()
         for id, layer in enumerate(layers[:-1]):
             src = layer
@@ -154,7 +181,8 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
         longname = 'resiliant backpropagation of error',
         category = 'optimization',
         type     = 'algorithm',
-        syscheck = None)
+        syscheck = None,
+        sparse   = True)
 
     def _rprop(self):
         """Optimize parameters using resiliant backpropagation (RPROP).
@@ -167,10 +195,11 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
 
         while self.update():
             data = self._get_data_training()
+            if not data: break
             # forward pass (compute estimations from given input)
-            values = self._bprop_forward(data[0])
+            values, preacts = self._bprop_forward(data[0])
             # backward pass (compute deltas to given output)
-            deltas = self._bprop_backward(data[1], values)
+            deltas = self._bprop_backward(data[1], values, preacts)
             # compute parameter updates
             updates = self._rprop_get_updates(values, deltas)
             # update parameters
@@ -179,7 +208,17 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
         return True
 
     def _rprop_get_updates(self, out, delta):
-        """ """
+        """Compute RPROP parameter updates from weight deltas.
+
+        Returns:
+            Flat numpy ndarray with updates of all parameters, if the
+            system stores its parameters in a flat vector, otherwise
+            dictionary with updates of units and links.
+
+        """
+
+        if self.model.system._get_flat() is not None:
+            return self._rprop_get_updates_flat(out, delta)
 
         def _get_dict(dict, val): return {key: val * numpy.ones(
             shape = dict[key].shape) for key in list(dict.keys())}
@@ -191,7 +230,7 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
                 sign = numpy.sign(grad[key])
                 a = numpy.sign(prevGrad[key]) * sign
                 magnitude = numpy.maximum(numpy.minimum(
-                    prev_update[key] \
+                    numpy.abs(prev_update[key]) \
                     * (accel[0] * (a == -1) + accel[1] * (a == 0)
                     + accel[2] * (a == 1)), max_factor), min_factor)
                 update[key] = magnitude * sign
@@ -218,7 +257,7 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
 
         # get previous gradients and updates
         prev = self.read('rprop')
-        if not prev:
+        if not prev or not 'update' in prev:
             prev = {
                 'gradient': grad,
                 'update': {'units': {}, 'links': {}}}
@@ -254,3 +293,55 @@ class ANN(nemoa.model.morphisms.base.Optimizer):
         self.write('rprop', gradient = grad, update = update)
 
         return update
+
+    def _rprop_get_updates_flat(self, out, delta):
+        """Compute RPROP updates of flat parameter vector.
+
+        The gradients of all parameters are gathered into a single
+        vector, such that the step sizes are adapted by a few
+        vectorized operations over all parameters.
+
+        """
+
+        # RProp parameters
+        accel = self._config.get('rprop_accel', (.5, 1., 1.2))
+        init_rate = self._config.get('rprop_init_rate', .001)
+        min_factor = self._config.get('rprop_min_factor', .000001)
+        max_factor = self._config.get('rprop_max_factor', 50.)
+
+        system = self.model.system
+        layers = system._get_mapping()
+        vector = system._get_flat()
+
+        # gather gradient from delta rule
+        grad = numpy.zeros_like(vector)
+        for id, src in enumerate(layers[:-1]):
+            tgt = layers[id + 1]
+            units = system._units[tgt].params
+            links = system._params['links'][(id, id + 1)]
+            updu = system._units[tgt].get_updates_delta(delta[src, tgt])
+            updl = nemoa.system.commons.links.Links.get_updates_delta(
+                out[src], delta[src, tgt])
+            for params, upd in [(units, updu), (links, updl)]:
+                for key, val in upd.items():
+                    index = system._get_flat_index(params, key)
+                    if index is not None: grad[index] = val.ravel()
+
+        # get previous gradient and step sizes
+        prev = self.read('rprop')
+        if not prev or not 'step' in prev \
+            or not prev['step'].shape == vector.shape:
+            prev = { 'gradient': grad,
+                'step': numpy.full_like(vector, init_rate) }
+
+        # adapt step sizes to sign changes of gradient
+        sign = numpy.sign(grad)
+        change = numpy.sign(prev['gradient']) * sign
+        factor = numpy.where(change < 0, accel[0],
+            numpy.where(change > 0, accel[2], accel[1]))
+        step = numpy.clip(prev['step'] * factor, min_factor, max_factor)
+
+        # save gradient and step sizes to store
+        self.write('rprop', gradient = grad, step = step)
+
+        return step * sign
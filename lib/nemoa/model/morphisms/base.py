@@ -8,11 +8,27 @@ import nemoa
 import numpy
 import time
 
-class Optimizer:
+class Optimizer(metaclass = nemoa.common.classes.Registry):
 
     _config = None
     _buffer = {}
 
+    # phases of optimization, which are profiled if 'profile_enable' is
+    # set, and the methods, which implement the phases
+    _profile = (
+        ('data', ('_get_data_training', )),
+        ('sampling', ('_cdiv_sampling', '_bprop_forward')),
+        ('gradient', ('_cdiv_delta_visible', '_cdiv_delta_hidden',
+            '_cdiv_delta_links', '_bprop_backward',
+            '_bprop_get_updates', '_rprop_get_updates',
+            '_rprop_get_updates_flat')),
+        ('update', ('_cdiv_update_rate', '_cdiv_update_params',
+            '_bprop_update')),
+        ('control', ('_update_control', )),
+        ('objective', ('_update_objective_function', )),
+        ('evaluation', ('_update_evaluation', )),
+        ('checkpoint', ('_update_checkpoint', )) )
+
     def __init__(self, model = None, *args, **kwargs):
         """Configure tracker to given nemoa system instance."""
         if model: self._set_model(model)
@@ -30,6 +46,8 @@ class Optimizer:
         if key == 'epoch': return self._get_epoch()
         if key == 'estimatetime': return self._get_estimatetime()
         if key == 'progress': return self._get_progress()
+        if key == 'memory': return self._get_memory()
+        if key == 'profile': return self._get_profile()
         if key == 'model': return self._get_model()
 
         if not key in list(self._buffer.keys()): return False
@@ -38,21 +56,13 @@ class Optimizer:
     def _get_algorithms(self, category = None, attribute = None):
         """Get optimization algorithms."""
 
-        algorithms = self._buffer['algorithms'].get(attribute, None)
-        if not algorithms:
-            algorithms = nemoa.common.module.getmethods(self,
-                renamekey = 'name', grouping = 'category',
-                attribute = attribute)
-            self._buffer['algorithms'][attribute] = algorithms
-        if category:
-            if not category in algorithms: return {}
-            algorithms = algorithms[category]
-
-        return algorithms
+        return nemoa.common.decorators.getalgorithms(self,
+            category = category, attribute = attribute, grouping = True)
 
-    def _get_algorithm(self, key, *args, **kwargs):
+    def _get_algorithm(self, key, category = None, attribute = None):
         """Get algorithm provided by transformation."""
-        return self._get_algorithms(*args, **kwargs).get(key, None)
+        return nemoa.common.decorators.getalgorithm(self, key,
+            category = category, attribute = attribute)
 
     def _get_data(self, key, *args, **kwargs):
         """Get data for training or evaluation.
@@ -136,7 +146,10 @@ class Optimizer:
 
         Returns:
             Tuple of numpy arrays containing training data or None
-            if training data could not be retrieved from dataset.
+            if training data could not be retrieved from dataset. For
+            optimization algorithms, which support sparse input data,
+            the input data of datasets with sparse tables is given as
+            sparse table (nemoa.common.sparse.CSR).
 
         """
 
@@ -144,27 +157,103 @@ class Optimizer:
         epoch = self._get_epoch()
         interval = self._config.get('minibatch_update_interval', 1)
 
-        # get training data from dataset
+        # get training data from data source or dataset
         if not data or epoch % interval == 0:
             system = self.model.system
             dataset = self.model.dataset
             mapping = system._get_mapping()
             cols = (mapping[0], mapping[-1])
             size = self._config.get('minibatch_size', 0)
-            if 'noise_enable' in self._config:
+            if self._config.get('noise_enable', False):
                 ntype = self._config.get('noise_type', None)
                 nfactor = self._config.get('noise_factor', 0.)
                 noise = (ntype, nfactor)
             else:
                 noise = (None, 0.)
 
-            data = dataset.get('data', cols = cols,
-                size = size, noise = noise)
+            if self._buffer.get('source', None) is not None:
+                # an exhausted data source terminates the training,
+                # such that the last minibatch is not trained again
+                data = self._get_data_stream(cols, noise)
+            elif self._buffer['training_sparse'] \
+                and dataset.get('sparse'):
+                # sparse tables are kept sparse in the input layer
+                data = dataset.get('data', cols = cols,
+                    size = size, noise = noise, output = 'csr')
+                if data: data = (data[0], data[1].toarray())
+            else:
+                data = dataset.get('data', cols = cols,
+                    size = size, noise = noise)
 
             if data: self._buffer['training_data'] = data
 
         return data or None
 
+    def _get_data_stream(self, cols, noise = (None, 0.)):
+        """Get next minibatch from data source.
+
+        Minibatches are normalized by running statistics, which are
+        updated by each minibatch, such that online training only
+        requires memory for a single minibatch. The normalization
+        follows the distribution of the input layer of the system,
+        analog to the preprocessing of datasets.
+
+        Args:
+            cols (tuple of str): names of column filters (layers)
+            noise (2-tuple, optional): noise model and noise strength
+
+        Returns:
+            Tuple of numpy arrays containing the minibatch data or None
+            if the data source is exhausted.
+
+        """
+
+        batch = next(self._buffer['source'], None)
+        if batch is None:
+            self._buffer['continue'] = False
+            nemoa.log('note', 'data source is exhausted.')
+            return None
+
+        # minibatches, which are given as tuples of layer data are not
+        # normalized, but corrupted by the noise model
+        dataset = self.model.dataset
+        if isinstance(batch, tuple):
+            return dataset._get_data_corrupt(batch,
+                type = noise[0], factor = noise[1])
+
+        # get columns of minibatch as two dimensional array
+        columns = dataset.get('columns')
+        if batch.dtype.names:
+            colnames = dataset._get_colnames()
+            data = numpy.empty((batch.shape[0], len(colnames)))
+            for colid, colname in enumerate(colnames):
+                data[:, colid] = batch[colname]
+        else:
+            data = numpy.asarray(batch, dtype = '<f8')
+        if not data.ndim == 2 or not data.shape[1] == len(columns):
+            return nemoa.log('error', """could not get data from data
+                source: minibatch does not match dataset columns.""")
+
+        # normalize minibatch using running statistics
+        stats = self._buffer['source_stats']
+        if stats is not None:
+            stats.update(data)
+            if isinstance(stats, nemoa.common.stream.Moments):
+                sdev = stats.sdev
+                data = (data - stats.mean) \
+                    / numpy.where(sdev > 0., sdev, 1.)
+            else:
+                data = (data > stats.value).astype(float)
+
+        # split minibatch to columns of layers
+        colids = {col: colid for colid, col in enumerate(columns)}
+        data = tuple(data[:, [colids[col]
+            for col in dataset.get('columns', layer)]]
+            for layer in cols)
+
+        return dataset._get_data_corrupt(data,
+            type = noise[0], factor = noise[1])
+
     def _get_epoch(self):
         """Get current training epoch.
 
@@ -189,6 +278,61 @@ class Optimizer:
         return estim_str
 
 
+    def _get_memory(self):
+        """Get memory, which is held by the optimizer.
+
+        Returns:
+            Dictionary with the number of bytes held by training data
+            and training buffers ('training'), the stored states of
+            optimization algorithms ('store'), the copy of the optimal
+            parameters ('optimum'), the histories of the trackers
+            ('tracker'), the data of the evaluation ('evaluation') and
+            the total number of bytes ('total'). If peak tracking has
+            been enabled by the configuration key
+            'tracker_memory_enable', the key 'peak' contains the peak
+            memory of the last optimization, as described in
+            _set_memory_peak(), which is not included in the total.
+
+        """
+
+        memo = set()
+        nbytes = lambda obj: nemoa.common.ndarray.nbytes(obj, memo)
+        buffer = self._buffer
+        evaluation = getattr(self, 'evaluation', None)
+
+        memory = {
+            'training': nbytes([buffer.get(key) for key in [
+                'training_data', 'evaluation_data', 'source_stats',
+                'bprop_deltas']]),
+            'store': nbytes(buffer.get('store')),
+            'optimum': nbytes(buffer.get('optimum')),
+            'tracker': nbytes([buffer.get('obj_values'),
+                buffer.get('eval_values')]),
+            'evaluation': nbytes(evaluation._buffer.get('data'))
+                if evaluation else 0 }
+        memory['total'] = sum(memory.values())
+        if buffer.get('memory_peak'): memory['peak'] = buffer['memory_peak']
+
+        return memory
+
+    def _get_profile(self):
+        """Get profile of optimization phases.
+
+        Returns:
+            Dictionary with phases of the last profiled optimization
+            as keys and dictionaries with the cumulative wall time in
+            seconds ('time') and the number of calls ('calls') as
+            values. The key 'total' contains the total wall time. None
+            if the optimization has not been profiled.
+
+        """
+
+        profile = self._buffer.get('profile', None)
+        if not profile: return None
+
+        return { phase: { 'time': stats[0], 'calls': stats[1] }
+            for phase, stats in profile.items() }
+
     def _get_progress(self):
         """Get current optimization progress in percentage.
 
@@ -236,11 +380,38 @@ class Optimizer:
 
         return self.model.system._config['schedules'].get(key, {})
 
-    def optimize(self, config = None, **kwargs):
-        """ """
+    def optimize(self, config = None, source = None, resume = None,
+        **kwargs):
+        """Optimize model parameters.
+
+        Args:
+            config (dict or str, optional): optimization configuration
+                or name of schedule
+            source (iterable, optional): data source, which yields
+                minibatches for online training. By default minibatches
+                are sampled from the dataset of the model.
+            resume (str, optional): path of checkpoint, from which the
+                optimization is resumed. Checkpoints are written, if
+                the configuration key 'checkpoint_path' is given, every
+                'checkpoint_epochs' epochs and every
+                'checkpoint_interval' seconds.
+
+        The optimization is controlled by the control channel, given by
+        the configuration key 'control', which is polled every
+        'control_epochs' epochs and every 'control_interval' seconds.
+        Supported channels are 'keyboard', 'signal', 'file' and
+        'socket', where 'file' and 'socket' require the configuration
+        key 'control_path'. By default the keyboard is used within
+        interactive consoles and signals are used otherwise.
+
+        """
 
         if not self._set_config(config, **kwargs): return None
         if not self._set_buffer_reset(): return None
+        if source is not None and not self._set_source(source):
+            return None
+        if resume is not None and not self._set_checkpoint(resume):
+            return None
 
         # get name of optimization algorithm
         name = self._config.get('algorithm', None)
@@ -256,22 +427,38 @@ class Optimizer:
                 unsupported optimization algorithm '%s'."""
                 % (self.model.name, name)) or None
 
+        # algorithms, which support sparse input data, are trained
+        # with sparse tables
+        self._buffer['training_sparse'] = algorithm.get('sparse', False)
+
         # start optimization
+        control = profile = memory = None
         if algorithm.get('type', None) == 'algorithm':
             nemoa.log('note', "optimize '%s' (%s) using %s."
                 % (self.model.name, self.model.system.type, name))
 
-            # start key events
-            if not self._buffer['key_events_started']:
-                nemoa.log('note', "press 'h' for help or 'q' to quit.")
-                self._buffer['key_events_started'] = True
-                nemoa.set('shell', 'buffmode', 'key')
+            # start control channel
+            control = self._set_control()
+
+            # (optional) start profiling
+            if self._config.get('profile_enable', False):
+                profile = self._set_profile(True)
+
+            # (optional) start tracking of peak memory
+            if self._config.get('tracker_memory_enable', False):
+                memory = self._set_memory_peak(True)
 
         # 2Do retval, try / except etc.
         transformation = algorithm.get('reference', None)
         if not transformation: return None
 
-        retval = transformation()
+        try: retval = transformation()
+        finally:
+            if control: control.stop()
+            if profile: self._set_profile(False)
+            if memory: self._set_memory_peak(False)
+        if self._buffer['checkpoint_writer']:
+            self._buffer['checkpoint_writer'].join()
         retval &= self.model.network.initialize(self.model.system)
 
         return retval
@@ -281,7 +468,14 @@ class Optimizer:
 
         if key == 'model': return self._set_model(*args, **kwargs)
         if key == 'config': return self._set_config(*args, **kwargs)
+        if key == 'control': return self._set_control(*args, **kwargs)
+        if key == 'profile': return self._set_profile(*args, **kwargs)
+        if key == 'memory_peak':
+            return self._set_memory_peak(*args, **kwargs)
         if key == 'buffer': return self._set_buffer(*args, **kwargs)
+        if key == 'source': return self._set_source(*args, **kwargs)
+        if key == 'checkpoint':
+            return self._set_checkpoint(*args, **kwargs)
 
         return nemoa.log('warning', "unknown key '%s'" % key)
 
@@ -324,6 +518,238 @@ class Optimizer:
 
         return True
 
+    def _set_source(self, source = None, normalize = None):
+        """Set data source for online training.
+
+        Args:
+            source (iterable or None, optional): iterable or generator,
+                which yields minibatches, for example given by
+                nemoa.common.csvfile.follow(). Minibatches are numpy
+                record arrays with the columns of the dataset, numpy
+                arrays with the columns in the order of the dataset
+                columns or tuples of arrays, which already contain the
+                data of the input and output layers. Default value None
+                samples minibatches from the dataset.
+            normalize (str or None, optional): normalization of
+                minibatches by running statistics: 'gauss', 'bernoulli'
+                or 'none'. By default the normalization is given by the
+                distribution of the input layer of the system.
+
+        Returns:
+            Bool which is True if and only if no error occured.
+
+        """
+
+        if source is None:
+            self._buffer['source'] = None
+            self._buffer['source_stats'] = None
+            return True
+
+        try: source = iter(source)
+        except TypeError:
+            return nemoa.log('error', """could not set data source:
+                data source is not iterable.""")
+
+        if normalize is None:
+            system = self.model.system
+            layer = system.get('layer', system.get('layers')[0])
+            normalize = {'gauss': 'gauss', 'sigmoid': 'bernoulli'}.get(
+                layer['class'], 'none')
+
+        if normalize == 'gauss': stats = nemoa.common.stream.Moments()
+        elif normalize == 'bernoulli':
+            stats = nemoa.common.stream.RunningQuantiles(0.5)
+        elif normalize == 'none': stats = None
+        else:
+            return nemoa.log('error', """could not set data source:
+                unknown normalization '%s'.""" % normalize)
+
+        self._buffer['source'] = source
+        self._buffer['source_stats'] = stats
+
+        return True
+
+    def _set_control(self, channel = None, path = None):
+        """Start control channel of optimization.
+
+        Args:
+            channel (str, optional): type of control channel. By default
+                the configuration key 'control' is used.
+            path (str, optional): path of control file or socket. By
+                default the configuration key 'control_path' is used.
+
+        Returns:
+            Instance of control channel or None if no channel is used.
+
+        """
+
+        import nemoa.session.commons.control
+
+        if channel is None: channel = self._config.get('control', 'auto')
+        if path is None: path = self._config.get('control_path', None)
+
+        control = nemoa.session.commons.control.new(channel, path)
+        self._buffer['control'] = control
+        self._buffer['control_time'] = time.time()
+
+        if isinstance(control, nemoa.session.commons.control.Keyboard):
+            nemoa.log('note', "press 'h' for help or 'q' to quit.")
+        elif isinstance(control, nemoa.session.commons.control.File):
+            nemoa.log('note', "write 'h' for help or 'q' to quit to "
+                "'%s'." % path)
+        elif isinstance(control, nemoa.session.commons.control.Socket):
+            nemoa.log('note', "send 'h' for help or 'q' to quit to "
+                "'%s'." % path)
+
+        return control
+
+    def _set_memory_peak(self, enable = True):
+        """Start or stop tracking of peak memory.
+
+        The memory, which is allocated by python and numpy during the
+        optimization, is traced by tracemalloc. When tracking is
+        stopped, the peak of the traced memory above the memory at the
+        start of the optimization ('peak') and the maximum resident
+        set size of the process ('maxrss') are stored in bytes and
+        logged. Memory of worker processes is not tracked.
+
+        Args:
+            enable (bool, optional): start tracking if True, else stop
+
+        """
+
+        import tracemalloc
+
+        if enable:
+            started = not tracemalloc.is_tracing()
+            if started: tracemalloc.start()
+            elif hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            self._buffer['memory_peak'] = { 'started': started,
+                'baseline': tracemalloc.get_traced_memory()[0] }
+            return True
+
+        state = self._buffer.get('memory_peak', None)
+        if not state or not 'baseline' in state: return True
+        if not tracemalloc.is_tracing(): return True
+
+        peak = tracemalloc.get_traced_memory()[1] - state['baseline']
+        if state['started']: tracemalloc.stop()
+
+        try:
+            import resource
+            import sys
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            if sys.platform != 'darwin': maxrss *= 1024
+        except ImportError: maxrss = None
+
+        peak = max(peak, 0)
+        self._buffer['memory_peak'] = { 'peak': peak, 'maxrss': maxrss }
+
+        msg = 'peak memory of optimization: %.1f MB' % (peak / 1048576.)
+        if maxrss:
+            msg += ' (max resident set size %.1f MB)' % (maxrss / 1048576.)
+        nemoa.log('note', msg)
+
+        return True
+
+    def _set_profile(self, enable = True):
+        """Start or stop profiling of optimization phases.
+
+        The methods, which implement the phases of the optimization,
+        are shadowed by timing wrappers within the instance, such that
+        the training loops are not slowed down, if profiling is
+        disabled. Nested calls within the same phase are only counted
+        once. When profiling is stopped, the wrappers are removed and
+        the profile is logged.
+
+        Args:
+            enable (bool, optional): start profiling if True, else stop
+
+        """
+
+        if enable:
+            profile = { 'total': [0., 1, time.perf_counter()] }
+            for phase, names in self._profile:
+                stats = profile.setdefault(phase, [0., 0, 0])
+                for name in names:
+                    method = getattr(self, name, None)
+                    if method is None: continue
+                    setattr(self, name,
+                        self._get_profile_wrapper(method, stats))
+            self._buffer['profile'] = profile
+            return True
+
+        for phase, names in self._profile:
+            for name in names: self.__dict__.pop(name, None)
+
+        profile = self._buffer.get('profile', None)
+        if not profile: return True
+        total = profile['total']
+        total[0] = time.perf_counter() - total[2]
+        for phase in list(profile.keys()):
+            if not profile[phase][1]: del profile[phase]
+
+        nemoa.log('note', 'profile of optimization:')
+        for phase, stats in sorted(profile.items(),
+            key = lambda item: -item[1][0]):
+            nemoa.log('note', '%s: %.3fs (%.1f%%) in %i calls' % (
+                phase, stats[0], 100. * stats[0] / max(total[0], 1e-9),
+                stats[1]))
+
+        return True
+
+    @staticmethod
+    def _get_profile_wrapper(method, stats):
+        """Get timing wrapper of method.
+
+        Args:
+            method: bound method, which is wrapped
+            stats (list): cumulative time, number of calls and current
+                call depth of the phase
+
+        """
+
+        def wrapper(*args, **kwargs):
+            if stats[2]: return method(*args, **kwargs)
+            stats[2] = 1
+            start = time.perf_counter()
+            try: return method(*args, **kwargs)
+            finally:
+                stats[0] += time.perf_counter() - start
+                stats[1] += 1
+                stats[2] = 0
+
+        return wrapper
+
+    def _set_checkpoint(self, path):
+        """Resume optimization state from checkpoint.
+
+        Args:
+            path (str): path of checkpoint, as written by the
+                optimization with configuration key 'checkpoint_path'
+
+        Returns:
+            Bool which is True if and only if no error occured.
+
+        """
+
+        checkpoint = nemoa.common.npydir.load(path, mmap_mode = None)
+        if not isinstance(checkpoint, dict) \
+            or not 'system' in checkpoint \
+            or not 'optimizer' in checkpoint:
+            return nemoa.log('error', """could not resume optimization:
+                '%s' is not a valid checkpoint.""" % path)
+
+        if not self.model.system.set('copy', **checkpoint['system']):
+            return False
+        self._buffer.update(checkpoint['optimizer'])
+        self._config.update(checkpoint.get('config', {}))
+        nemoa.log('resume optimization at epoch %i.'
+            % self._buffer['epoch'])
+
+        return True
+
     def _set_buffer(self, key, value = None):
 
         if key == 'reset': return self._set_buffer_reset()
@@ -342,18 +768,25 @@ class Optimizer:
             'epoch': 0,
             'evaluation_data': None,
             'training_data': None,
+            'training_sparse': False,
+            'source': None,
+            'source_stats': None,
             'optimum': {},
             'continue': True,
             'obj_values': None,
             'obj_opt_value': None,
-            'key_events': True,
-            'key_events_started': False,
+            'control': None,
+            'control_time': now,
             'eval_prev_time': now,
             'eval_values': None,
             'estim_started': False,
             'estim_start_time': now,
             'store': {},
-            'algorithms': {} }
+            'checkpoint_time': now,
+            'checkpoint_writer': None,
+            'bprop_deltas': {},
+            'profile': None,
+            'memory_peak': None }
 
         return True
 
@@ -388,40 +821,113 @@ class Optimizer:
         """Update epoch and check termination criterions."""
 
         self._buffer['epoch'] += 1
-        if self._buffer['epoch'] == self._config['updates']:
+        if self._buffer['epoch'] >= self._config['updates']:
             self._buffer['continue'] = False
 
-        if self._buffer['key_events']: self._update_keypress()
+        if self._buffer['control']: self._update_control()
         if self._config.get('tracker_obj_tracking_enable', False):
             self._update_objective_function()
         if self._config.get('tracker_eval_enable', False):
             self._update_evaluation()
-
-        if not self._buffer['continue']:
-            nemoa.set('shell', 'buffmode', 'line')
+        if self._config.get('checkpoint_path', None):
+            self._update_checkpoint()
 
         return self._buffer['continue']
 
-    def _update_keypress(self):
-        """Check Keyboard."""
-
-        char = nemoa.get('shell', 'inkey')
-        if not char: return True
-
-        if char == 'e':
-            pass
-        elif char == 'h':
-            nemoa.log('note', "Keyboard Shortcuts")
-            nemoa.log('note', "'e' -- calculate evaluation function")
-            nemoa.log('note', "'h' -- show this")
-            nemoa.log('note', "'q' -- quit optimization")
-            nemoa.log('note', "'t' -- estimate finishing time")
-        elif char == 'q':
-            nemoa.log('note', 'aborting optimization')
-            self._buffer['continue'] = False
-        elif char == 't':
-            ftime = self._get_estimatetime()
-            nemoa.log('note', 'estimated finishing time %s' % ftime)
+    def _update_checkpoint(self):
+        """Write checkpoint of optimization state.
+
+        Checkpoints contain the system parameters, the state of the
+        optimizer and the adapted update rate, but no data. They are
+        written every 'checkpoint_epochs' epochs, every
+        'checkpoint_interval' seconds and after the last epoch. The
+        training loop only takes a snapshot of the state, which is
+        written to a numpy directory archive by a background thread. If
+        the thread is still busy, the pending snapshot is replaced by
+        the newer one.
+
+        """
+
+        epoch = self._buffer['epoch']
+        epochs = self._config.get('checkpoint_epochs', 0)
+        interval = self._config.get('checkpoint_interval', 0.)
+        now = time.time()
+
+        if self._buffer['continue'] \
+            and not (epochs and epoch % epochs == 0) \
+            and not (interval \
+            and now - self._buffer['checkpoint_time'] >= interval):
+            return True
+
+        import copy
+        import nemoa.common.threads
+
+        # the update rate is adapted by rate adaption algorithms, like
+        # variance maximizing rate adaption, during the optimization
+        snapshot = {
+            'system': { 'params': self.model.system.get('copy',
+                'params') },
+            'optimizer': copy.deepcopy({ key: self._buffer[key] for key
+                in ['epoch', 'store', 'optimum', 'obj_values',
+                'obj_opt_value'] }),
+            'config': { key: self._config[key] for key
+                in ['update_rate'] if key in self._config } }
+
+        writer = self._buffer['checkpoint_writer']
+        if not writer:
+            writer = nemoa.common.threads.Latest(
+                nemoa.common.npydir.dump)
+            self._buffer['checkpoint_writer'] = writer
+        writer.submit(snapshot, self._config['checkpoint_path'])
+        self._buffer['checkpoint_time'] = now
+
+        return True
+
+    def _update_control(self):
+        """Process commands of control channel.
+
+        The control channel is polled every 'control_epochs' epochs and
+        every 'control_interval' seconds, such that the training loop
+        is not slowed down by frequent polling.
+
+        """
+
+        epoch = self._buffer['epoch']
+        epochs = self._config.get('control_epochs', 0)
+        interval = self._config.get('control_interval', .5)
+
+        if epochs or interval:
+            if not (epochs and epoch % epochs == 0):
+                now = time.time()
+                if not interval \
+                    or now - self._buffer['control_time'] < interval:
+                    return True
+                self._buffer['control_time'] = now
+
+        control = self._buffer['control']
+        for char in control.poll():
+            if char == 'e':
+                func = self._get_evaluation_algorithm()
+                value = self._get_evaluation_value()
+                control.notify('%s = %s' % (
+                    func['name'], func['formater'](value)))
+            elif char == 'h':
+                control.notify("Control Commands")
+                control.notify("'e' -- calculate evaluation function")
+                control.notify("'h' -- show this")
+                control.notify("'q' -- quit optimization")
+                control.notify("'s' -- show status")
+                control.notify("'t' -- estimate finishing time")
+            elif char == 'q':
+                control.notify('aborting optimization')
+                self._buffer['continue'] = False
+            elif char == 's':
+                control.notify('finished %.1f%%: epoch %i of %i' % (
+                    self._get_progress() * 100., epoch,
+                    self._config['updates']))
+            elif char == 't':
+                ftime = self._get_estimatetime()
+                control.notify('estimated finishing time %s' % ftime)
 
         return True
 
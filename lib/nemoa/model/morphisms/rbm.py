@@ -67,6 +67,8 @@ class RBM(nemoa.model.morphisms.ann.ANN):
         'tracker_eval_enable': True,
         'tracker_eval_function': 'accuracy',
         'tracker_eval_time_interval': 10.,
+        'parallel_workers': 1,
+        'parallel_mode': 'sync',
         'ignore_units': [] }
 
     @nemoa.common.decorators.algorithm(
@@ -135,23 +137,267 @@ class RBM(nemoa.model.morphisms.ann.ANN):
         # init rasa
         self.write('sa', init_rate = config['update_rate'])
 
+        # (optional) data parallel optimization by multiple processes
+        workers = self._cdiv_parallel_workers()
+        if workers > 1: return self._cdiv_parallel(workers)
+
         while self.update():
             # get training data (sample from stratified minibatches)
-            data = self._get_data_training()[0]
+            data = self._get_data_training()
+            if not data: break
             # update parameters
-            self._cdiv_update(data)
+            self._cdiv_update(data[0])
+
+        return True
+
+    def _cdiv_parallel_workers(self):
+        """Get number of worker processes for contrastive divergency.
+
+        Returns:
+            Integer given by the configuration key 'parallel_workers'
+            or the number of cpu's if the key is None or zero. The
+            value is 1, if multiple processes are not supported.
+
+        """
+
+        import os
+
+        workers = self._config.get('parallel_workers', 1)
+        if not workers: workers = os.cpu_count() or 1
+        if workers <= 1: return 1
+
+        if not hasattr(os, 'fork'):
+            nemoa.log('warning', """parallel optimization requires
+                forked processes, which are not supported by the
+                operating system: using single process.""")
+            return 1
+        if self._buffer.get('source', None) is not None:
+            nemoa.log('warning', """parallel optimization does not
+                support data sources: using single process.""")
+            return 1
+
+        return int(workers)
+
+    def _cdiv_parallel(self, workers):
+        """Data parallel contrastive divergency by multiple processes.
+
+        The system parameters are moved to shared memory and worker
+        processes, which are forked from the current process, calculate
+        the parameter updates for independently sampled minibatches.
+        In 'parallel_mode' 'sync' the updates of all workers are
+        averaged and applied by the current process in each epoch,
+        analog to a single minibatch of accumulated size. In
+        'parallel_mode' 'hogwild' the workers apply their updates to
+        the shared parameters without locking, whereas the current
+        process only counts the epochs and tracks the objective
+        function, evaluation and checkpoints.
+
+        Args:
+            workers (int): number of worker processes
+
+        """
+
+        import multiprocessing
+        import os
+        import threading
+        import traceback
+
+        config = self._config
+        mode = config.get('parallel_mode', 'sync')
+        if not mode in ['sync', 'hogwild']:
+            return nemoa.log('error', """could not optimize model:
+                unknown parallel mode '%s'.""" % mode)
+
+        nemoa.log('using %i worker processes (%s).' % (workers, mode))
+
+        ctx = multiprocessing.get_context('fork')
+        params = self._cdiv_parallel_share()
+        state = { 'mode': mode,
+            'stop': ctx.RawValue('i', 0),
+            'error': ctx.RawValue('i', 0),
+            'epoch': ctx.RawValue('l', 0),
+            'rate': ctx.RawValue('d', config['update_rate']) }
+        if mode == 'sync':
+            layout, size = self._cdiv_parallel_layout()
+            dtype = self.model.system._get_dtype()
+            state['barrier'] = ctx.Barrier(workers + 1)
+            state['layout'] = layout
+            state['slots'] = nemoa.common.ndarray.shared((workers, size),
+                dtype)
+        else:
+            state['count'] = ctx.Value('l', 0)
+            state['done'] = ctx.Semaphore(0)
+            state['credit'] = ctx.Semaphore(2 * workers)
+
+        # fork worker processes, which share the system parameters
+        # (multiprocessing.Process is not used, since it closes the
+        # standard input, which is read by the key event thread)
+        pids = []
+        for wid in range(workers):
+            pid = os.fork()
+            if pid:
+                pids.append(pid)
+                continue
+            retval = 0
+            try: self._cdiv_parallel_worker(wid, state)
+            except BaseException:
+                traceback.print_exc()
+                retval = 1
+            finally: os._exit(retval)
+
+        try:
+            while self.update():
+                self._cdiv_update_rate()
+                state['epoch'].value = self._get_epoch()
+                state['rate'].value = config['update_rate']
+                if mode == 'sync':
+                    state['barrier'].wait()
+                    state['barrier'].wait()
+                    self._cdiv_update_params(*self._cdiv_parallel_read(
+                        state['slots'].mean(axis = 0), layout))
+                else:
+                    state['done'].acquire()
+                    if state['error'].value: break
+                    state['credit'].release()
+        except threading.BrokenBarrierError: pass
+        finally:
+            state['stop'].value = 1
+            if mode == 'sync':
+                if not state['barrier'].broken:
+                    state['barrier'].wait()
+            else:
+                for pid in pids: state['credit'].release()
+            for pid in pids: os.waitpid(pid, 0)
+            for d, key, array in params:
+                if d[key] is array: d[key] = numpy.array(array)
+            self.model.system._set_params_storage()
+
+        if state['error'].value:
+            return nemoa.log('error', """could not optimize model:
+                worker process failed.""")
 
         return True
 
+    def _cdiv_parallel_worker(self, wid, state):
+        """Calculate parameter updates within worker process."""
+
+        import os
+
+        numpy.random.seed((os.getpid() * 7919 + wid) % 2 ** 32)
+        self._buffer['training_data'] = None
+        config = self._config
+        sync = state['mode'] == 'sync'
+
+        try:
+            while True:
+                if sync:
+                    state['barrier'].wait()
+                    if state['stop'].value: return
+                    epoch = state['epoch'].value
+                else:
+                    state['credit'].acquire()
+                    if state['stop'].value: return
+                    with state['count'].get_lock():
+                        epoch = state['count'].value
+                        state['count'].value += 1
+
+                self._buffer['epoch'] = epoch
+                config['update_rate'] = state['rate'].value
+                data = self._get_data_training()
+                deltas = self._cdiv_deltas(data[0])
+
+                if sync:
+                    self._cdiv_parallel_write(state['slots'][wid],
+                        state['layout'], deltas)
+                    state['barrier'].wait()
+                else:
+                    self._cdiv_update_params(*deltas)
+                    state['done'].release()
+        except BaseException:
+            state['error'].value = 1
+            if sync: state['barrier'].abort()
+            else: state['done'].release()
+            raise
+
+    def _cdiv_parallel_share(self):
+        """Move system parameters to shared memory.
+
+        Returns:
+            List of tuples (dict, key, array), which contain the
+            parameter dictionaries and the shared arrays.
+
+        """
+
+        system = self.model.system
+        shared = []
+        for d in system._params['units'] \
+            + list(system._params['links'].values()):
+            for key in ['bias', 'lvar', 'W', 'A']:
+                if not isinstance(d.get(key), numpy.ndarray): continue
+                array = nemoa.common.ndarray.shared(d[key].shape,
+                    d[key].dtype)
+                array[...] = d[key]
+                d[key] = array
+                shared.append((d, key, array))
+
+        return shared
+
+    def _cdiv_parallel_layout(self):
+        """Get positions of parameter updates within flat vectors.
+
+        Returns:
+            Tuple (layout, size), where layout is a list of tuples
+            (group, key, slice, shape) and the groups 0, 1 and 2 refer
+            to the visible units, hidden units and links.
+
+        """
+
+        system = self.model.system
+        groups = [system._units['visible'].params,
+            system._units['hidden'].params,
+            system._params['links'][(0, 1)]]
+
+        layout = []
+        pos = 0
+        for group, d in enumerate(groups):
+            for key in ['bias', 'lvar', 'W']:
+                if not isinstance(d.get(key), numpy.ndarray): continue
+                size = d[key].size
+                layout.append((group, key, slice(pos, pos + size),
+                    d[key].shape))
+                pos += size
+
+        return layout, pos
+
+    def _cdiv_parallel_write(self, slot, layout, deltas):
+        """Write parameter updates to flat vector."""
+
+        for group, key, pos, shape in layout:
+            if key in deltas[group]: slot[pos] = deltas[group][key].ravel()
+            else: slot[pos] = 0.
+
+        return True
+
+    def _cdiv_parallel_read(self, vector, layout):
+        """Read parameter updates from flat vector."""
+
+        deltas = ({}, {}, {})
+        for group, key, pos, shape in layout:
+            deltas[group][key] = vector[pos].reshape(shape)
+
+        return deltas
+
     def _cdiv_update(self, data):
         """Update system parameters."""
 
-        system = self.model.system
-        config = self._config
+        self._cdiv_update_rate()
+
+        return self._cdiv_update_params(*self._cdiv_deltas(data))
 
-        updatev = not 'visible' in config['ignore_units']
-        updateh = not 'hidden' in config['ignore_units']
-        updatel = not 'links' in config['ignore_units']
+    def _cdiv_update_rate(self):
+        """Update rate of current epoch."""
+
+        config = self._config
 
         # (optional) variance maximizing rate adaption
         if config['acc_vmra_enable']:
@@ -160,16 +406,38 @@ class RBM(nemoa.model.morphisms.ann.ANN):
                 and epoch > config['acc_vmra_init_wait']:
                 self._cdiv_update_rate_vmra()
 
-        # get updates of system parameters
+        return True
+
+    def _cdiv_deltas(self, data):
+        """Get updates of system parameters for minibatch.
+
+        Returns:
+            Tuple of dictionaries (deltav, deltah, deltal) containing
+            the updates of the visible units, hidden units and links.
+            The dictionaries of ignored units are empty.
+
+        """
+
+        config = self._config
+
         sampling = self._cdiv_sampling(data)
-        if updatev: deltav = self._cdiv_delta_visible(sampling)
-        if updateh: deltah = self._cdiv_delta_hidden(sampling)
-        if updatel: deltal = self._cdiv_delta_links(sampling)
+        deltav = self._cdiv_delta_visible(sampling) \
+            if not 'visible' in config['ignore_units'] else {}
+        deltah = self._cdiv_delta_hidden(sampling) \
+            if not 'hidden' in config['ignore_units'] else {}
+        deltal = self._cdiv_delta_links(sampling) \
+            if not 'links' in config['ignore_units'] else {}
+
+        return deltav, deltah, deltal
+
+    def _cdiv_update_params(self, deltav, deltah, deltal):
+        """Apply updates to system parameters."""
+
+        system = self.model.system
 
-        # update system parameters
-        if updatev: system._units['visible'].update(deltav)
-        if updateh: system._units['hidden'].update(deltah)
-        if updatel: self._cdiv_update_links(**deltal)
+        if deltav: system._units['visible'].update(deltav)
+        if deltah: system._units['hidden'].update(deltah)
+        if deltal: self._cdiv_update_links(**deltal)
 
         return True
 
@@ -492,7 +760,7 @@ class RBM(nemoa.model.morphisms.ann.ANN):
         links = system._params['links'][(0, 1)]
 
         if 'W' in updates: links['W'] += updates['W']
-        if 'A' in updates: links['A'] = updates['A']
+        if 'A' in updates: links['A'][...] = updates['A']
 
         return True
 
@@ -554,6 +822,8 @@ class GRBM(RBM):
         'tracker_eval_enable': True,
         'tracker_eval_function': 'accuracy',
         'tracker_eval_time_interval': 10.,
+        'parallel_workers': 1,
+        'parallel_mode': 'sync',
         'ignore_units': [] }
 
     def _cdiv_delta_visible_cd(self, vdata, hdata, vmodel,
@@ -4,10 +4,10 @@ __author__  = 'Patrick Michl'
 __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
-import nemoa.network.builder
-import nemoa.network.classes
-import nemoa.network.exports
-import nemoa.network.imports
+import nemoa.common.module
+
+__getattr__, __dir__ = nemoa.common.module.lazy(__name__, [
+    'builder', 'classes', 'exports', 'imports' ])
 
 def build(*args, **kwargs):
     """Create network dictionary from building script."""
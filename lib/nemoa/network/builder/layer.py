@@ -5,7 +5,6 @@ __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
 import nemoa
-import networkx
 
 def types():
     """Get supported layer network types for network building."""
@@ -61,6 +61,7 @@ class Network(nemoa.common.classes.Metadata):
     _default = { 'name': None }
     _attr    = { 'nodes': 'r', 'edges': 'r', 'layers': 'r' }
 
+    @nemoa.common.trace.traced('network.configure')
     def configure(self, dataset = None):
         """Configure network to dataset."""
 
@@ -326,6 +327,7 @@ class Network(nemoa.common.classes.Metadata):
         if key == 'edges': return self._get_edges(*args, **kwargs)
         if key == 'layer': return self._get_layer(*args, **kwargs)
         if key == 'layers': return self._get_layers(*args, **kwargs)
+        if key == 'memory': return self._get_memory(*args, **kwargs)
 
         # direct access
         if key == 'copy': return self._get_copy(*args, **kwargs)
@@ -531,6 +533,30 @@ class Network(nemoa.common.classes.Metadata):
 
         return layers
 
+    def _get_memory(self, memo = None):
+        """Get memory, which is held by the network.
+
+        Args:
+            memo (set, optional): ids of objects, which have already
+                been counted, e.g. by other components of a model
+
+        Returns:
+            Dictionary with the number of bytes held by the graph
+            ('graph'), the configuration ('config') and the total
+            number of bytes ('total').
+
+        """
+
+        if memo is None: memo = set()
+
+        graph = vars(self._graph) if self._graph is not None else None
+        memory = {
+            'graph': nemoa.common.ndarray.nbytes(graph, memo),
+            'config': nemoa.common.ndarray.nbytes(self._config, memo) }
+        memory['total'] = sum(memory.values())
+
+        return memory
+
     def _get_copy(self, key = None, *args, **kwargs):
         """Get network copy as dictionary."""
 
@@ -649,6 +675,7 @@ class Network(nemoa.common.classes.Metadata):
 
         return True
 
+    @nemoa.common.trace.traced('network.evaluate')
     def evaluate(self, name = None, *args, **kwargs):
         """Evaluate network."""
 
@@ -659,6 +686,7 @@ class Network(nemoa.common.classes.Metadata):
 
         return algorithms[name](self._graph, *args, **kwargs)
 
+    @nemoa.common.trace.traced('network.initialize')
     def initialize(self, system = None):
 
         if not system: return False
@@ -35,6 +35,7 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('network.exports.save')
 def save(network, path = None, filetype = None, workspace = None,
     base = 'user', **kwargs):
     """Export network to file.
@@ -97,5 +98,6 @@ def save(network, path = None, filetype = None, workspace = None,
 
     return False
 
+@nemoa.common.trace.traced('network.exports.show')
 def show(network, *args, **kwargs):
     return nemoa.network.exports.image.show(network, *args, **kwargs)
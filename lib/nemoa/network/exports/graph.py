@@ -5,7 +5,6 @@ __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
 import nemoa
-import networkx
 import os
 
 def filetypes():
@@ -82,6 +81,8 @@ class Gml:
 
     def save(self, graph, path):
 
+        import networkx
+
         # encode graph parameter dictionaries
         graph = _graph_encode(graph, coding = self.settings['coding'])
 
@@ -101,6 +102,8 @@ class Graphml:
 
     def save(self, graph, path):
 
+        import networkx
+
         # encode graph parameter dictionaries
         graph = _graph_encode(graph, coding = self.settings['coding'])
 
@@ -120,6 +123,8 @@ class Dot:
 
     def save(self, graph, path):
 
+        import networkx
+
         # encode graph parameter dictionaries
         graph = _graph_encode(graph, coding = self.settings['coding'])
 
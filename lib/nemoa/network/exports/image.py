@@ -6,7 +6,6 @@ __license__ = 'GPLv3'
 
 import nemoa
 import numpy
-import networkx
 import importlib
 
 def filetypes():
@@ -35,6 +35,7 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('network.imports.load')
 def load(path, filetype = None, **kwargs):
     """Import network dictionary from file or workspace."""
 
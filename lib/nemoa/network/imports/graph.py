@@ -5,7 +5,6 @@ __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
 import nemoa
-import networkx
 import os
 
 def filetypes():
@@ -67,6 +66,7 @@ def _graph_decode(graph):
     return {}
 
 def _graph_to_dict(graph):
+    import networkx
     return {
         'graph': graph.graph,
         'nodes': graph.nodes(data = True),
@@ -82,6 +82,7 @@ class Graphml:
         self.settings = nemoa.common.dict.merge(kwargs, self.default)
 
     def load(self, path):
+        import networkx
         graph = networkx.read_graphml(path)
         graph = _graph_decode(graph)
         graph_dict = _graph_to_dict(graph)
@@ -100,6 +101,7 @@ class Gml:
         self.settings = nemoa.common.dict.merge(kwargs, self.default)
 
     def load(self, path):
+        import networkx
         graph = networkx.read_gml(path, relabel = True)
         graph = _graph_decode(graph)
         graph_dict = _graph_to_dict(graph)
@@ -130,6 +130,80 @@ class TestSuite(nemoa.common.unittest.TestSuite):
             test = isinstance(scripts, list)
             self.assertTrue(test)
 
+    def test_session_import(self):
+        import os
+        import subprocess
+        import sys
+        script = ("import sys\n"
+            "import nemoa\n"
+            "%s\n"
+            "heavy = ('matplotlib', 'networkx', 'numpy', 'scipy')\n"
+            "print(','.join(m for m in sys.modules if m in heavy))\n")
+        env = dict(os.environ, PYTHONPATH = os.path.dirname(
+            os.path.dirname(nemoa.__file__)))
+        for cmd in ["pass", "nemoa.__version__",
+            "nemoa.get('workspace')"]:
+            with self.subTest(cmd = cmd):
+                out = subprocess.check_output([sys.executable, '-c',
+                    script % cmd], env = env).decode()
+                test = not out.strip()
+                self.assertTrue(test)
+
+    def test_session_log(self):
+        session = nemoa.session.instance()
+        with self.subTest(cmd = "nemoa.log('logfile', msg)"):
+            nemoa.log('logfile', 'test  message\n')
+            session._set_logging_stop()
+            with open(nemoa.path('logfile'), 'r') as fh:
+                last = fh.read().strip().split('\n')[-1]
+            session._set_workspace_logging()
+            test = last.endswith(
+                'session.__test__.test_session_log -> test message')
+            self.assertTrue(test)
+
+    def test_session_scandir(self):
+        import os
+        import shutil
+        import tempfile
+        session = nemoa.session.instance()
+        basepaths = session._config['default']['basepath']
+        basepaths['scandir'] = tempfile.mkdtemp()
+        workdir = os.path.join(basepaths['scandir'], 'scandir')
+        os.makedirs(os.path.join(workdir, 'networks'))
+        with open(os.path.join(workdir, 'workspace.ini'), 'w') as fh:
+            fh.write('[folders]\nnetworks = ./networks/\n')
+        path = os.path.join(workdir, 'networks', 'scandir.ini')
+        try:
+            session._set_workspace('scandir', base = 'scandir',
+                logging = False)
+            with self.subTest(state = 'add file'):
+                open(path, 'w').close()
+                session._set_workspace_scandir()
+                test = 'scandir' in nemoa.list('networks')
+                self.assertTrue(test)
+            with self.subTest(state = 'remove file'):
+                os.remove(path)
+                session._set_workspace_scandir()
+                test = not 'scandir' in nemoa.list('networks')
+                self.assertTrue(test)
+            with self.subTest(state = 'unchanged directory'):
+                # directories, which have been modified within the last
+                # second are scanned again, such that the modification
+                # time is set to the past
+                open(path, 'w').close()
+                mtime = os.stat(path).st_mtime - 10.
+                os.utime(os.path.dirname(path), (mtime, mtime))
+                session._set_workspace_scandir()
+                index = session._get_workspace_index()
+                session._set_workspace_scandir()
+                test = index['network']['mtime'] is not None \
+                    and 'scandir' in nemoa.list('networks')
+                self.assertTrue(test)
+        finally:
+            session._set_workspace('testsuite', base = 'site',
+                logging = False)
+            shutil.rmtree(basepaths.pop('scandir'))
+
     def test_session_path(self):
         with self.subTest(cmd = "nemoa.path('basepath')"):
             test = isinstance(nemoa.path('basepath'), str)
@@ -38,6 +38,8 @@ class Session:
                 'models': ('%basepath%', '%workspace%', 'models'),
                 'scripts': ('%basepath%', '%workspace%', 'scripts'),
                 'cache': ('%basepath%', '%workspace%', 'cache'),
+                'indexfile': ('%user_cache_dir%', 'workspaces',
+                    '%base%', '%workspace%.json'),
                 'inifile':
                     ('%basepath%', '%workspace%', 'workspace.ini'),
                 'logfile':
@@ -84,6 +86,10 @@ class Session:
                     path = self._get_path_expand(val)
                     if path: self._config['current']['path'][key] = path
 
+        # (optional) start tracing
+        trace = os.environ.get('NEMOA_TRACE', None)
+        if trace: self._set_mode(trace = True if trace == '1' else trace)
+
         # # import site resources
         # if site:
         #     for workspace in self._get_list_workspaces(base = 'site'):
@@ -460,14 +466,16 @@ class Session:
         return self._config['current'].get('workspace', None)
 
     def log(self, key = None, *args, **kwargs):
-        """Log message to file and console output."""
+        """Log message to file and console output.
 
-        if not key: return True
+        The message is only formatted if it is written to any output,
+        such that logging within loops is cheap if the message is
+        filtered by the current mode. The file log is written by a
+        background thread (see _set_workspace_logging).
 
-        import inspect
-        import logging
-        import platform
-        import traceback
+        """
+
+        if not key: return True
 
         mode = self._get_mode()
 
@@ -480,66 +488,43 @@ class Session:
 
         if not msg: return True
 
-        # define colors (platform dependent workaround)
-        systype = platform.system().lower()
-        if systype == 'windows':
-            color = {
-                'blue': '',
-                'yellow': '',
-                'red': '',
-                'green': '',
-                'default': '' }
-        else:
-            color = {
-                'blue': '\033[94m',
-                'yellow': '\033[93m',
-                'red': '\033[91m',
-                'green': '\033[92m',
-                'default': '\033[0m' }
+        # check if message is written to any output
+        if key in ['info', 'note', 'header'] and not mode == 'debug':
+            if mode == 'silent': return True
+            if mode == 'shell' and not key == 'note': return True
+        if key == 'debuginfo' and not mode == 'debug': return None
 
-        # get loggers
-        loggers = list(logging.Logger.manager.loggerDict.keys())
-        tty_log = logging.getLogger(__name__ + '.tty') \
-            if __name__ + '.tty' in loggers \
-            else logging.getLogger(__name__ + '.null')
-        file_log = logging.getLogger(__name__ + '.file') \
-            if __name__ + '.file' in loggers \
-            else logging.getLogger(__name__ + '.null')
+        loggers = self._buffer.get('loggers', None) \
+            or self._get_loggers()
+        tty_log, file_log = loggers['tty'], loggers['file']
+        color = loggers['color']
 
-        # 2do: depending on mode
         # format message
-        if isinstance(msg, str):
-            msg = msg.strip().replace('\n', ' ')
-        elif isinstance(msg, list):
-            msg = ', '.join(msg).strip().replace('\n', ' ')
-        else:
-            msg = '[could not format message]'
-        while '  ' in msg: msg = msg.replace('  ', ' ')
+        if isinstance(msg, str): msg = ' '.join(msg.split())
+        elif isinstance(msg, list): msg = ' '.join(', '.join(msg).split())
+        else: msg = '[could not format message]'
 
         # create file message
-        clr_stack  = inspect.stack()[1]
-        clr_method = clr_stack[3]
-        clr_module = inspect.getmodule(clr_stack[0]).__name__
-        clr_name   = clr_module + '.' + clr_method
-        file_msg   = clr_name + ' -> ' + msg.strip()
+        def file_msg():
+            return self._get_caller() + ' -> ' + msg
 
         # create logging records (depending on loglevels)
         if key == 'info':
-            if mode == 'debug': file_log.info(file_msg)
+            if mode == 'debug': file_log.info(file_msg())
             if mode == 'silent': return True
             if mode == 'shell': return True
             else: tty_log.info(msg)
             return None
 
         if key == 'note':
-            if mode == 'debug': file_log.info(file_msg)
+            if mode == 'debug': file_log.info(file_msg())
             if mode == 'silent': return True
             if mode == 'shell': tty_log.info(msg)
             else: tty_log.info(color['blue'] + msg + color['default'])
             return None
 
         if key == 'header':
-            if mode == 'debug': file_log.info(file_msg)
+            if mode == 'debug': file_log.info(file_msg())
             if mode == 'silent': return True
             if mode == 'shell': return True
             tty_log.info(color['green'] + msg + color['default'])
@@ -549,13 +534,14 @@ class Session:
             if not mode == 'silent':
                 tty_log.warning(color['yellow'] \
                     + msg + color['default'])
-            file_log.warning(file_msg)
+            file_log.warning(file_msg())
             return None
 
         if key == 'error':
+            import traceback
             tty_log.error(color['yellow'] + msg
                 + ' (see logfile for debug info)' + color['default'])
-            file_log.error(file_msg)
+            file_log.error(file_msg())
             for line in traceback.format_stack():
                 msg = line.strip().replace(
                     '\n', '-> ').replace('  ', ' ').strip()
@@ -565,11 +551,11 @@ class Session:
         if key == 'critical':
             tty_log.critical(color['yellow'] \
                 + msg + color['default'])
-            file_log.critical(file_msg)
+            file_log.critical(file_msg())
             return None
 
         if key == 'debuginfo':
-            if mode == 'debug': file_log.error(file_msg)
+            if mode == 'debug': file_log.error(file_msg())
             return None
 
         if key == 'console':
@@ -577,11 +563,66 @@ class Session:
             return None
 
         if key == 'logfile':
-            file_log.info(file_msg)
+            file_log.info(file_msg())
             return None
 
         return self.log('warning',
-            "unknown logging type '%s'!" % cmd) or False
+            "unknown logging type '%s'!" % key) or False
+
+    def _get_caller(self):
+        """Get name of function, which called the logging function.
+
+        The frames of the logging wrappers nemoa.log() and
+        nemoa.session.log() are skipped.
+
+        """
+
+        import sys
+
+        frame = sys._getframe(2)
+        while frame.f_back and frame.f_code.co_name == 'log' \
+            and frame.f_globals.get('__name__') in ['nemoa',
+            'nemoa.session', __name__]:
+            frame = frame.f_back
+
+        return '%s.%s' % (frame.f_globals.get('__name__'),
+            frame.f_code.co_name)
+
+    def _get_loggers(self):
+        """Get console logger, file logger and console colors."""
+
+        import logging
+        import platform
+
+        # define colors (platform dependent workaround)
+        if platform.system().lower() == 'windows':
+            color = {
+                'blue': '',
+                'yellow': '',
+                'red': '',
+                'green': '',
+                'default': '' }
+        else:
+            color = {
+                'blue': '\033[94m',
+                'yellow': '\033[93m',
+                'red': '\033[91m',
+                'green': '\033[92m',
+                'default': '\033[0m' }
+
+        # get loggers
+        loggers = logging.Logger.manager.loggerDict
+        tty_log = logging.getLogger(__name__ + '.tty') \
+            if __name__ + '.tty' in loggers \
+            else logging.getLogger(__name__ + '.null')
+        file_log = logging.getLogger(__name__ + '.file') \
+            if __name__ + '.file' in loggers \
+            else logging.getLogger(__name__ + '.null')
+
+        self._buffer['loggers'] = {
+            'tty': tty_log, 'file': file_log, 'color': color }
+
+        return self._buffer['loggers']
 
     def run(self, script = None, *args, **kwargs):
         """Run python script."""
@@ -657,23 +698,48 @@ class Session:
                 import nemoa.session.commons.console as console
                 self._buffer['inkey'] = console.Getch()
             self._buffer['inkey'].start()
+            self._config['current']['shell']['buffmode'] = mode
             return True
         if curmode == 'key' and mode == 'line':
             self._buffer['inkey'].stop()
             del self._buffer['inkey']
+            self._config['current']['shell']['buffmode'] = mode
             return True
         return False
 
-    def _set_mode(self, mode = None, *args, **kwargs):
-        """Set session mode."""
+    def _set_mode(self, mode = None, *args, trace = None, **kwargs):
+        """Set session mode.
 
-        if not mode in ['debug', 'exec', 'shell', 'silent']:
-            return None
+        Args:
+            mode (str, optional): session mode, which is 'debug',
+                'exec', 'shell' or 'silent'
+            trace (bool or str, optional): if True or a path, calls of
+                the main entry points are recorded as nested spans and
+                written to a Chrome trace file, when tracing is stopped
+                by False or the session ends. By default the trace file
+                'trace-<pid>.json' is written to the user cache
+                directory. Tracing can also be started by the
+                environment variable NEMOA_TRACE.
 
-        self._config['current']['mode'] = mode
+        """
+
+        if mode is not None:
+            if not mode in ['debug', 'exec', 'shell', 'silent']:
+                return None
+            self._config['current']['mode'] = mode
+
+        if trace is not None:
+            import nemoa.common.trace
+            if not trace: return nemoa.common.trace.stop() or True
+            if not isinstance(trace, str):
+                import os
+                trace = self._get_path_expand('%user_cache_dir%',
+                    'trace-%i.json' % os.getpid())
+            nemoa.common.trace.start(trace)
 
         return True
 
+    @nemoa.common.trace.traced('session.workspace')
     def _set_workspace(self, workspace, base = None,
         update = False, scandir = True, logging = True):
         """Set workspace."""
@@ -740,10 +806,18 @@ class Session:
         return retval
 
     def _set_workspace_logging(self):
-        """Update console and fileloggers."""
+        """Update console and fileloggers.
+
+        The records of the file logger are passed by a queue to a
+        listener thread, which writes the logfile, such that logging
+        does not wait for file operations.
+
+        """
 
         import os
         import logging
+        import logging.handlers
+        import queue
 
         # initialize null logger, remove all previous handlers
         # and set up null handler
@@ -765,7 +839,7 @@ class Session:
         logger_console.addHandler(console_handler)
 
         # initialize file logger, remove all previous handlers
-        # and set up file handler
+        # and set up file handler within queue listener
         logfile = self._config['current']['path'].get('logfile', None)
         if logfile:
             logfile = self._get_path_expand(logfile)
@@ -774,11 +848,34 @@ class Session:
             logger_file = logging.getLogger(__name__ + '.file')
             logger_file.setLevel(logging.INFO)
             for h in logger_file.handlers: logger_file.removeHandler(h)
+            self._set_logging_stop()
             file_handler = logging.FileHandler(logfile)
             file_handler.setFormatter(logging.Formatter(
                 fmt = '%(asctime)s %(levelname)s %(message)s',
                 datefmt = '%m/%d/%Y %H:%M:%S'))
-            logger_file.addHandler(file_handler)
+            records = queue.Queue(-1)
+            logger_file.addHandler(logging.handlers.QueueHandler(records))
+            listener = logging.handlers.QueueListener(records,
+                file_handler)
+            listener.start()
+            self._buffer['loglistener'] = listener
+            if not self._buffer.get('logatexit', False):
+                import atexit
+                atexit.register(self._set_logging_stop)
+                self._buffer['logatexit'] = True
+
+        # update cached loggers
+        self._get_loggers()
+
+        return True
+
+    def _set_logging_stop(self):
+        """Write pending records and close logfile."""
+
+        listener = self._buffer.pop('loglistener', None)
+        if not listener: return True
+        listener.stop()
+        for handler in listener.handlers: handler.close()
 
         return True
 
@@ -798,9 +895,18 @@ class Session:
         return retval
 
     def _set_workspace_scandir(self, *args, **kwargs):
-        """Scan workspace for files."""
+        """Scan workspace for files.
 
-        import glob
+        The registered objects of the object directories are stored in
+        a persistent index of the workspace, together with the
+        modification times of the directories. Thereby only directories
+        in which files have been added, removed or renamed since their
+        last scan are scanned again.
+
+        """
+
+        import os
+        import time
 
         # change current base and workspace (if necessary)
         cur_workspace = self._get_workspace()
@@ -816,52 +922,137 @@ class Session:
         else:
             chdir = False
 
-        # scan workspace for objects
+        # scan object directories, which changed since their last scan
+        index = self._get_workspace_index()
+        update = False
         for objtype in list(self._config['register'].keys()):
-            dirmask = self._config['current']['path'][objtype + 's']
-            filemask = self._get_path_expand(dirmask, '*.*')
-            if objtype == 'dataset':
-                filetypes = nemoa.dataset.imports.filetypes()
-            elif objtype == 'network':
-                filetypes = nemoa.network.imports.filetypes()
-            elif objtype == 'system':
-                filetypes = nemoa.system.imports.filetypes()
-            elif objtype == 'model':
-                filetypes = nemoa.model.imports.filetypes()
-            elif objtype == 'script':
-                filetypes = ['py']
-
-            # scan for files
+            dirpath = self._get_path_expand(
+                self._config['current']['path'][objtype + 's'])
+            try: mtime = os.stat(dirpath).st_mtime_ns
+            except OSError: mtime = None
+            prev = index.get(objtype, {})
+            if mtime is not None and prev.get('path') == dirpath \
+                and prev.get('mtime') == mtime: continue
+
+            # directories, which have been modified within the last
+            # second are scanned again at the next time, since changes
+            # within the resolution of the timestamps are not detected
+            if mtime is not None and time.time() - mtime * 1e-9 < 1.:
+                mtime = None
+            index[objtype] = { 'path': dirpath, 'mtime': mtime,
+                'objects': self._get_workspace_scandir(objtype, dirpath) }
+            update = True
+
+            # remove objects from register, which have been removed
             objregister = self._config['register'][objtype]
-            for filepath in glob.iglob(filemask):
-                filetype = nemoa.common.ospath.fileext(filepath)
-                if not filetype in filetypes: continue
-                basename = nemoa.common.ospath.basename(filepath)
-                filespace = self._get_workspace()
-                filebase = self._get_base()
-                fullname = '%s.%s.%s' % (filebase, filespace, basename)
-
-                if fullname in objregister: continue
-
-                # register object configuration
-                objregister[fullname] = {
-                    'base': filebase,
-                    'fullname': fullname,
-                    'name': basename,
-                    'path': filepath,
-                    'type': objtype,
-                    'workspace': filespace }
+            for fullname in prev.get('objects', {}):
+                if not fullname in index[objtype]['objects']:
+                    objregister.pop(fullname, None)
+
+        # register objects from index
+        for objtype, entry in index.items():
+            self._config['register'][objtype].update(entry['objects'])
+        if update: self._set_workspace_index(index)
 
         # change to previous workspace if necessary
         if chdir:
-            if current:
-                self._set_workspace(current.get('name'),
-                    base = current.get('base'))
+            if cur_workspace:
+                self._set_workspace(cur_workspace, base = cur_base)
             else:
                 self._set_workspace(None)
 
         return True
 
+    def _get_workspace_scandir(self, objtype, dirpath):
+        """Scan object directory of current workspace for files."""
+
+        import glob
+        import os
+
+        if objtype == 'dataset':
+            filetypes = nemoa.dataset.imports.filetypes()
+        elif objtype == 'network':
+            filetypes = nemoa.network.imports.filetypes()
+        elif objtype == 'system':
+            filetypes = nemoa.system.imports.filetypes()
+        elif objtype == 'model':
+            filetypes = nemoa.model.imports.filetypes()
+        elif objtype == 'script':
+            filetypes = ['py']
+
+        objects = {}
+        filespace = self._get_workspace()
+        filebase = self._get_base()
+        for filepath in glob.iglob(os.path.join(dirpath, '*.*')):
+            filetype = nemoa.common.ospath.fileext(filepath)
+            if not filetype in filetypes: continue
+            basename = nemoa.common.ospath.basename(filepath)
+            fullname = '%s.%s.%s' % (filebase, filespace, basename)
+            if fullname in objects: continue
+
+            # object configuration
+            objects[fullname] = {
+                'base': filebase,
+                'fullname': fullname,
+                'name': basename,
+                'path': filepath,
+                'type': objtype,
+                'workspace': filespace }
+
+        return objects
+
+    def _get_workspace_index(self):
+        """Get index of registered objects of current workspace.
+
+        The index is kept in memory and loaded from the index file of
+        the workspace at the first access.
+
+        Returns:
+            Dictionary with object types as keys and dictionaries with
+            the keys 'path', 'mtime' and 'objects' of the object
+            directories as values.
+
+        """
+
+        import json
+
+        key = (self._get_base(), self._get_workspace())
+        indices = self._buffer.setdefault('index', {})
+        if key in indices: return indices[key]
+
+        index = {}
+        path = self._get_path_expand(
+            self._config['current']['path']['indexfile'])
+        try:
+            with open(path, 'r') as fh: content = json.load(fh)
+            if content.get('version') == 1: index = content['index']
+        except (OSError, ValueError, KeyError): pass
+        index = { key: val for key, val in index.items()
+            if key in self._config['register'] }
+        indices[key] = index
+
+        return index
+
+    def _set_workspace_index(self, index):
+        """Write index of registered objects of current workspace."""
+
+        import json
+        import os
+
+        path = self._get_path_expand(
+            self._config['current']['path']['indexfile'])
+        tmpfile = '%s.%i.tmp' % (path, os.getpid())
+        try:
+            if not os.path.exists(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(tmpfile, 'w') as fh:
+                json.dump({ 'version': 1, 'index': index }, fh)
+            os.replace(tmpfile, path)
+        except OSError:
+            return False
+
+        return True
+
     def open(self, key = None, *args, **kwargs):
         """Open object in current session."""
         if not key: return None
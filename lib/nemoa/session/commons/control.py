@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+__author__  = 'Patrick Michl'
+__email__   = 'patrick.michl@gmail.com'
+__license__ = 'GPLv3'
+
+import nemoa
+
+def new(channel = 'auto', path = None):
+    """Create control channel for long running processes.
+
+    Control channels deliver single character commands, like 'q' to
+    quit or 's' to show the status, from outside of a process to the
+    process. The process polls the channel in intervals of its choice.
+
+    Args:
+        channel (str or None, optional): type of control channel:
+            'keyboard': key presses within the console
+            'signal': POSIX signals, where SIGINT sends 'q' and SIGUSR1
+                sends 's'. A second SIGINT raises KeyboardInterrupt.
+            'file': commands, which are written to the file 'path'
+            'socket': commands, which are sent to the local unix domain
+                socket 'path'
+            'auto': 'keyboard' if the standard input is a terminal,
+                else 'signal'.
+            None: no control channel
+        path (str, optional): path of control file or socket
+
+    Returns:
+        Instance of control channel or None if no channel is used or
+        the channel could not be created.
+
+    """
+
+    import sys
+
+    if channel == 'auto':
+        try: tty = sys.stdin.isatty()
+        except (AttributeError, ValueError): tty = False
+        channel = 'keyboard' if tty else 'signal'
+    if not channel: return None
+
+    classes = { 'keyboard': Keyboard, 'signal': Signal, 'file': File,
+        'socket': Socket }
+    if not channel in classes:
+        return nemoa.log('warning', """could not create control
+            channel: unknown channel type '%s'.""" % channel) or None
+    if channel in ['file', 'socket'] and not path:
+        return nemoa.log('warning', """could not create control
+            channel: channel type '%s' requires a path.""" % channel) \
+            or None
+
+    instance = classes[channel](path = path)
+    if not instance.start(): return None
+
+    return instance
+
+class Channel:
+    """Base class of control channels."""
+
+    path = None
+
+    def __init__(self, path = None):
+        self.path = path
+
+    def start(self):
+        """Start receiving commands."""
+        return True
+
+    def poll(self):
+        """Get list of received commands."""
+        return []
+
+    def notify(self, msg):
+        """Send message to the sender of commands."""
+        return nemoa.log('note', msg)
+
+    def stop(self):
+        """Stop receiving commands."""
+        return True
+
+class Keyboard(Channel):
+    """Commands from key presses within the console."""
+
+    def start(self):
+        return nemoa.set('shell', 'buffmode', 'key')
+
+    def poll(self):
+        char = nemoa.get('shell', 'inkey')
+        return [char] if char else []
+
+    def stop(self):
+        return nemoa.set('shell', 'buffmode', 'line')
+
+class Signal(Channel):
+    """Commands from POSIX signals.
+
+    Signal handlers can only be installed within the main thread, such
+    that the channel can not be started within other threads.
+
+    """
+
+    signals = { 'SIGINT': 'q', 'SIGUSR1': 's' }
+
+    def start(self):
+        import collections
+        import signal
+
+        self._commands = collections.deque()
+        self._handlers = {}
+
+        def handler(signum, frame):
+            char = self._chars[signum]
+            if char == 'q' and 'q' in self._commands:
+                raise KeyboardInterrupt()
+            self._commands.append(char)
+
+        self._chars = {}
+        for name, char in self.signals.items():
+            if not hasattr(signal, name): continue
+            signum = getattr(signal, name)
+            self._chars[signum] = char
+            try: self._handlers[signum] = signal.signal(signum, handler)
+            except ValueError:
+                self.stop()
+                return False
+
+        return True
+
+    def poll(self):
+        commands = []
+        while self._commands: commands.append(self._commands.popleft())
+        return commands
+
+    def stop(self):
+        import signal
+        for signum, prev in self._handlers.items():
+            signal.signal(signum, prev)
+        self._handlers = {}
+        return True
+
+class File(Channel):
+    """Commands from control file.
+
+    The characters of the file are read as commands, after which the
+    file is removed. The file is only read, if its modification time
+    changed since the last poll.
+
+    """
+
+    def start(self):
+        self._stat = None
+        return True
+
+    def poll(self):
+        import os
+
+        try: stat = os.stat(self.path)
+        except OSError: return []
+        stat = (stat.st_mtime_ns, stat.st_size)
+        if stat == self._stat: return []
+        self._stat = stat
+
+        try:
+            with open(self.path, 'r') as fh: content = fh.read()
+            os.remove(self.path)
+        except OSError: return []
+
+        return [char for char in content if not char.isspace()]
+
+class Socket(Channel):
+    """Commands from local unix domain socket.
+
+    Each connection sends characters as commands and receives the
+    messages, which are sent by notify() until it is closed by the
+    client. Connections are accepted by a background thread.
+
+    """
+
+    def start(self):
+        import collections
+        import nemoa.common.threads
+        import os
+        import socket
+        import threading
+
+        if not hasattr(socket, 'AF_UNIX'):
+            return nemoa.log('warning', """could not create control
+                channel: unix domain sockets are not supported.""")
+        if os.path.exists(self.path): os.remove(self.path)
+
+        self._commands = collections.deque()
+        self._clients = []
+        self._lock = threading.Lock()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(1)
+        self._server.settimeout(.2)
+        self._running = True
+        self._thread = nemoa.common.threads.thread(self._serve)
+
+        return True
+
+    def _serve(self):
+        import socket
+
+        while self._running:
+            try: conn, addr = self._server.accept()
+            except socket.timeout: continue
+            except OSError: break
+            with self._lock: self._clients.append(conn)
+            nemoa.common.threads.thread(self._receive, conn)
+
+    def _receive(self, conn):
+        while self._running:
+            try: data = conn.recv(1024)
+            except OSError: break
+            if not data: break
+            self._commands.extend(char for char
+                in data.decode('utf-8', 'ignore') if not char.isspace())
+        with self._lock:
+            if conn in self._clients: self._clients.remove(conn)
+        conn.close()
+
+    def poll(self):
+        commands = []
+        while self._commands: commands.append(self._commands.popleft())
+        return commands
+
+    def notify(self, msg):
+        with self._lock: clients = list(self._clients)
+        for conn in clients:
+            try: conn.sendall((msg + '\n').encode('utf-8'))
+            except OSError: pass
+        return nemoa.log('note', msg)
+
+    def stop(self):
+        import os
+
+        self._running = False
+        self._server.close()
+        with self._lock:
+            for conn in self._clients: conn.close()
+            self._clients = []
+        if os.path.exists(self.path): os.remove(self.path)
+
+        return True
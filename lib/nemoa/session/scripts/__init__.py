@@ -44,7 +44,9 @@ def main():
             "    -s --script       "
             "      Open workspace and execute script\n"
             "    -a --arguments    "
-            "      Arguments passed to script\n"
+            "      Arguments passed to script or benchmark\n"
+            "    -b --benchmark    "
+            "      Run benchmark and write results to JSON file\n"
             "    -t --test         "
             "      Run unittest on current installation\n"
             "    -v --version      "
@@ -86,6 +88,43 @@ def main():
 
         return nemoagui.start()
 
+    def run_benchmark(path, arguments = ''):
+        """Run benchmark suite and write results to JSON file.
+
+        Args:
+            path (str): path of JSON file
+            arguments (str, optional): space separated settings of the
+                benchmark, like 'samples=10000 updates=500'
+
+        """
+
+        import nemoa
+
+        kwargs = {}
+        for arg in arguments.split():
+            key, sep, val = arg.partition('=')
+            try: kwargs[key] = int(val)
+            except ValueError: kwargs[key] = tuple(val.split(','))
+
+        # open workspace 'testsuite', which provides the systems
+        workspace = nemoa.get('workspace')
+        mode = nemoa.get('mode')
+        nemoa.open('testsuite', base = 'site')
+        nemoa.set('mode', 'silent')
+
+        results = nemoa.benchmarks.run(**kwargs)
+        nemoa.benchmarks.save(results, path)
+
+        nemoa.set('mode', mode)
+        if nemoa.get('workspace') != workspace: nemoa.open(workspace)
+
+        for section in ['import', 'training', 'evaluation', 'io']:
+            print(('%s:' % section))
+            for name, value in sorted(results[section].items()):
+                print(('    %-20s %10.4fs' % (name, value['time'])))
+
+        return True
+
     def run_script(workspace, script, *args):
         """Run nemoa python script."""
 
@@ -143,6 +182,10 @@ def main():
         except ImportError: pass
         else: suite.addTests(
             loader.loadTestsFromModule(nemoa.model.__test__))
+        try: import nemoa.benchmarks.__test__
+        except ImportError: pass
+        else: suite.addTests(
+            loader.loadTestsFromModule(nemoa.benchmarks.__test__))
 
         # initialize runner
         runner = unittest.TextTestRunner(verbosity = 2)
@@ -158,13 +201,14 @@ def main():
 
     workspace = ''
     script = ''
+    benchmark = ''
     arguments = ''
     mode = 'script'
 
     # get arguments
     try:
-        opts, args = getopt.getopt(argv, "hgvtilw:s:a:",
-            ["workspace=", "script=", "arguments="])
+        opts, args = getopt.getopt(argv, "hgvtilw:s:a:b:",
+            ["workspace=", "script=", "arguments=", "benchmark="])
     except getopt.GetoptError:
         print_usage()
         sys.exit(2)
@@ -183,6 +227,9 @@ def main():
         elif opt in ['-w', '--workspace']: workspace = arg
         elif opt in ['-s', '--script']: script = arg
         elif opt in ['-a', '--arguments']: arguments = arg
+        elif opt in ['-b', '--benchmark']:
+            mode = 'benchmark'
+            benchmark = arg
 
     if   mode == 'showhelp': print_usage()
     elif mode == 'showversion': print_version()
@@ -190,6 +237,7 @@ def main():
     elif mode == 'shell': run_shell()
     elif mode == 'gui': run_gui()
     elif mode == 'test': run_unittest()
+    elif mode == 'benchmark': run_benchmark(benchmark, arguments)
     elif mode == 'script':
         if not workspace:
             print_usage()
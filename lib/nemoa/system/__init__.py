@@ -4,10 +4,10 @@ __author__  = 'Patrick Michl'
 __email__   = 'patrick.michl@gmail.com'
 __license__ = 'GPLv3'
 
-import nemoa.system.classes
-import nemoa.system.commons
-import nemoa.system.imports
-import nemoa.system.exports
+import nemoa.common.module
+
+__getattr__, __dir__ = nemoa.common.module.lazy(__name__, [
+    'classes', 'commons', 'imports', 'exports' ])
 
 def copy(system, *args, **kwargs):
     """Create copy of system instance."""
@@ -8,7 +8,8 @@ import nemoa
 import numpy
 import copy
 
-class System(nemoa.common.classes.Metadata):
+class System(nemoa.common.classes.Metadata,
+    metaclass = nemoa.common.classes.Registry):
     """System base class.
 
     Attributes:
@@ -57,11 +58,13 @@ class System(nemoa.common.classes.Metadata):
 
     _config  = None
     _params  = None
+    _flat    = None
     _default = {'params': {}, 'init': {}, 'optimize': {},
                 'schedules': {}}
     _attr    = {'units': 'r', 'links': 'r', 'layers': 'r',
                 'mapping': 'rw'}
 
+    @nemoa.common.trace.traced('system.configure')
     def configure(self, network = None):
         """Configure system to network."""
 
@@ -71,6 +74,7 @@ class System(nemoa.common.classes.Metadata):
 
         return self._set_params(network = network)
 
+    @nemoa.common.trace.traced('system.initialize')
     def initialize(self, dataset = None):
         """Initialize system parameters.
 
@@ -86,7 +90,8 @@ class System(nemoa.common.classes.Metadata):
                 dataset is not valid.""")
 
         return self._set_params_init_units(dataset) \
-            and self._set_params_init_links(dataset)
+            and self._set_params_init_links(dataset) \
+            and self._set_params_storage()
 
     def _check_network(self, network, *args, **kwargs):
         """Check if network is valid for system."""
@@ -118,6 +123,9 @@ class System(nemoa.common.classes.Metadata):
         if key == 'layer': return self._get_layer(*args, **kwargs)
         if key == 'layers': return self._get_layers(*args, **kwargs)
         if key == 'mapping': return self._get_mapping(*args, **kwargs)
+        if key == 'dtype': return self._get_dtype(*args, **kwargs)
+        if key == 'flat': return self._get_flat(*args, **kwargs)
+        if key == 'memory': return self._get_memory(*args, **kwargs)
 
         # direct access
         if key == 'copy': return self._get_copy(*args, **kwargs)
@@ -129,25 +137,15 @@ class System(nemoa.common.classes.Metadata):
     def _get_algorithms(self, category = None, attribute = None, tree = False):
         """Get algorithms provided by system."""
 
-        # get dictionary with all methods
-        # with prefix '_get_' and attribute 'name'
-        methods = nemoa.common.module.getmethods(self,
-            prefix = '_get_', attribute = 'name')
-
-        # filter algorithms by given category
-        if not category == None:
-            for key, val in list(methods.items()):
-                if val.get('category', None) != category:
-                    del methods[key]
-
         # create flat structure if category is given or tree is False
-        structured = {}
         if category or not tree:
-            for ukey, udata in methods.items():
-                if attribute: structured[udata['name']] = \
-                    udata[attribute]
-                else: structured[udata['name']] = udata
-            return structured
+            return nemoa.common.decorators.getalgorithms(self,
+                category = category, attribute = attribute,
+                prefix = '_get_')
+
+        # get algorithms with prefix '_get_' grouped by categories
+        grouped = nemoa.common.decorators.getalgorithms(self,
+            attribute = attribute, prefix = '_get_', grouping = True)
 
         # create tree structure if category is not given
         categories = {
@@ -155,26 +153,20 @@ class System(nemoa.common.classes.Metadata):
             ('system', 'units', 'evaluation'): 'units',
             ('system', 'links', 'evaluation'): 'links',
             ('system', 'relation', 'evaluation'): 'relation' }
-        for ukey, udata in methods.items():
-            if not udata['category'] in list(categories.keys()): continue
-            ckey = categories[udata['category']]
-            if ckey == None:
-                if attribute: structured[udata['name']] = \
-                    udata[attribute]
-                else: structured[udata['name']] = udata
-            else:
-                if not ckey in list(structured.keys()): structured[ckey] = {}
-                if attribute: structured[ckey][udata['name']] = \
-                    udata[attribute]
-                else: structured[ckey][udata['name']] = udata
+        structured = {}
+        for category, algorithms in grouped.items():
+            if not category in categories: continue
+            ckey = categories[category]
+            if ckey == None: structured.update(algorithms)
+            else: structured.setdefault(ckey, {}).update(algorithms)
 
         return structured
 
-    def _get_algorithm(self, algorithm = None, *args, **kwargs):
+    def _get_algorithm(self, algorithm = None, category = None,
+        attribute = None, **kwargs):
         """Get algorithm."""
-        algorithms = self._get_algorithms(*args, **kwargs)
-        if not algorithm in algorithms: return None
-        return algorithms[algorithm]
+        return nemoa.common.decorators.getalgorithm(self, algorithm,
+            category = category, attribute = attribute, prefix = '_get_')
 
     def _get_unit(self, unit):
         """Get unit information."""
@@ -487,9 +479,123 @@ class System(nemoa.common.classes.Metadata):
         return mapping[sid:tid + 1] if sid <= tid \
             else mapping[tid:sid + 1][::-1]
 
-    def _get_copy(self, key = None, *args, **kwargs):
-        """Get system copy as dictionary."""
+    def _get_dtype(self):
+        """Get data type of system parameters.
+
+        Returns:
+            Numpy dtype of the unit parameters and link parameters, as
+            given by the configuration key 'dtype'. Default value is
+            'float64'.
+
+        """
+
+        dtype = self._config.get('dtype') if self._config else None
+        return numpy.dtype(dtype or 'float64')
+
+    def _get_flat(self):
+        """Get flat vector of trainable system parameters.
+
+        If enabled by set('flat'), the unit parameters 'bias' and
+        'lvar' and the link weights 'W' are stored within a single
+        contiguous vector and the entries of the parameter dictionaries
+        are views into this vector. Thereby optimizers can update all
+        parameters by vectorized operations and copies of the
+        parameters only require a single copy of the vector.
+
+        Returns:
+            Numpy ndarray or None, if the parameters are not stored in
+            a flat vector or if any parameter array has been replaced
+            since the vector has been created.
+
+        """
+
+        if not self._flat: return None
+        entries = self._get_flat_entries()
+        views = self._flat['views']
+        if not len(entries) == len(views): return None
+        for (d, key), (vd, vkey, view) in zip(entries, views):
+            if not d is vd or not key == vkey or not d[key] is view:
+                return None
+
+        return self._flat['vector']
+
+    def _get_flat_entries(self):
+        """Get trainable parameter arrays of current parameters.
+
+        Returns:
+            List of tuples (params, key), where params is a unit or link
+            parameter dictionary of the current system parameters and
+            key the name of a trainable parameter array.
+
+        """
+
+        entries = []
+        for layer in self._params.get('units', []):
+            for key in ['bias', 'lvar']:
+                if isinstance(layer.get(key), numpy.ndarray):
+                    entries.append((layer, key))
+        for link in self._params.get('links', {}).values():
+            if isinstance(link.get('W'), numpy.ndarray):
+                entries.append((link, 'W'))
+
+        return entries
+
+    def _get_flat_index(self, params, key):
+        """Get position of parameter array within flat vector.
+
+        Args:
+            params (dict): unit or link parameter dictionary
+            key (str): name of parameter array, e.g. 'bias' or 'W'
+
+        Returns:
+            Slice of flat vector or None, if the parameter array is not
+            stored in the flat vector.
+
+        """
+
+        if not self._flat: return None
+        return self._flat['index'].get((id(params), key), None)
+
+    def _get_memory(self, memo = None):
+        """Get memory, which is held by the system.
 
+        Args:
+            memo (set, optional): ids of objects, which have already
+                been counted, e.g. by other components of a model
+
+        Returns:
+            Dictionary with the number of bytes held by the parameter
+            arrays ('params'), including the flat parameter vector, the
+            unit and link structures ('structure'), the configuration
+            ('config') and the total number of bytes ('total').
+
+        """
+
+        if memo is None: memo = set()
+
+        nbytes = nemoa.common.ndarray.nbytes
+        memory = {
+            'params': nbytes(self._params, memo) \
+                + nbytes(self._flat, memo),
+            'structure': nbytes(self.__dict__.get('_units'), memo) \
+                + nbytes(self.__dict__.get('_links'), memo),
+            'config': nbytes(self._config, memo) }
+        memory['total'] = sum(memory.values())
+
+        return memory
+
+    def _get_copy(self, key = None, *args, deep = True, **kwargs):
+        """Get system copy as dictionary.
+
+        Args:
+            deep (bool, optional): if False, the dictionary references
+                the configuration and parameters of the system instead
+                of copies, for example to write them to files.
+
+        """
+
+        if key == None and not deep: return {
+            'config': self._config, 'params': self._params }
         if key == None: return {
             'config': self._get_config(),
             'params': self._get_params() }
@@ -518,7 +624,15 @@ class System(nemoa.common.classes.Metadata):
 
         import copy
 
-        if key == None: return copy.deepcopy(self._params)
+        if key == None:
+
+            # copy flat vector once and reference views of the copy
+            vector = self._get_flat()
+            if vector is None: return copy.deepcopy(self._params)
+            vector = vector.copy()
+            memo = { id(view): vector[self._flat['index'][(id(d), key)]]
+                .reshape(view.shape) for d, key, view in self._flat['views'] }
+            return copy.deepcopy(self._params, memo)
 
         if isinstance(key, str) and key in list(self._params.keys()):
             if isinstance(self._params[key], dict):
@@ -665,7 +779,7 @@ class System(nemoa.common.classes.Metadata):
             for i in block: in_data[:,i] = numpy.mean(in_data[:,i])
         if len(mapping) == 2: return self._units[mapping[1]].expect(
             in_data, self._units[mapping[0]].params)
-        out_data = numpy.copy(in_data)
+        out_data = in_data
         for id in range(len(mapping) - 1):
             out_data = self._units[mapping[id + 1]].expect(
                 out_data, self._units[mapping[id]].params)
@@ -1269,6 +1383,8 @@ class System(nemoa.common.classes.Metadata):
         #if key == 'units': return self._set_units(*args, **kwargs)
         if key == 'links': return self._set_links(*args, **kwargs)
         if key == 'mapping': return self._set_mapping(*args, **kwargs)
+        if key == 'dtype': return self._set_dtype(*args, **kwargs)
+        if key == 'flat': return self._set_flat(*args, **kwargs)
 
         # import configuration and parameters
         if key == 'copy': return self._set_copy(*args, **kwargs)
@@ -1331,7 +1447,8 @@ class System(nemoa.common.classes.Metadata):
                 lnk_dict['A'][src_sid, tgt_sid] = 1.0
 
         return self._set_params_create_links() \
-            and self._set_params_init_links()
+            and self._set_params_init_links() \
+            and self._set_params_storage()
 
     def _set_mapping(self, mapping):
         """Set the layer mapping of the system."""
@@ -1340,6 +1457,47 @@ class System(nemoa.common.classes.Metadata):
         self._params['mapping'] = mapping
         return True
 
+    def _set_dtype(self, dtype):
+        """Set data type of system parameters.
+
+        Args:
+            dtype (str): numpy float data type, e.g. 'float32'
+
+        Returns:
+            Bool which is True if and only if no error occured.
+
+        """
+
+        try: dtype = numpy.dtype(dtype)
+        except TypeError: dtype = None
+        if dtype is None or not dtype.kind == 'f':
+            return nemoa.log('error', """could not set data type:
+                float data type is required.""")
+
+        if not self._config: self._set_config()
+        self._config['dtype'] = dtype.name
+
+        return self._set_params_storage()
+
+    def _set_flat(self, enable = True):
+        """Enable or disable flat vector of trainable parameters.
+
+        Args:
+            enable (bool, optional): if True, the unit and link
+                parameters are stored within a flat vector, see
+                _get_flat(). If False, each parameter array is stored
+                separately.
+
+        Returns:
+            Bool which is True if and only if no error occured.
+
+        """
+
+        if not self._config: self._set_config()
+        self._config['flat'] = bool(enable)
+
+        return self._set_params_storage()
+
     def _set_copy(self, config = None, params = None):
         """Set configuration and parameters of system.
 
@@ -1452,8 +1610,78 @@ class System(nemoa.common.classes.Metadata):
             retval &= self._set_params_init_units(dataset)
             retval &= self._set_params_init_links(dataset)
 
+        retval &= self._set_params_storage()
+
         return retval
 
+    def _set_params_storage(self):
+        """Set data type and storage of unit and link parameters.
+
+        The arrays are replaced within the parameter dictionaries, which
+        are shared with the unit instances and the link dictionaries,
+        such that subsequent inplace updates preserve the data type and
+        the views into the flat parameter vector.
+
+        """
+
+        dtype = self._get_dtype()
+        for layer in self._params.get('units', []):
+            for key in ['bias', 'lvar']:
+                if not isinstance(layer.get(key), numpy.ndarray): continue
+                if layer[key].dtype == dtype: continue
+                layer[key] = layer[key].astype(dtype)
+        for link in self._params.get('links', {}).values():
+            for key in ['W', 'A']:
+                if not isinstance(link.get(key), numpy.ndarray): continue
+                if link[key].dtype == dtype: continue
+                link[key] = link[key].astype(dtype)
+
+        # the flat vector is released, if the parameter dictionaries
+        # have been replaced, e.g. by set('copy'), since it is not
+        # shared with the current parameters anymore
+        if self._flat and self._get_flat() is None:
+            self._set_params_unflat()
+        if self._config and self._config.get('flat', False):
+            return self._set_params_flat()
+        if self._flat: self._set_params_unflat()
+
+        return True
+
+    def _set_params_unflat(self):
+        """Store trainable parameters separately from flat vector."""
+
+        vector = self._flat['vector']
+        for d, key in self._get_flat_entries():
+            if numpy.may_share_memory(d[key], vector):
+                d[key] = d[key].copy()
+        self._flat = None
+
+        return True
+
+    def _set_params_flat(self):
+        """Store trainable parameters within flat vector."""
+
+        if self._get_flat() is not None: return True
+
+        entries = self._get_flat_entries()
+        size = sum([d[key].size for d, key in entries])
+        vector = numpy.empty(size, dtype = self._get_dtype())
+        index = {}
+        views = []
+        pos = 0
+        for d, key in entries:
+            array = d[key]
+            view = vector[pos:pos + array.size].reshape(array.shape)
+            view[...] = array
+            d[key] = view
+            index[(id(d), key)] = slice(pos, pos + array.size)
+            views.append((d, key, view))
+            pos += array.size
+
+        self._flat = { 'vector': vector, 'index': index, 'views': views }
+
+        return True
+
     def _set_params_create_units(self):
 
         # create instances of unit classes
@@ -1583,6 +1811,7 @@ class System(nemoa.common.classes.Metadata):
 
         return True
 
+    @nemoa.common.trace.traced('system.evaluate')
     def evaluate(self, data, *args, **kwargs):
         """Evaluate system using data."""
 
@@ -1603,10 +1832,8 @@ class System(nemoa.common.classes.Metadata):
             return self._evaluate_relation(data, *args[1:], **kwargs)
 
         # evaluate system
-        algorithms = list(self._get_algorithms(attribute = 'name',
-            category = ('system', 'evaluation')).values())
-
-        if args[0] in algorithms:
+        if self._get_algorithm(args[0], attribute = 'name',
+            category = ('system', 'evaluation')):
             return self._evaluate_system(data, *args, **kwargs)
 
         return nemoa.log('warning',
@@ -1630,13 +1857,12 @@ class System(nemoa.common.classes.Metadata):
         if not isinstance(data, tuple): return nemoa.log('error',
             'could not evaluate system: invalid data.')
 
-        # get evaluation algorithms
-        algorithms = self._get_algorithms(
+        # get evaluation algorithm
+        algorithm = self._get_algorithm(func,
             category = ('system', 'evaluation'))
-        if not func in list(algorithms.keys()): return nemoa.log('error',
+        if not algorithm: return nemoa.log('error',
             """could not evaluate system: unknown algorithm
             '%s'.""" % (func))
-        algorithm = algorithms[func]
 
         # prepare (non keyword) arguments for evaluation function
         evalargs = []
@@ -1678,15 +1904,13 @@ class System(nemoa.common.classes.Metadata):
         if not isinstance(data, tuple): return nemoa.log('error',
             "could not evaluate system units: invalid data.")
 
-        # get evaluation algorithms
-        algorithms = self._get_algorithms(
+        # get evaluation algorithm
+        algorithm = self._get_algorithm(func,
             category = ('system', 'units', 'evaluation'))
-        if not func in list(algorithms.keys()): return nemoa.log('error',
+        if not algorithm: return nemoa.log('error',
             "could not evaluate system units: "
             "unknown algorithm name '%s'." % func)
 
-        algorithm = algorithms[func]
-
         # prepare arguments for evaluation
         evalargs = {'input': [data[0]], 'output': [data[1]],
             'none': [], 'all': [data]}[algorithm.get('args', 'none')]
@@ -1733,13 +1957,12 @@ class System(nemoa.common.classes.Metadata):
         if not isinstance(data, tuple): return nemoa.log('error',
             'could not evaluate system links: invalid data.')
 
-        # get evaluation algorithms
-        algorithms = self._get_algorithms(
+        # get evaluation algorithm
+        algorithm = self._get_algorithm(func,
             category = ('system', 'links', 'evaluation'))
-        if not func in list(algorithms.keys()): return nemoa.log('error',
+        if not algorithm: return nemoa.log('error',
             """could not evaluate system links:
             unknown algorithm name '%s'.""" % (func))
-        algorithm = algorithms[func]
 
         # prepare (non keyword) arguments for evaluation
         if algorithm['args'] == 'none': evalargs = []
@@ -1809,13 +2032,12 @@ class System(nemoa.common.classes.Metadata):
         if not isinstance(data, tuple): return nemoa.log('error',
             'could not evaluate system unit relation: invalid data.')
 
-        # get evaluation algorithms
-        algorithms = self._get_algorithms(
+        # get evaluation algorithm
+        algorithm = self._get_algorithm(func,
             category = ('system', 'relation', 'evaluation'))
-        if not func in list(algorithms.keys()): return nemoa.log('error',
+        if not algorithm: return nemoa.log('error',
             """could not evaluate system unit relation:
             unknown algorithm name '%s'.""" % (func))
-        algorithm = algorithms[func]
 
         # prepare (non keyword) arguments for evaluation
         if algorithm['args'] == 'none': eargs = []
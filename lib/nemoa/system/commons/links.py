@@ -39,4 +39,7 @@ class Links:
     @staticmethod
     def get_updates_delta(data, delta):
 
-        return { 'W': -numpy.dot(data.T, delta) / float(data.size) }
+        # data of the input layer may be sparse
+        size = float(data.shape[0] * data.shape[1])
+
+        return { 'W': -nemoa.common.sparse.tdot(data, delta) / size }
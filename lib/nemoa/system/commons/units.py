@@ -37,6 +37,27 @@ class UnitsBaseClass:
 
         return self.get_param_updates(data, model, self.weights(source))
 
+    def preactivation(self, data, source):
+        """Return weighted sums of inputs and bias of units.
+
+        The expectation values of the units are given by the activation
+        function of the pre-activations, which are also required by the
+        gradient of the activation function.
+
+        """
+
+        bias = self.params['bias']
+        weights = self.weights(source)
+        if not source['class'] == 'gauss':
+            return bias + nemoa.common.sparse.dot(data, weights)
+
+        # scale weights instead of sparse data to preserve sparsity
+        sdev = numpy.sqrt(numpy.exp(source['lvar']))
+        if nemoa.common.sparse.issparse(data):
+            return bias + data.dot(weights / sdev.T)
+
+        return bias + numpy.dot(data / sdev, weights)
+
     def get_delta(self, in_data, out_delta, source, target):
 
         return self.delta_from_bprop(in_data, out_delta,
@@ -143,7 +164,7 @@ class Sigmoid(UnitsBaseClass):
         bias = self.params['bias']
         sigmoid = nemoa.common.math.sigmoid
 
-        return sigmoid(bias + numpy.dot(data, weights))
+        return sigmoid(bias + nemoa.common.sparse.dot(data, weights))
 
     def expect_from_gauss_layer(self, data, source, weights):
         """Return expected values of a sigmoid output layer
@@ -153,6 +174,10 @@ class Sigmoid(UnitsBaseClass):
         sdev = numpy.sqrt(numpy.exp(source['lvar']))
         sigmoid = nemoa.common.math.sigmoid
 
+        # scale weights instead of sparse data to preserve sparsity
+        if nemoa.common.sparse.issparse(data):
+            return sigmoid(bias + data.dot(weights / sdev.T))
+
         return sigmoid(bias + numpy.dot(data / sdev, weights))
 
     def get_param_updates(self, data, model, weights):
@@ -186,20 +211,34 @@ class Sigmoid(UnitsBaseClass):
         return backdelta
 
     @staticmethod
-    def grad(x):
-        """Return gradiant of standard logistic function. """
+    def activation(x):
+        """Return standard logistic function of pre-activations. """
 
-        numpy.seterr(over = 'ignore')
+        return nemoa.common.math.sigmoid(x)
 
-        return ((1. / (1. + numpy.exp(-x)))
-            * (1. - 1. / (1. + numpy.exp(-x))))
+    @staticmethod
+    def grad(x, values = None):
+        """Return gradiant of standard logistic function.
+
+        Args:
+            x (ndarray): pre-activations
+            values (ndarray, optional): activations of x, which are
+                reused if given
+
+        """
+
+        if values is None:
+            numpy.seterr(over = 'ignore')
+            values = 1. / (1. + numpy.exp(-x))
+
+        return values * (1. - values)
 
     @staticmethod
     def get_values(data):
         """Return median of bernoulli distributed layer
         calculated from expected values. """
 
-        return (data > 0.5).astype(float)
+        return (data > 0.5).astype(data.dtype)
 
     @staticmethod
     def get_samples(data):
@@ -207,7 +246,7 @@ class Sigmoid(UnitsBaseClass):
         calculated from expected value. """
 
         return (data > numpy.random.rand(
-            data.shape[0], data.shape[1])).astype(float)
+            data.shape[0], data.shape[1])).astype(data.dtype)
 
     def get(self, unit):
 
@@ -296,7 +335,7 @@ class Gauss(UnitsBaseClass):
         """Return expected values of a gaussian output layer
         calculated from a sigmoid input layer. """
 
-        return self.params['bias'] + numpy.dot(data, weights)
+        return self.params['bias'] + nemoa.common.sparse.dot(data, weights)
 
     def expect_from_gauss_layer(self, data, source, weights):
         """Return expected values of a gaussian output layer
@@ -305,10 +344,20 @@ class Gauss(UnitsBaseClass):
         bias = self.params['bias']
         sdev = numpy.sqrt(numpy.exp(source['lvar']))
 
+        # scale weights instead of sparse data to preserve sparsity
+        if nemoa.common.sparse.issparse(data):
+            return bias + data.dot(weights / sdev.T)
+
         return bias + numpy.dot(data / sdev, weights)
 
     @staticmethod
-    def grad(x):
+    def activation(x):
+        """Return identity of pre-activations."""
+
+        return x
+
+    @staticmethod
+    def grad(x, values = None):
         """Return gradient of activation function."""
 
         return 1.
@@ -338,7 +387,7 @@ class Gauss(UnitsBaseClass):
         calculated from expected values. """
 
         sigma = numpy.sqrt(numpy.exp(self.params['lvar']))
-        return numpy.random.normal(data, sigma)
+        return numpy.random.normal(data, sigma).astype(data.dtype)
 
     def get(self, unit):
 
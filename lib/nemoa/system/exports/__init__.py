@@ -23,6 +23,7 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('system.exports.save')
 def save(system, path = None, filetype = None, workspace = None,
     base = 'user', **kwargs):
     """Export system to file.
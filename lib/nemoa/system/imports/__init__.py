@@ -29,6 +29,7 @@ def filetypes(filetype = None):
 
     return False
 
+@nemoa.common.trace.traced('system.imports.load')
 def load(path, filetype = None, **kwargs):
     """Import system dictionary from file or workspace."""
 
@@ -52,7 +52,9 @@ class Ini:
         system = nemoa.common.inifile.load(path, {
             'system': {
                 'name': 'str',
-                'type': 'str' },
+                'type': 'str',
+                'dtype': 'str',
+                'flat': 'bool' },
             'schedule [.0-9a-zA-Z]*': {
                 'system [.0-9a-zA-Z]*': 'dict' }})
 